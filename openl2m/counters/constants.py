@@ -25,3 +25,4 @@ COUNTER_VIEWS = "views"
 COUNTER_DETAILVIEWS = "detailviews"
 COUNTER_HWINFO = "hwinfo"
 COUNTER_VLAN_MANAGE = "vlan_management"
+COUNTER_PERMISSION_CHANGES = "permission_changes"
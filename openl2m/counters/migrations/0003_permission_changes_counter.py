@@ -0,0 +1,27 @@
+# Generated by hand!
+
+from django.db import migrations
+
+from counters.models import Counter
+from counters.constants import COUNTER_PERMISSION_CHANGES
+
+
+def add_new_counters(apps, schema_editor):
+    # this counter is also the version of the cached device permissions, see switches/signals.py
+    c = Counter()
+    c.name = COUNTER_PERMISSION_CHANGES
+    c.description = "Number of changes to devices, groups and group members"
+    c.save()
+
+
+def remove_counters(apps, schema_editor):
+    # and remove them if you want to migrate backwards
+    pass
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('counters', '0002_vlan_manage_counter'),
+    ]
+
+    operations = [migrations.RunPython(add_new_counters, remove_counters)]
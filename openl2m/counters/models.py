@@ -11,13 +11,18 @@
 # more details.  You should have received a copy of the GNU General Public
 # License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
 #
-from django.db import models
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, models
+from django.db.models import F
 from django.contrib.auth.signals import user_logged_in, user_login_failed
 
 # this app creates a simple Counter class, used to track some activity counters
 from counters import constants
 
-from switches.utils import dprint
+from switches.utils import BackgroundWorker, dprint, get_process_object
 
 # this class is intended only to be used from the admin site, or from migrations!
 
@@ -55,17 +60,88 @@ class Counter(models.Model):
         return self.display_name()
 
 
-def counter_increment(name, addition=1):
-    # function to increment the value of a named counter
-    dprint(f"counter_increment({name})")
-    try:
-        c = Counter.objects.get(name=name)  # pylint: disable=no-member
-        c.value += addition
-        c.save()
+class CounterBatch(BackgroundWorker):
+    """
+    Collect counter increments in this process, and add them to the database every 'interval' seconds.
+    This way busy counters (e.g. logins) do not need a database update for every increment.
+    """
 
-    except Exception:
+    thread_name = "openl2m-counters"
+
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval (float): the number of seconds between writes of the pending increments.
+        """
+        self.interval = interval
+        self.pending: dict[str, int] = {}
+        self.lock = threading.Lock()
+
+    def add(self, name: str, addition: int):
+        """Add an increment of a counter, to be written later."""
+        with self.lock:
+            self.pending[name] = self.pending.get(name, 0) + addition
+
+    def flush(self) -> int:
+        """Write all pending increments to the database. Returns the number of counters updated."""
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        count = 0
+        for name, addition in pending.items():
+            if update_counter(name=name, addition=addition):
+                count += 1
+        return count
+
+    def close(self):
+        """Write the pending increments when the process exits."""
+        self.flush()
+
+    def _run(self):
+        """Write the pending increments every 'interval' seconds."""
+        while True:
+            time.sleep(self.interval)
+            if self.pending:
+                # this thread has its own database connection, that may have timed out:
+                close_old_connections()
+                self.flush()
+
+
+def get_counter_batch() -> CounterBatch | None:
+    """Get the process-wide counter batch, or None if batching is disabled (COUNTER_FLUSH_INTERVAL = 0)."""
+    if not settings.COUNTER_FLUSH_INTERVAL:
+        return None
+    return get_process_object("counter-batch", lambda: CounterBatch(interval=settings.COUNTER_FLUSH_INTERVAL))
+
+
+def update_counter(name: str, addition: int) -> bool:
+    """Add to the value of a named counter in the database, in a single UPDATE query.
+    The addition is done by the database, so concurrent updates from other processes are not lost.
+
+    Args:
+        name (str): the name of the counter.
+        addition (int): the value to add.
+
+    Returns:
+        (bool): True if the counter was updated, False if not found or on error.
+    """
+    try:
+        if Counter.objects.filter(name=name).update(value=F('value') + addition):  # pylint: disable=no-member
+            return True
+        dprint(f"Counter '{name}' not found!")
+    except Exception as err:
         # ignore
-        dprint("Error finding counter!")
+        dprint(f"Error updating counter '{name}': {err}")
+    return False
+
+
+def counter_increment(name, addition=1):
+    # function to increment the value of a named counter, now or in the next batch
+    dprint(f"counter_increment({name})")
+    batch = get_counter_batch()
+    if batch:
+        batch.add(name=name, addition=addition)
+    else:
+        update_counter(name=name, addition=addition)
 
 
 def increment_login_counter(sender, user, request, **kwargs):  # pylint: disable=unused-argument
@@ -20,7 +20,7 @@ from rest_framework.response import Response
 from rest_framework.reverse import reverse
 from rest_framework.views import APIView
 
-from switches.stats import get_environment_info, get_database_info, get_usage_info
+from switches.stats import get_environment_info, get_database_info, get_usage_info, get_top_activity
 from switches.utils import dprint
 
 from openl2m.api.authentication import IsSuperUser
@@ -96,6 +96,7 @@ class APIStatsView(APIView):
             {
                 "database": get_database_info(),
                 "usage": get_usage_info(),
+                "top_activity": get_top_activity(),
             }
         )
 
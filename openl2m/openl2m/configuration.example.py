@@ -99,6 +99,44 @@ PREFER_IPV4 = True
 # database access.) Note that the user as which OpenL2M runs must have read and write permissions to this path.
 SESSION_FILE_PATH = None
 
+# By default, the data read from a device is cached in the user's session ("session").
+# Alternatively, a shared snapshot of the device data can be stored in a server side cache. The session then only
+# keeps a reference to this snapshot, and the permissions of the user. This reduces the session size, and allows
+# multiple users looking at the same device to share the data, instead of each reading the device separately.
+# Valid options are:
+#   "session" - the default, store all device data in the user session.
+#   "locmem" - local memory of the OpenL2M process. Note this is NOT shared between multiple (gunicorn) processes!
+#   "file" - files in the directory set in SWITCH_CACHE_LOCATION, e.g. "/var/tmp/openl2m_cache"
+#   "redis" - a Redis (compatible) server set in SWITCH_CACHE_LOCATION, e.g. "redis://127.0.0.1:6379"
+#             Note: this requires the "redis" python package to be installed.
+# SWITCH_CACHE_BACKEND = "session"
+# SWITCH_CACHE_LOCATION = ""
+# how long device snapshots are kept, in seconds:
+# SWITCH_CACHE_TIMEOUT = 1800
+# the maximum number of snapshots kept in "locmem" and "file" caches. When full, the least recently used (locmem)
+# or a portion of the entries (file) are removed. For Redis, configure the server with "maxmemory-policy allkeys-lru"
+# SWITCH_CACHE_MAX_ENTRIES = 200
+# the format used to store the device data in the session or shared cache. Options are:
+#   "jsonpickle" - the default, stores all objects with full type information.
+#   "compact" - a versioned format for the OpenL2M data classes. This is smaller, and faster to save and load.
+#               Cached data from other OpenL2M versions is ignored, and the device is read again.
+# You can compare the two formats with "python3 manage.py benchmark cache"
+# SWITCH_CACHE_SERIALIZER = "jsonpickle"
+
+# The background poller keeps the shared cache warm for frequently viewed devices, so users do not
+# have to wait for the device to be read. Run it as a service with "python3 manage.py pollswitches".
+# This requires a SWITCH_CACHE_BACKEND that is shared between processes, ie. "file" or "redis".
+# Devices are polled if "Background Poll" is set on the device in the admin interface,
+# or if they are among the SWITCH_POLL_TOP_COUNT most accessed devices in the last SWITCH_POLL_ACCESS_DAYS days.
+# Keep SWITCH_POLL_INTERVAL lower than SWITCH_CACHE_TIMEOUT, or snapshots will expire between polls!
+# SWITCH_POLL_INTERVAL = 300
+# the number of devices read at the same time:
+# SWITCH_POLL_WORKERS = 4
+# SWITCH_POLL_TOP_COUNT = 0
+# SWITCH_POLL_ACCESS_DAYS = 7
+# on errors, the poll interval for a device is doubled every time, up to this many seconds:
+# SWITCH_POLL_MAX_BACKOFF = 3600
+
 # if using SSL, these should be set to True:
 CSRF_COOKIE_SECURE = False
 SESSION_COOKIE_SECURE = False
@@ -502,7 +540,7 @@ BGCOLOR_IF_ADMIN_DOWN = "#EB5B5B"  # red
 # Can be no more then 6! Best if 12 is divisible this number (e.g. 2, 3, 4, or 6)
 TOPMENU_MAX_COLUMNS = 4
 
-# show the switch search form in nav bar
+# show the switch search form in nav bar. It finds (part of) the device name, hostname, description, NMS id or ip.
 SWITCH_SEARCH_FORM = True
 
 # Globally enable or disable reading of hardware details of all devices.
@@ -511,6 +549,14 @@ SWITCH_SEARCH_FORM = True
 # per Switch Group, or for individual devices (Switches)
 READ_HARDWARE_DETAILS = True
 
+# If set, the "Reload All" button on a device only reads what changed, instead of all device data.
+# SNMP devices read sysUpTime and ifLastChange, and then only read the interfaces that changed,
+# plus the interface descriptions and untagged vlans. All data is read again after a device reboot,
+# or when interfaces or vlans were added or removed.
+# Note: changes to tagged vlans, PoE, LACP, and hardware details are NOT detected.
+# If set, ifLastChange is also walked on every full read of an SNMP device, so it can be compared later.
+# RELOAD_INCREMENTAL = False
+
 # SNMP related settings, normally not needed to change.
 SNMP_TIMEOUT = 5  # in seconds
 SNMP_RETRIES = 3
@@ -518,6 +564,18 @@ SNMP_RETRIES = 3
 # note that some devices cannot handle the default 25, and you may need to lower this e.g. 10
 # see the references in the documentation for more information.
 SNMP_MAX_REPETITIONS = 25
+# when reading the basic device information, OpenL2M walks several independent SNMP mib branches
+# concurrently, with one snmp session per worker thread. This sets the maximum number of concurrent walks
+# for a single device. Set to 1 to walk all mib branches one after another (the pre-v4.2 behavior).
+# SNMP_MAX_WORKERS = 4
+# some devices (e.g. Cisco) need a separate snmp community or v3 context for each vlan to read the ethernet addresses.
+# This sets the maximum number of vlan contexts walked concurrently. Set to 1 to walk one vlan after another.
+# SNMP_MAX_CONTEXT_WORKERS = 4
+# if set, do not read the ethernet addresses of vlans that do not have any interfaces that are up (Cisco)
+# SNMP_SKIP_INACTIVE_VLANS = False
+# when changing the tagged vlans of an interface, the changed vlan port bitmaps are written with up to this many
+# in a single snmp set. If a device does not accept this, they are set one at a time. Set to 1 to always do that.
+# SNMP_SET_MAX_VARBINDS = 10
 
 # Syslog settings
 #
@@ -556,6 +614,24 @@ SNMP_MAX_REPETITIONS = 25
 # E.g. this sends all login/logout related activity, PoE and SNMP Errors, and Health messages.
 # You can use ranges in the number listing.
 # SYSLOG_ACTIONS = "90-95,113,258,400"
+#
+# Syslog records are sent from a background thread. If the syslog host cannot keep up,
+# records are queued up to this number, and then dropped.
+# SYSLOG_QUEUE_SIZE = 1000
+
+# Log writing. New log entries are written to the database in batches, when this number of entries is waiting,
+# every LOG_BUFFER_INTERVAL seconds, and at the end of every web request. Set to 0 to write each entry immediately.
+# LOG_BUFFER_SIZE = 100
+# LOG_BUFFER_INTERVAL = 2
+
+# Activity counters (logins, changes, commands, etc.) are updated in the database with every increment.
+# On busy servers, set this to a number of seconds to add up the increments in each process,
+# and write them at that interval. The counters shown are then up to this many seconds behind.
+# COUNTER_FLUSH_INTERVAL = 0
+
+# The groups and devices a user has access to are cached for this number of seconds.
+# Any change to devices, groups or group members is seen right away, in all processes. 0 disables the cache.
+# PERMISSIONS_CACHE_TIMEOUT = 3600
 
 # Email settings, used to send results of commands and other emails.
 # the default uses the local plain old smtp server on port 25
@@ -590,6 +666,15 @@ SSH_CONNECT_TIMEOUT = 5
 # SSH command read timeout, default = 15 (Netmiko library default = 10)
 SSH_COMMAND_TIMEOUT = 15
 
+# SSH connections used for commands (and saving the config on some devices) are kept open for the next command,
+# instead of logging in every time. Idle connections are closed after this many seconds. Set to 0 to close every time.
+# Each OpenL2M process (e.g. gunicorn worker) opens at most SSH_POOL_MAX_PER_DEVICE connections to a device,
+# a command waits up to SSH_COMMAND_TIMEOUT seconds if they are all in use. Make sure your devices allow
+# enough SSH sessions (vty lines)! Idle connections send an SSH keepalive every SSH_POOL_KEEPALIVE seconds.
+# SSH_POOL_IDLE_TIMEOUT = 60
+# SSH_POOL_MAX_PER_DEVICE = 2
+# SSH_POOL_KEEPALIVE = 30
+
 # connect timeout for Junos devices via the Netconf interface
 JUNOS_PYEZ_CONN_TIMEOUT = 10
 # connect timeout for Junos devices via the Netconf interface
@@ -600,6 +685,17 @@ JUNOS_PYEZ_CMD_TIMEOUT = 120
 # HPE Comware, HPE/Aruba AOS-S, and HPE/Aruba AOS-CX API.
 REST_API_TIMEOUT = 10
 
+# REST API drivers keep their logged-in session with the device for the next request, instead of logging out
+# at the end of every page. Idle sessions are logged out after this many seconds. Set to 0 to log out every time.
+# Note: each OpenL2M process (e.g. gunicorn worker) keeps up to REST_SESSION_MAX_PER_DEVICE sessions per device,
+# make sure this stays below the session limits of your devices!
+# REST_SESSION_IDLE_TIMEOUT = 60
+# REST_SESSION_MAX_PER_DEVICE = 1
+
+# REST API drivers read the per-vlan and per-interface data of a device (e.g. PoE, MAC addresses, LLDP neighbors)
+# with this many requests at the same time. Set to 1 to read them one after the other.
+# REST_CLIENT_MAX_WORKERS = 4
+
 # perform hostname lookup from IP addresses found in ARP info, Admin pages, etc.
 # Note this could have impact on page rendering, depending on how fast your
 # dns resolution is and how may retries the underlying host OS is configured for.
@@ -607,6 +703,19 @@ REST_API_TIMEOUT = 10
 # DNS read timeout in seconds, for both forward and reverse lookups.
 DNS_TIMEOUT = 3
 
+# hostname lookups of the IP addresses in ARP and LLDP data are done concurrently, by this many threads per process.
+# DNS_MAX_WORKERS = 16
+# the maximum number of seconds to wait for all ARP (or LLDP) hostname lookups of a device.
+# Addresses that are not resolved in time are shown without hostname.
+# DNS_BATCH_TIMEOUT = 5
+
+# reverse lookup results are cached in each OpenL2M process for this many seconds. 0 disables the cache.
+# DNS_CACHE_TTL = 3600
+# addresses without a reverse (PTR) name are cached for this many seconds. 0 disables negative caching.
+# DNS_NEGATIVE_CACHE_TTL = 300
+# the maximum number of addresses in the cache, per process.
+# DNS_CACHE_MAX_ENTRIES = 50000
+
 # perform hostname lookup for admin page showing connected user
 LOOKUP_HOSTNAME_ADMIN = False
 # for IP addresses in device ARP tables, perform hostname lookup
@@ -652,6 +761,8 @@ ALLOW_ARP_LLDP_DOWNLOAD = True
 TOP_ACTIVITY = 10
 # number of days for the "Top N" activity:
 TOP_ACTIVITY_DAYS = 7
+# number of seconds the "Top N" results are cached, shared by the web page and REST stats. 0 disables:
+TOP_ACTIVITY_CACHE_TIMEOUT = 60
 
 #
 # Neighbor device settings, used for LLDP Neighbor tab, and Mermaid graphical view
@@ -173,10 +173,17 @@ SWITCH_SEARCH_FORM = getattr(configuration, "SWITCH_SEARCH_FORM", True)
 # read hardware details of a device (chassis, modules, etc.). Disable to save read time.
 READ_HARDWARE_DETAILS = getattr(configuration, "READ_HARDWARE_DETAILS", True)
 
+# "Reload All" only reads what changed on the device, if the driver supports it (SNMP drivers).
+RELOAD_INCREMENTAL = getattr(configuration, "RELOAD_INCREMENTAL", False)
+
 # snmp related constants
 SNMP_TIMEOUT = getattr(configuration, 'SNMP_TIMEOUT', 4)  # seconds before retry, see EasySNMP docs
 SNMP_RETRIES = getattr(configuration, 'SNMP_RETRIES', 3)  # retries before fail
 SNMP_MAX_REPETITIONS = getattr(configuration, 'SNMP_MAX_REPETITIONS', 10)  # SNMP get_bulk max_repetitions
+SNMP_MAX_WORKERS = getattr(configuration, "SNMP_MAX_WORKERS", 4)  # concurrent snmp walks per device, 1 = no concurrency
+SNMP_MAX_CONTEXT_WORKERS = getattr(configuration, "SNMP_MAX_CONTEXT_WORKERS", 4)  # concurrent per-vlan context walks
+SNMP_SKIP_INACTIVE_VLANS = getattr(configuration, "SNMP_SKIP_INACTIVE_VLANS", False)  # skip vlans without ports up
+SNMP_SET_MAX_VARBINDS = getattr(configuration, "SNMP_SET_MAX_VARBINDS", 10)  # oids per snmp set of vlan bitmaps
 
 # Syslog related fields:
 SYSLOG_HOST = getattr(configuration, "SYSLOG_HOST", False)
@@ -185,6 +192,15 @@ SYSLOG_FACILITY = getattr(configuration, "SYSLOG_FACILITY", "daemon")
 SYSLOG_LEVEL = getattr(configuration, "SYSLOG_LEVEL", "INFO")
 SYSLOG_JSON = getattr(configuration, "SYSLOG_JSON", True)
 SYSLOG_ACTIONS = getattr(configuration, "SYSLOG_ACTIONS", "")
+SYSLOG_QUEUE_SIZE = getattr(configuration, "SYSLOG_QUEUE_SIZE", 1000)  # records waiting to be sent, then dropped
+
+# new log entries are written in batches of this size, or every interval seconds. 0 writes every entry immediately.
+LOG_BUFFER_SIZE = getattr(configuration, "LOG_BUFFER_SIZE", 100)
+LOG_BUFFER_INTERVAL = getattr(configuration, "LOG_BUFFER_INTERVAL", 2)
+# activity counter increments are written every interval seconds. 0 writes every increment immediately.
+COUNTER_FLUSH_INTERVAL = getattr(configuration, "COUNTER_FLUSH_INTERVAL", 0)
+# seconds the device permissions of a user are cached. Changes to devices and groups clear the cache. 0 disables.
+PERMISSIONS_CACHE_TIMEOUT = getattr(configuration, "PERMISSIONS_CACHE_TIMEOUT", 3600)
 if SYSLOG_HOST:
     # validate host:
     try:
@@ -205,6 +221,58 @@ if LOGIN_TIMEOUT is not None:
 if SESSION_FILE_PATH is not None:
     SESSION_ENGINE = "django.contrib.sessions.backends.file"
 
+# Device data cache. By default, device data is stored in the user's session ("session").
+# Alternatively, store a shared snapshot of the device data in a server side cache,
+# where the session only keeps a reference and the per-user permissions.
+SWITCH_CACHE_BACKEND = getattr(configuration, "SWITCH_CACHE_BACKEND", "session")
+SWITCH_CACHE_LOCATION = getattr(configuration, "SWITCH_CACHE_LOCATION", "")
+SWITCH_CACHE_TIMEOUT = getattr(configuration, "SWITCH_CACHE_TIMEOUT", 1800)
+SWITCH_CACHE_MAX_ENTRIES = getattr(configuration, "SWITCH_CACHE_MAX_ENTRIES", 200)
+# the format used to store device data in the cache, "jsonpickle" or "compact", see switches/connect/serializer.py
+SWITCH_CACHE_SERIALIZER = getattr(configuration, "SWITCH_CACHE_SERIALIZER", "jsonpickle")
+if SWITCH_CACHE_SERIALIZER not in ("jsonpickle", "compact"):
+    raise ImproperlyConfigured(f"SWITCH_CACHE_SERIALIZER has an invalid value (value: {SWITCH_CACHE_SERIALIZER})")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+}
+if SWITCH_CACHE_BACKEND == "locmem":
+    # note that LocMemCache is per process, and evicts the least recently used entries when full.
+    CACHES["switches"] = {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "openl2m-switches",
+    }
+elif SWITCH_CACHE_BACKEND == "file":
+    if not SWITCH_CACHE_LOCATION:
+        raise ImproperlyConfigured("SWITCH_CACHE_LOCATION must be set to a directory for the 'file' cache backend")
+    CACHES["switches"] = {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": SWITCH_CACHE_LOCATION,
+    }
+elif SWITCH_CACHE_BACKEND == "redis":
+    if not SWITCH_CACHE_LOCATION:
+        raise ImproperlyConfigured("SWITCH_CACHE_LOCATION must be set to a redis url for the 'redis' cache backend")
+    CACHES["switches"] = {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": SWITCH_CACHE_LOCATION,
+    }
+elif SWITCH_CACHE_BACKEND != "session":
+    raise ImproperlyConfigured(f"SWITCH_CACHE_BACKEND has an invalid value (value: {SWITCH_CACHE_BACKEND})")
+if "switches" in CACHES:
+    CACHES["switches"]["TIMEOUT"] = SWITCH_CACHE_TIMEOUT
+    CACHES["switches"]["OPTIONS"] = {"MAX_ENTRIES": SWITCH_CACHE_MAX_ENTRIES}
+    if SWITCH_CACHE_BACKEND == "redis":
+        # the redis server handles size limits, see "maxmemory-policy allkeys-lru"
+        del CACHES["switches"]["OPTIONS"]
+
+# Background poller (manage.py pollswitches), to keep the shared snapshot cache warm.
+SWITCH_POLL_INTERVAL = getattr(configuration, "SWITCH_POLL_INTERVAL", 300)  # seconds between reads of a device
+SWITCH_POLL_WORKERS = getattr(configuration, "SWITCH_POLL_WORKERS", 4)  # devices read concurrently
+SWITCH_POLL_TOP_COUNT = getattr(configuration, "SWITCH_POLL_TOP_COUNT", 0)  # also poll the N most accessed devices
+SWITCH_POLL_ACCESS_DAYS = getattr(configuration, "SWITCH_POLL_ACCESS_DAYS", 7)  # ... accessed in the last N days
+SWITCH_POLL_MAX_BACKOFF = getattr(configuration, "SWITCH_POLL_MAX_BACKOFF", 3600)  # max seconds to wait after errors
+
 # The PickleSerializer is deprecated in Django 5.0. We now use the default JSONSerializer
 # SESSION_SERIALIZER = "django.contrib.sessions.serializers.PickleSerializer"
 
@@ -247,6 +315,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "switches.middleware.LogFlushMiddleware",
 ]
 
 # Minify causes problems with Bootstrap 5.3, so for now do not use it:
@@ -450,6 +519,13 @@ CISCO_WRITE_MEM_MAX_WAIT = getattr(configuration, "CISCO_WRITE_MEM_MAX_WAIT", 5)
 
 # DNS read timeout in seconds, for both forward and reverse lookups.
 DNS_TIMEOUT = getattr(configuration, "DNS_TIMEOUT", 3)
+# reverse lookups of many addresses (e.g. ARP and LLDP) are done concurrently, with an overall deadline in seconds:
+DNS_MAX_WORKERS = getattr(configuration, "DNS_MAX_WORKERS", 16)
+DNS_BATCH_TIMEOUT = getattr(configuration, "DNS_BATCH_TIMEOUT", 5)
+# reverse lookup results are cached in each OpenL2M process, failed lookups for a shorter time:
+DNS_CACHE_TTL = getattr(configuration, "DNS_CACHE_TTL", 3600)
+DNS_NEGATIVE_CACHE_TTL = getattr(configuration, "DNS_NEGATIVE_CACHE_TTL", 300)
+DNS_CACHE_MAX_ENTRIES = getattr(configuration, "DNS_CACHE_MAX_ENTRIES", 50000)
 
 # perform hostname lookup for admin page showing connected user
 LOOKUP_HOSTNAME_ADMIN = getattr(configuration, "LOOKUP_HOSTNAME_ADMIN", False)
@@ -466,6 +542,12 @@ SSH_CONNECT_TIMEOUT = getattr(configuration, 'SSH_CONNECT_TIMEOUT', 5)
 
 # SSH command read timeout, default = 15 (Netmiko library default = 10)
 SSH_COMMAND_TIMEOUT = getattr(configuration, 'SSH_COMMAND_TIMEOUT', 15)
+# open SSH connections are kept for later commands, for this many seconds when idle. 0 closes them every time.
+SSH_POOL_IDLE_TIMEOUT = getattr(configuration, 'SSH_POOL_IDLE_TIMEOUT', 60)
+# the maximum number of SSH connections per device (in use or idle), in each OpenL2M process:
+SSH_POOL_MAX_PER_DEVICE = getattr(configuration, 'SSH_POOL_MAX_PER_DEVICE', 2)
+# the SSH keepalive interval in seconds of connections kept in the pool:
+SSH_POOL_KEEPALIVE = getattr(configuration, 'SSH_POOL_KEEPALIVE', 30)
 
 # connect timeout for Junos devices via the Netconf interface
 JUNOS_PYEZ_CONN_TIMEOUT = getattr(configuration, 'JUNOS_PYEZ_CONN_TIMEOUT', 10)
@@ -476,6 +558,12 @@ JUNOS_PYEZ_CMD_TIMEOUT = getattr(configuration, 'JUNOS_PYEZ_CMD_TIMEOUT', 120)
 # currently applies to devices using the REST API client driver for
 # HPE Comware, HPE/Aruba AOS-S, and HPE/Aruba AOS-CX API.
 REST_CLIENT_TIMEOUT = getattr(configuration, 'REST_CLIENT_TIMEOUT', 10)
+# logged-in REST sessions are kept for later requests, for this many seconds when idle. 0 logs out every time.
+REST_SESSION_IDLE_TIMEOUT = getattr(configuration, 'REST_SESSION_IDLE_TIMEOUT', 60)
+# the maximum number of idle REST sessions kept per device, in each OpenL2M process:
+REST_SESSION_MAX_PER_DEVICE = getattr(configuration, 'REST_SESSION_MAX_PER_DEVICE', 1)
+# the maximum number of concurrent GETs of sub-resources (e.g. per-vlan or per-interface data) per device:
+REST_CLIENT_MAX_WORKERS = getattr(configuration, 'REST_CLIENT_MAX_WORKERS', 4)
 
 # REST API Settings
 API_ENABLED = getattr(configuration, 'API_ENABLED', True)
@@ -493,6 +581,8 @@ ALLOW_ARP_LLDP_DOWNLOAD = getattr(configuration, 'ALLOW_ARP_LLDP_DOWNLOAD', True
 TOP_ACTIVITY = getattr(configuration, 'TOP_ACTIVITY', 10)
 # number of days for the "Top N" activity:
 TOP_ACTIVITY_DAYS = getattr(configuration, 'TOP_ACTIVITY_DAYS', 7)
+# number of seconds the Top-N results are cached, shared by the web page and REST stats. 0 disables:
+TOP_ACTIVITY_CACHE_TIMEOUT = getattr(configuration, 'TOP_ACTIVITY_CACHE_TIMEOUT', 60)
 
 #
 # Neighbor device settings, used for LLDP Neighbor tab, and Mermaid graphical view
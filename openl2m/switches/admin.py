@@ -26,6 +26,7 @@ from switches.models import (
     Command,
     CommandList,
     CommandTemplate,
+    LogCheckpoint,
     Switch,
     SwitchGroup,
     SwitchGroupMembership,
@@ -95,7 +96,7 @@ class SwitchAdmin(admin.ModelAdmin):
         ),
         (
             "View Options",
-            {"fields": ("default_view",)},
+            {"fields": ("default_view", "background_poll")},
         ),
         (
             "Access Options",
@@ -573,6 +574,15 @@ class LogEntryAdmin(admin.ModelAdmin):
         return mark_safe(link)
 
 
+# show the "maillogs --checkpoint" checkpoints, so they can be deleted to start over:
+class LogCheckpointAdmin(admin.ModelAdmin):
+    list_display = ["name", "timestamp", "log_id"]
+    readonly_fields = ["timestamp", "log_id"]
+
+    def has_add_permission(self, request):
+        return False
+
+
 # Register your models here.
 admin_site.register(Switch, SwitchAdmin)
 admin_site.register(SwitchGroup, SwitchGroupAdmin)
@@ -584,3 +594,4 @@ admin_site.register(Command, CommandAdmin)
 admin_site.register(CommandList, CommandListAdmin)
 admin_site.register(CommandTemplate, CommandTemplateAdmin)
 admin_site.register(LogEntry, LogEntryAdmin)
+admin_site.register(LogCheckpoint, LogCheckpointAdmin)
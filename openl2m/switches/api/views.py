@@ -24,6 +24,7 @@ from rest_framework.views import APIView
 from switches.device_actions import DeviceActions
 from switches.connect.connect import get_connection_object
 from switches.permissions import get_my_device_groups, get_group_and_switch
+from switches.search import get_search_index
 from switches.utils import dprint
 
 on_values = ["on", "yes", "y", "enabled", "enable", "true", "1"]
@@ -74,34 +75,33 @@ class APISwitchSearch(
     ):
         dprint(f"APISwitchSearch(): user={request.user.username}, auth={request.auth}")
 
-        groups = get_my_device_groups(request=request)
+        index = get_search_index(request=request)
         device_groups = {}
         device_id = -1
-        for group_id, group in groups.items():
-            dprint(f"Group ID={group_id}, group={group}")
-            # find the requested device name
-            for switch_id, switch in group["members"].items():
-                if switch["name"].lower() == name.lower() or switch["hostname"].lower() == name.lower():
-                    # found one, add to return
-                    # add info for this group:
-                    dprint(f"\n\nFOUND SWITCH: {switch}\n\n")
-                    group_info = {
-                        "name": group["name"],
-                        "description": group["description"],
-                        "id": group_id,
-                        "read_only": group["read_only"],
-                        "switch_url": group["members"][switch_id]["url"],
-                    }
-                    device_groups[group_id] = group_info
-                    # and set this device info:
-                    if device_id == -1:
-                        device_id = switch_id
-                        device_info = switch.copy()  # copy so we can remove field!
-                        # clear device url, since it is switchgroup based.
-                        # if was added to group above
-                        del device_info["url"]
-                        # and add switch id
-                        device_info["id"] = switch_id
+        # find the requested device name
+        for entry in index.find(name=name):
+            for _, group_id, _ in entry.groups:
+                group = index.permissions[group_id]
+                # found one, add to return
+                # add info for this group:
+                dprint(f"\n\nFOUND SWITCH: {entry.switch}\n\n")
+                group_info = {
+                    "name": group["name"],
+                    "description": group["description"],
+                    "id": group_id,
+                    "read_only": group["read_only"],
+                    "switch_url": group["members"][entry.switch_id]["url"],
+                }
+                device_groups[group_id] = group_info
+                # and set this device info:
+                if device_id == -1:
+                    device_id = entry.switch_id
+                    device_info = entry.switch.copy()  # copy so we can remove field!
+                    # clear device url, since it is switchgroup based.
+                    # if was added to group above
+                    del device_info["url"]
+                    # and add switch id
+                    device_info["id"] = entry.switch_id
         # nothing found ?
         if device_id == -1:
             return respond_error(reason=f"Device '{name}' not found!")
@@ -16,3 +16,7 @@ from django.apps import AppConfig
 
 class SwitchesConfig(AppConfig):
     name = "switches"
+
+    def ready(self):
+        # invalidate the cached device permissions when devices or groups change
+        import switches.signals  # noqa: F401    pylint: disable=import-outside-toplevel,unused-import
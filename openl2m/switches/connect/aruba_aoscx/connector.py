@@ -113,6 +113,10 @@ class AosCxConnector(RESTConnector):
         self.api_prefix = ""  # rest uri prefix, ie. "/rest/v10.13"
         self.latest_api_version = ""  # the latest version supported by thye device
         self.aoscx_session = False  # no open REST session
+        self.set_per_user_cache_attribute("aoscx_session")
+        # a logged-in session can be kept by the REST session broker, with these attributes:
+        self.rest_session_attributes = ["headers", "cookies", "base_url", "api_prefix", "latest_api_version"]
+        self.rest_session_check_path = "system?attributes=hostname"
 
         # capabilities of current driver:
         self.can_change_admin_status = True
@@ -125,7 +129,8 @@ class AosCxConnector(RESTConnector):
         self.can_edit_tags = True  # True if this driver can edit 802.1q tagged vlans on interfaces
 
     def __del__(self):
-        """when we close the object, release the REST ticket, so the switch does not run out of resources!"""
+        """when we close the object, release the REST ticket (or give it to the REST session broker),
+        so the switch does not run out of resources!"""
         self._close_device()
 
     def get_my_basic_info(self) -> bool:
@@ -357,6 +362,12 @@ class AosCxConnector(RESTConnector):
             self._close_device()
             return False
 
+        # read the PoE data of all interfaces at the same time:
+        poe_interfaces = self._get_many(
+            uris=[interface["poe_interface"] for interface in interfaces.values() if "poe_interface" in interface],
+            message="Get PoE Interfaces",
+        )
+
         for if_name, interface in interfaces.items():
             dprint(f"--- {if_name} ---")
             # see the attributes available:
@@ -532,7 +543,9 @@ class AosCxConnector(RESTConnector):
             # check if this has PoE Capabilities
             if "poe_interface" in interface:
                 # this does not mean PoE is available for this interface. Let's check...
-                poe_info = self._get(uri=interface["poe_interface"])
+                poe_info = poe_interfaces.get(interface["poe_interface"])
+                if isinstance(poe_info, Exception):
+                    raise poe_info
                 if poe_info:
                     dprint(f"--- POE found for {if_name} ---")
                     # there is probably a more 'global' system/device way to see if PoE capabilities exist:
@@ -706,14 +719,20 @@ class AosCxConnector(RESTConnector):
             dprint("_open_device() failed!")
             return False
 
-        # get mac address table, this is based on vlans:
+        # get mac address table, this is based on vlans. Read all vlans at the same time:
         dprint("Getting MAC table per VLAN:")
+        vlan_macs = self._get_many(
+            uris=[f"{uri}?depth=2" for vlan in self.vlans.values() for uri in (vlan.macs_uri, vlan.static_macs_uri)],
+            message="Get MAC Addresses",
+        )
         for vlan in self.vlans.values():
             # dvar(var=vlan, header="VLAN OBJECT")
             dprint(f"Vlan {vlan.id}:")
             for uri in (vlan.macs_uri, vlan.static_macs_uri):
                 try:
-                    macs = self._get(uri=f"{uri}?depth=2", message="ETH INFO")
+                    macs = vlan_macs[f"{uri}?depth=2"]
+                    if isinstance(macs, Exception):
+                        raise macs
                     # now get details for each mac address
                     for mac_addr, mac in macs.items():
                         mac_if_name = next(iter(mac["port"]))  # we use first element only!
@@ -733,11 +752,16 @@ class AosCxConnector(RESTConnector):
                     self.add_log(type=LOG_TYPE_ERROR, action=LOG_DEVICE_REST_GET, description=details)
 
         dprint("Getting LLDP data per INTERFACE:")
+        interface_neighbors = self._get_many(
+            uris=[f"{iface.lldp_uri}?depth=2" for iface in self.interfaces.values()], message="Get LLDP Neighbors"
+        )
 
         for iface in self.interfaces.values():
             dprint(f"  Interface {iface.name}:")
             try:
-                neighbors = self._get(uri=f"{iface.lldp_uri}?depth=2", message="LLDP INFO")
+                neighbors = interface_neighbors[f"{iface.lldp_uri}?depth=2"]
+                if isinstance(neighbors, Exception):
+                    raise neighbors
                 for nb_name, lldp_nb in neighbors.items():
                     dprint(f"LLDP FOUND: {nb_name}")
                     neighbor = NeighborDevice(lldp_nb["chassis_id"])
@@ -1362,6 +1386,11 @@ class AosCxConnector(RESTConnector):
             dprint("  _open_device: No Credentials!")
             return False
 
+        # can we use a session that is already logged in?
+        if self._borrow_rest_session():
+            self.aoscx_session = True
+            return True
+
         # first check to see what the latest API version supported is
         if not self.latest_api_version:
             self._set_base_url(base_url=f"https://{self.switch.primary_ip4}/")
@@ -1423,7 +1452,10 @@ class AosCxConnector(RESTConnector):
         make sure we properly close the AOS-CX REST Session
         """
         dprint("AOS-CX _close_device()")
-        if self.aoscx_session:
+        if self.aoscx_session and self._release_rest_session(logout_method="POST", logout_path="logout"):
+            # the session broker keeps the session for the next request
+            self.aoscx_session = False
+        elif self.aoscx_session:
             # logout
             try:
                 self._post(path="logout", message="API LOGOUT")
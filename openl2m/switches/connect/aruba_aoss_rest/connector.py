@@ -93,6 +93,8 @@ class ArubaAOSsRestConnector(RESTConnector):
             self.add_more_info("System", "Description", switch.description)
 
         self._set_base_url(base_url=f"https://{self.switch.primary_ip4}/rest/v{API_VERSION}/")
+        # a logged-in session can be kept by the REST session broker:
+        self.rest_session_check_path = "system"
 
         # self.port_index_to_if_index: Dict[
         #     int, str
@@ -148,6 +150,10 @@ class ArubaAOSsRestConnector(RESTConnector):
             # or all warnings:
             urllib3.disable_warnings()
 
+        # can we use a session that is already logged in?
+        if self._borrow_rest_session():
+            return True
+
         return self.login()
 
     def _close_device(self) -> bool:
@@ -156,6 +162,10 @@ class ArubaAOSsRestConnector(RESTConnector):
         """
         dprint("Aruba_AOSS_RestConnector._close_device()")
 
+        # the session broker can keep the session for the next request:
+        if self.cookies and self._release_rest_session(logout_method="DELETE", logout_path="login-sessions"):
+            self.cookies = {}
+
         # need to call DELETE to the session-login URI
         if self.cookies:
             # do we want to check SSL certificates?
@@ -18,6 +18,7 @@
 #
 
 import array
+from collections.abc import Iterator
 
 import netaddr
 
@@ -235,6 +236,11 @@ class Vlan:
         return self.display_name()
 
 
+# for each byte value, the offsets (0-7) of the bits that are set, high order bit first.
+# Used to decode PortList bitmaps one byte at a time, see PortList.iter_set_bits()
+_BYTE_BIT_OFFSETS = tuple(tuple(bit for bit in range(8) if byte & (128 >> bit)) for byte in range(256))
+
+
 class PortList:
     """
     Object to handle the Q-BRIDGE PortList bitmap that exists per vlan.
@@ -277,10 +283,32 @@ class PortList:
         Returns:
             n/a
         """
-        for hexadecimal in hex_string.split():
-            # dprint(f"Found: {hexadecimal}")
-            byte = ord(bytes.fromhex(hexadecimal))
-            self.portlist.append(byte)
+        # fromhex() ignores the spaces between the bytes:
+        self.portlist.frombytes(bytes.fromhex(hex_string))
+
+    def iter_set_bits(self, first: int = 1, batch_size: int = 256) -> Iterator[list[int]]:
+        """
+        Decode the whole bitmap in one pass, and yield the positions of all bits that are set, in batches.
+        The high order bit of the first byte is position 'first', i.e. by default the Q-Bridge port id 1.
+        Bytes with no bits set are skipped quickly, so sparse bitmaps (the common case) are cheap.
+
+        Args:
+            first (int): the position of the very first bit, e.g. 1 for port ids, or a vlan id base.
+            batch_size (int): the (approximate) maximum number of positions yielded at once.
+
+        Returns:
+            (Iterator[list[int]]): lists of bit positions, in increasing order.
+        """
+        batch = []
+        for offset, byte in enumerate(self.portlist):
+            if byte:
+                base = offset * 8 + first
+                batch.extend([base + bit for bit in _BYTE_BIT_OFFSETS[byte]])
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
 
     def tobytes(self) -> bytes:
         """
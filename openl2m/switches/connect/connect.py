@@ -195,10 +195,15 @@ def get_connection_object(request: HttpRequest, group: SwitchGroup, switch: Swit
         # should not happen!
         raise Exception("Invalid connector type configured on switch!")
 
-    # load caches (http session, memory cache (future), whatever else for performance)
-    if not connection.load_cache():
+    # is this the first request for this device in this session?
+    # Note: without a request (e.g. the background poller) this is not counted as an access.
+    new_access = bool(request) and request.session.get("switch_id") != switch.id
+    # load caches (http session, shared snapshot cache, whatever else for performance)
+    cache_loaded = connection.load_cache()
+    if new_access:
         # first WebGUI request, update only once per session the device access count and timestamp
         switch.update_access()
+    if not cache_loaded:
         # now check if this is REST request:
         if isinstance(request, RESTRequest):
             # API call with token, there is no cache so always load the basic switch config:
@@ -13,15 +13,15 @@
 #
 from collections import OrderedDict
 import datetime
+import hashlib
 import logging
 import re
+import threading
 import time
 import traceback
 from typing import Any
 
 import json
-import jsonpickle
-from lib.manuf import manuf
 import natsort
 import netmiko
 
@@ -38,7 +38,18 @@ from switches.constants import (
     LOG_HEALTH_MESSAGE,
     LOG_PORT_POE_FAULT,
 )
-from switches.utils import dprint, get_remote_ip, get_host_by_name, get_ip_dns_name
+from switches.utils import (
+    BackgroundWorker,
+    dprint,
+    get_host_by_name,
+    get_ip_dns_name,
+    get_ip_dns_names,
+    get_process_object,
+    get_remote_ip,
+)
+from switches.connect.oui import get_oui_database
+from switches.connect.serializer import StaleCacheData, decode_cache_data, encode_cache_data
+from switches.connect.snapshot import delete_snapshot, get_snapshot, save_snapshot, snapshot_cache_enabled
 from switches.connect.classes import (
     Error,
     PoePort,
@@ -69,6 +80,176 @@ from switches.connect.constants import (
 
 from rest_framework.reverse import reverse as rest_reverse
 
+# the Interface() attributes that are set per user in Connector()._set_interfaces_permissions()
+INTERFACE_PERMISSION_ATTRIBUTES = (
+    "visible",
+    "manageable",
+    "unmanage_reason",
+    "can_edit_description",
+    "can_edit_tags",
+    "allow_poe_toggle",
+)
+
+
+class SSHPoolBusy(Exception):
+    """All SSH connections to a device allowed by the pool are in use."""
+
+
+class SSHConnection:
+    """
+    An open Netmiko SSH connection to a device, kept in the SSHConnectionPool().
+    """
+
+    def __init__(self, key: tuple, handle):
+        """
+        Args:
+            key (tuple): the device and credentials this connection belongs to.
+            handle: the Netmiko connection, as returned by netmiko.ConnectHandler()
+        """
+        self.key = key
+        self.handle = handle
+        self.last_used = time.monotonic()
+
+    def disconnect(self):
+        """Close the connection, ignoring any errors."""
+        try:
+            self.handle.disconnect()
+        except Exception as err:
+            dprint(f"SSHConnection.disconnect() error: {err}")
+
+
+class SSHConnectionPool(BackgroundWorker):
+    """
+    Keep idle Netmiko SSH connections per device, so later commands do not need to log in again.
+    This also limits the number of connections per device (in use or idle), in this process.
+    """
+
+    thread_name = "openl2m-ssh-pool"
+
+    def __init__(self, idle_timeout: float, max_per_device: int):
+        """
+        Args:
+            idle_timeout (float): the number of seconds after which an idle connection is closed.
+            max_per_device (int): the maximum number of connections per device.
+        """
+        self.idle_timeout = idle_timeout
+        self.max_per_device = max_per_device
+        self.idle: dict[tuple, list[SSHConnection]] = {}
+        self.in_use: dict[tuple, int] = {}  # connections borrowed, or being opened
+        self.condition = threading.Condition()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.expired = 0
+        self.busy = 0
+
+    def acquire(self, key: tuple, timeout: float):
+        """
+        Get a connection to a device. If there is no idle connection, this reserves a place for a new connection,
+        that the caller needs to open, and give back with release() when done, even if opening fails.
+
+        Args:
+            key (tuple): the device and credentials.
+            timeout (float): the number of seconds to wait for a connection, if all are in use.
+
+        Returns:
+            the idle Netmiko connection, or None if the caller needs to open a new connection.
+
+        Raises:
+            SSHPoolBusy: if all connections to this device stayed in use for 'timeout' seconds.
+        """
+        with self.condition:
+            if not self.condition.wait_for(
+                lambda: self.idle.get(key) or self.in_use.get(key, 0) < self.max_per_device, timeout=timeout
+            ):
+                self.busy += 1
+                raise SSHPoolBusy(f"All {self.max_per_device} SSH connections to this device are in use!")
+            self.in_use[key] = self.in_use.get(key, 0) + 1
+            idle = self.idle.get(key)
+            connection = idle.pop() if idle else None
+            if connection:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if connection and not self._is_alive(connection):
+            # e.g. closed by the device, the caller opens a new connection in its place:
+            with self.condition:
+                self.stale += 1
+            connection.disconnect()
+            connection = None
+        return connection.handle if connection else None
+
+    def release(self, key: tuple, handle, reusable: bool = True):
+        """
+        Give back a connection from acquire(). An idle connection is kept, unless it cannot be used again,
+        or the device has the maximum number of idle connections already.
+
+        Args:
+            key (tuple): the device and credentials.
+            handle: the Netmiko connection, or None if opening a new connection failed.
+            reusable (bool): False if the connection had an error, and should be closed.
+        """
+        connection = SSHConnection(key=key, handle=handle) if handle else None
+        with self.condition:
+            self.in_use[key] = max(self.in_use.get(key, 0) - 1, 0)
+            if not self.in_use[key]:
+                del self.in_use[key]
+            if connection and reusable:
+                idle = self.idle.setdefault(key, [])
+                if len(idle) + self.in_use.get(key, 0) < self.max_per_device:
+                    idle.append(connection)
+                    connection = None
+            self.condition.notify_all()
+        if connection:
+            connection.disconnect()
+
+    def close(self):
+        """Close all idle connections, e.g. when the process exits."""
+        with self.condition:
+            connections = [connection for idle in self.idle.values() for connection in idle]
+            self.idle = {}
+            self.condition.notify_all()
+        for connection in connections:
+            connection.disconnect()
+
+    def _is_alive(self, connection: SSHConnection) -> bool:
+        """Check that an idle connection is still open."""
+        try:
+            return bool(connection.handle.is_alive())
+        except Exception as err:
+            dprint(f"SSHConnectionPool._is_alive() error: {err}")
+            return False
+
+    def _run(self):
+        """Close the idle connections that expired."""
+        while True:
+            time.sleep(min(self.idle_timeout, 10))
+            expired = []
+            now = time.monotonic()
+            with self.condition:
+                for key, idle in list(self.idle.items()):
+                    expired.extend(connection for connection in idle if now - connection.last_used >= self.idle_timeout)
+                    idle[:] = [connection for connection in idle if now - connection.last_used < self.idle_timeout]
+                    if not idle:
+                        del self.idle[key]
+                self.expired += len(expired)
+            for connection in expired:
+                connection.disconnect()
+
+
+def get_ssh_connection_pool() -> SSHConnectionPool | None:
+    """Get the process-wide SSH connection pool, or None if disabled (SSH_POOL_IDLE_TIMEOUT = 0)."""
+    if not settings.SSH_POOL_IDLE_TIMEOUT or settings.SSH_POOL_MAX_PER_DEVICE < 1:
+        return None
+    return get_process_object(
+        "ssh-connection-pool",
+        lambda: SSHConnectionPool(
+            idle_timeout=settings.SSH_POOL_IDLE_TIMEOUT,
+            max_per_device=settings.SSH_POOL_MAX_PER_DEVICE,
+        ),
+    )
+
+
 #
 # Base Connector() class for OpenL2M.
 # This implements the interface that is expected by the higher level code
@@ -114,7 +295,22 @@ class Connector:
             "switch",
             "error",
             "netmiko_connection",
+            "netmiko_pool_key",
+            "netmiko_reused",
+            "_per_user_cache",
+            "_snapshot_generation",
+            "_snapshot_data",
+        ]
+        # when using the shared snapshot cache, these attributes depend on the user,
+        # and are stored in the user session instead of the shared snapshot:
+        self._per_user_cache = [
+            "read_only",
+            "allowed_vlans",
+            "timing",
+            "cache_loaded",
         ]
+        self._snapshot_generation = 0  # the data generation of the shared snapshot we loaded or saved
+        self._snapshot_data = ""  # the serialized snapshot, to detect changes on save.
 
         self.hostname = ""  # system hostname, typically set in sub-class
         self.vendor_name = ""  # typically set in sub-classes
@@ -134,8 +330,12 @@ class Connector:
         )  # the IPv4 addresses as keys, with stored value if_index; needed to map netmask to interface
         # some flags:
         self.cache_loaded = False  # if True, system data was loaded from cache
+        self.read_in_background = False  # if True, data was read by the background poller, see pollswitches command
         # some timestamps:
         self.basic_info_read_timestamp = 0  # when the last 'basic' read occured
+        # the interface permission attributes as set by the driver, before applying the user permissions.
+        # Used to set the permissions of other users of a shared snapshot, see load_cache()
+        self.interface_permissions_base: dict[str, tuple] = {}
 
         # data we calculate or collect without caching:
         self.allowed_vlans: dict[int, Vlan] = (
@@ -185,6 +385,8 @@ class Connector:
         self.netmiko_ignore_prompt = False
         # variable to deal with the SSH connection:
         self.netmiko_connection = False  # return from Netmiko.ConnectHandler()
+        self.netmiko_pool_key = None  # the SSHConnectionPool() key of the connection, if the pool is used
+        self.netmiko_reused = False  # True if the connection was already open, and came from the pool
         # self.netmiko_timeout = settings.SSH_TIMEOUT  # should be SSH timeout/retry values
         # self.netmiko_retries = settings.SSH_RETRIES
         self.netmiko_output = ""  # any output from a netmiko/ssh command executed.
@@ -383,8 +585,11 @@ class Connector:
                         self.add_warning(f"Connection Error: {self.error.details}")
                 else:
                     self.add_timing("Basic Info Read", 1, read_duration)
-                    # All OK, now set the permissions to the interfaces:
-                    self._set_interfaces_permissions()
+                    # remember the driver settings, then set the permissions to the interfaces:
+                    self.interface_permissions_base = self._get_interface_permissions()
+                    # the background poller has no user, permissions are set when a user loads the snapshot.
+                    if self.request:
+                        self._set_interfaces_permissions()
 
                 if not self.vlan_count:  # driver likely did not set it!
                     # set the vlan count
@@ -457,6 +662,45 @@ class Connector:
     #     return True
     #
 
+    def refresh_basic_info(self) -> bool:
+        """
+        Refresh the cached basic info with only the data that changed on the device, instead of reading it all again.
+        This calls the device implementation specific function "refresh_my_basic_info()", if implemented.
+        Interfaces that did not change are kept as they are.
+
+        Args:
+            none
+
+        Returns:
+            True if the data was refreshed, False if there is no cached data, or the driver cannot refresh it,
+            ie. all data needs to be read again.
+        """
+        dprint("Connector.refresh_basic_info()")
+        if not self.cache_loaded or not hasattr(self, "refresh_my_basic_info"):
+            return False
+        self.error.clear()
+        start_time = time.time()
+        # refresh the data as set by the driver, ie. without the permissions of the current user:
+        self._apply_interface_permissions(self.interface_permissions_base)
+        count = self.refresh_my_basic_info()
+        if count < 0:
+            dprint("  Driver cannot refresh, read all data again")
+            return False
+        self.basic_info_read_timestamp = start_time
+        self.add_timing("Partial Refresh", count, time.time() - start_time)
+        self.interface_permissions_base = self._get_interface_permissions()
+        if self.request:
+            self._set_interfaces_permissions()
+        return True
+
+    #
+    # This placeholder can be implemented by drivers that can refresh the cached basic info.
+    # return the number of changed items, or -1 if all data needs to be read again.
+    #
+    # def refresh_my_basic_info(self) -> int:
+    #     return -1
+    #
+
     def get_client_data(self) -> bool:
         """
         This loads the layer 2 switch tables, any ARP tables available,
@@ -1259,6 +1503,36 @@ class Connector:
             logging.basicConfig(filename='netmiko-debug.log', level=logging.DEBUG)
             logging.getLogger("netmiko")
 
+        # use an open connection from the pool, if we can:
+        pool = get_ssh_connection_pool()
+        if pool:
+            profile = self.switch.netmiko_profile
+            key = (
+                self.switch.id,
+                self.switch.primary_ip4,
+                profile.id,
+                profile.username,
+                hashlib.sha256(str(profile.password).encode()).hexdigest(),
+                profile.tcp_port,
+                device_type,
+            )
+            try:
+                handle = pool.acquire(key=key, timeout=settings.SSH_COMMAND_TIMEOUT)
+            except SSHPoolBusy as err:
+                dprint(f"netmiko_connect(): ERROR {err}")
+                self.error.status = True
+                self.error.description = "Too many SSH connections to this device, please try again later!"
+                self.error.details = f"{err}"
+                return False
+            self.netmiko_pool_key = key
+            if handle:
+                dprint("  connection from pool OK!")
+                self.netmiko_connection = handle
+                self.netmiko_reused = True
+                return True
+            # keep the idle connection open:
+            device["keepalive"] = settings.SSH_POOL_KEEPALIVE
+
         try:
             handle = netmiko.ConnectHandler(**device)
         except netmiko.NetMikoTimeoutException as err:
@@ -1266,30 +1540,61 @@ class Connector:
             self.error.status = True
             self.error.description = "Connection time-out! Please ask the admin to verify the switch hostname or IP, or change the SSH_COMMAND_TIMEOUT configuration."
             self.error.details = f"Netmiko Error: {err!r} ({type(err)!s})\n{traceback.format_exc()}"
+            self.netmiko_disconnect()
             return False
         except netmiko.NetMikoAuthenticationException as err:
             dprint("netmiko_connect(): ERROR NetMikoAuthenticationException")
             self.error.status = True
             self.error.description = "Access denied! Please ask the admin to correct the switch credentials."
             self.error.details = f"Netmiko Error: {err!r} ({type(err)!s})\n{traceback.format_exc()}"
+            self.netmiko_disconnect()
             return False
         except netmiko.exceptions.ReadTimeout as err:
             dprint(f"netmiko_connect(): ERROR ReadTimeout: {err!r}")
             self.error.status = True
             self.error.description = "Error: the connection attempt timed out!"
             self.error.details = f"Netmiko Error: {err!r} ({type(err)!s})\n{traceback.format_exc()}"
+            self.netmiko_disconnect()
             return False
         except Exception as err:
             dprint(f"netmiko_connect(): ERROR Generic Error: {type(err)!s}")
             self.error.status = True
             self.error.description = "SSH Connection denied! Please inform your admin."
             self.error.details = f"Netmiko Error: {err!r} ({type(err)!s})\n{traceback.format_exc()}"
+            self.netmiko_disconnect()
             return False
 
         dprint("  connection OK!")
         self.netmiko_connection = handle
         return True
 
+    def netmiko_disconnect(self, reusable: bool = True):
+        """
+        Done with the SSH connection. Give it back to the connection pool, or close it if the pool is not used.
+
+        Args:
+            reusable (bool): False if the connection had an error, and should not be used again.
+
+        Returns:
+            none
+        """
+        dprint("netmiko_disconnect()")
+        handle = self.netmiko_connection
+        self.netmiko_connection = False
+        self.netmiko_reused = False
+        if self.netmiko_pool_key:
+            pool = get_ssh_connection_pool()
+            if pool:
+                pool.release(key=self.netmiko_pool_key, handle=handle or None, reusable=reusable)
+                self.netmiko_pool_key = None
+                return
+            self.netmiko_pool_key = None
+        if handle:
+            try:
+                handle.disconnect()
+            except Exception as err:
+                dprint(f"  disconnect error: {err}")
+
     def netmiko_disable_paging(self) -> bool:
         """
         Disable paging, ie the "hit a key" for more
@@ -1306,6 +1611,9 @@ class Connector:
         if not self.netmiko_disable_paging_command:
             dprint("  Disable command not set, using Netmiko default!")
             return True
+        if self.netmiko_reused:
+            dprint("  Connection from pool, paging already disabled!")
+            return True
         if not self.netmiko_connection:
             dprint("  netmiko.disable_paging(): No connection yet, calling self.connect() (Huh?)")
             if not self.netmiko_connect():
@@ -1326,6 +1634,7 @@ class Connector:
         """
         Execute a single command on the device.
         Save the command output to self.output
+        The SSH connection is given back to the connection pool (or closed) when done.
 
         Args:
             command: the string the execute as a command on the device
@@ -1341,6 +1650,7 @@ class Connector:
             if not self.netmiko_connect():
                 return False
         if not self.netmiko_disable_paging():
+            self.netmiko_disconnect(reusable=False)
             return False
         dprint("  sending command string...")
         try:
@@ -1362,14 +1672,23 @@ class Connector:
             self.error.status = True
             self.error.description = "Error: the command timed out!"
             self.error.details = f"Netmiko Error: {err!r}"
+            # the device may still send output, so do not use this connection again:
+            self.netmiko_disconnect(reusable=False)
             return False
         except Exception as err:
             dprint(f"  Netmiko.connection error: {type(err)!s} - {err!r}")
+            reused = self.netmiko_reused
+            self.netmiko_disconnect(reusable=False)
+            if reused:
+                # a connection from the pool that went stale, try again with another one:
+                dprint("  connection from pool failed, reconnecting...")
+                return self._execute_command(command=command)
             self.netmiko_output = "Error sending command!"
             self.error.status = True
             self.error.description = "Error sending command!"
             self.error.details = f"Netmiko Error: {err!r} ({type(err)!s})"
             return False
+        self.netmiko_disconnect()
         dprint("  _execute_command() OK!")
         return True
 
@@ -1448,7 +1767,6 @@ class Connector:
             # error occured, pass it on
             cmd["error_descr"] = self.error.description
             cmd["error_details"] = self.error.details
-        del self.netmiko_connection
         return cmd
 
     def run_command_string(self, command_string: str) -> dict:
@@ -1482,7 +1800,6 @@ class Connector:
             # error occured, pass it on
             cmd["error_descr"] = self.error.description
             cmd["error_details"] = self.error.details
-        del self.netmiko_connection
         return cmd
 
     def set_do_not_cache_attribute(self, name: str):
@@ -1499,6 +1816,21 @@ class Connector:
         if name not in self._do_not_cache:
             self._do_not_cache.append(name)
 
+    def set_per_user_cache_attribute(self, name: str):
+        """
+        Add the name of one of our class object attributes to the list of attributes
+        that depend on the current user. When the shared snapshot cache is used,
+        these are stored in the user session, instead of in the snapshot.
+
+        Args:
+            name (str): name of attribute to cache per user
+
+        Return:
+            none
+        """
+        if name not in self._per_user_cache:
+            self._per_user_cache.append(name)
+
     def load_cache(self) -> bool:
         """
         Load cached data to improve performance.
@@ -1511,6 +1843,9 @@ class Connector:
         """
         dprint("load_cache()")
 
+        if snapshot_cache_enabled():
+            return self._load_snapshot()
+
         if self.request and "switch_id" in self.request.session:
             # is the cached data for the current switch ?
             if self.request.session["switch_id"] != self.switch.id:
@@ -1522,21 +1857,28 @@ class Connector:
             # Yes - read it
             dprint("load_cache() for current switch!")
             start_time = time.time()
-            count = 0
+            cached = {}
             # get myself from cache :-)
-            for attr_name in self.__dict__:
-                dprint(f"Reading cached attribute '{attr_name}'")
-                if attr_name not in self._do_not_cache:
-                    if attr_name in self.request.session:
-                        dprint("   Valid attribute!")
-                        # with Django 5, Pickle serialization is no longer supported, so to use the JSON session cache
-                        # we use jsonpickle to make sure we can store *any* class object in the sesssion!
-                        # keys=True ensures that integer dictionary keys are maintained! (e.g self.vlans)
-                        # self.__setattr__(attr_name, jsonpickle.decode(self.request.session[attr_name], keys=True))
-                        setattr(self, attr_name, jsonpickle.decode(self.request.session[attr_name], keys=True))
-                        count += 1
-                else:
-                    dprint("   Ignoring (_do_not_cache)!")
+            try:
+                for attr_name in self.__dict__:
+                    dprint(f"Reading cached attribute '{attr_name}'")
+                    if attr_name not in self._do_not_cache:
+                        if attr_name in self.request.session:
+                            dprint("   Valid attribute!")
+                            # with Django 5, Pickle serialization is no longer supported, so to use the JSON session
+                            # cache we serialize to make sure we can store *any* class object in the sesssion!
+                            # See switches/connect/serializer.py
+                            cached[attr_name] = decode_cache_data(self.request.session[attr_name])
+                    else:
+                        dprint("   Ignoring (_do_not_cache)!")
+            except StaleCacheData as err:
+                # written by another version, read the device again
+                dprint(f"load_cache() found stale data: {err}")
+                self.clear_cache()
+                return False
+            for attr_name, value in cached.items():
+                setattr(self, attr_name, value)
+            count = len(cached)
 
             # call the child-class specific load_my_cache()
             self.load_my_cache()
@@ -1547,6 +1889,66 @@ class Connector:
         dprint("  NO cache found!")
         return False
 
+    def _load_snapshot(self) -> bool:
+        """
+        Load the device data from the shared snapshot cache, and apply the permissions of the current user.
+        The user permissions are read from the session if they were calculated for the same data generation,
+        or calculated again from the driver settings if not.
+
+        Args:
+            none
+        Returns:
+            True if snapshot was read and variables set.
+            False if there is no snapshot, or we changed switches.
+        """
+        dprint("_load_snapshot()")
+        if not self.request:
+            return False
+        if self.request.session.get("switch_id", self.switch.id) != self.switch.id:
+            # we changed switches, clear session data!
+            dprint("_load_snapshot() for new switch! so clearing cache...")
+            self.clear_cache()
+        start_time = time.time()
+        generation, data = get_snapshot(switch_id=self.switch.id)
+        if data is None:
+            dprint("  NO snapshot found!")
+            return False
+
+        # one decode for the whole device, instead of each attribute:
+        try:
+            snapshot = decode_cache_data(data)
+        except StaleCacheData as err:
+            # written by another version, read the device again
+            dprint(f"  Stale snapshot: {err}")
+            return False
+        count = 0
+        for attr_name, value in snapshot.items():
+            if attr_name in self.__dict__ and attr_name not in self._do_not_cache:
+                setattr(self, attr_name, value)
+                count += 1
+
+        overlay = self.request.session.get("switch_overlay", {})
+        if overlay.get("switch_id") == self.switch.id and overlay.get("generation") == generation:
+            dprint("  Using user permissions from session")
+            for attr_name, value in decode_cache_data(overlay["attributes"]).items():
+                if attr_name in self.__dict__:
+                    setattr(self, attr_name, value)
+            self._apply_interface_permissions(overlay["interfaces"])
+        else:
+            dprint("  Calculating user permissions for new data generation")
+            self._apply_interface_permissions(self.interface_permissions_base)
+            self._set_interfaces_permissions()
+
+        self._snapshot_generation = generation
+        self._snapshot_data = data
+        self.request.session["switch_id"] = self.switch.id
+        self.request.session.modified = True
+        # call the child-class specific load_my_cache()
+        self.load_my_cache()
+        self.cache_loaded = True
+        self.add_timing("Cache load", count, time.time() - start_time)
+        return True
+
     def load_my_cache(self):
         """
         To be implemented by child classes.
@@ -1577,6 +1979,9 @@ class Connector:
         # for name, value in self.__dict__.items():
         #    dprint(f"dict caching:  { name }")
 
+        if snapshot_cache_enabled():
+            return self._save_snapshot()
+
         if self.request:
             # save switch ID, it all triggers around that!
             start_time = time.time()
@@ -1586,10 +1991,10 @@ class Connector:
             for attr_name, value in self.__dict__.items():
                 if attr_name not in self._do_not_cache:
                     # with Django 5, Pickle serialization is no longer supported, so to use the JSON session cache
-                    # we use jsonpickle to make sure we can store *any* class object in the sesssion!
-                    # keys=True ensures that integer dictionary keys are maintained! (e.g self.vlans)
+                    # we serialize to make sure we can store *any* class object in the sesssion!
+                    # See switches/connect/serializer.py
                     dprint(f"  Caching Attrib = {attr_name}")
-                    self.request.session[attr_name] = jsonpickle.encode(value, keys=True)
+                    self.request.session[attr_name] = encode_cache_data(value)
                     count += 1
                 else:
                     dprint(f"  NOT caching attrib = {attr_name}")
@@ -1606,6 +2011,56 @@ class Connector:
         dprint("save_cache() DONE!")
         return True
 
+    def _save_snapshot(self) -> bool:
+        """
+        Save the device data in the shared snapshot cache, as a new data generation if it changed.
+        The user specific attributes and interface permissions are saved in the user session.
+        Without a request (e.g. the background poller), only the device data is saved.
+
+        Args:
+            none
+
+        Returns:
+            True on success, False on failure.
+        """
+        dprint("Connector._save_snapshot()")
+        start_time = time.time()
+        snapshot = {}
+        user_data = {}
+        for attr_name, value in self.__dict__.items():
+            if attr_name in self._do_not_cache:
+                continue
+            if attr_name in self._per_user_cache:
+                user_data[attr_name] = value
+            else:
+                snapshot[attr_name] = value
+        data = encode_cache_data(snapshot)
+        # only save a new generation if the device data changed:
+        if data != self._snapshot_data:
+            self._snapshot_generation = save_snapshot(
+                switch_id=self.switch.id, data=data, timestamp=self.basic_info_read_timestamp
+            )
+            self._snapshot_data = data
+        if not self.request:
+            self.add_timing("Cache save", len(snapshot), time.time() - start_time)
+            return True
+
+        # and the user specific data goes in the session:
+        self.request.session["switch_id"] = self.switch.id
+        self.request.session["switch_overlay"] = {
+            "switch_id": self.switch.id,
+            "generation": self._snapshot_generation,
+            "attributes": encode_cache_data(user_data),
+            "interfaces": self._get_interface_permissions(),
+        }
+        self.request.session.modified = True
+
+        # call the child-class specific save_my_cache()
+        self.save_my_cache()
+        self.add_timing("Cache save", len(snapshot), time.time() - start_time)
+        dprint("_save_snapshot() DONE!")
+        return True
+
     def save_my_cache(self):
         """
         To be implemented by child classes.
@@ -1699,7 +2154,7 @@ class Connector:
             value of cached item. None if not found.
         """
         dprint(f"get_cache_variable(): {name}")
-        if name in self.request.session:
+        if self.request and name in self.request.session:
             dprint("   ... found!")
             return self.request.session[name]
         return None
@@ -1851,31 +2306,53 @@ class Connector:
             # no vlan allowed!
             dprint("  read-only, no vlans allowed!")
             return
+        # if allow_all is set, or we are staff or supervisor, allow all vlans:
+        if self.group.allow_all_vlans or (
+            self.request and (self.request.user.is_superuser or self.request.user.is_staff)
+        ):
+            dprint("  all vlans allowed per allow-all or superuser or staff")
+            for switch_vlan_id, switch_vlan in self.vlans.items():
+                self.allowed_vlans[int(switch_vlan_id)] = switch_vlan
+            return
+        # 'regular' user, allow the switch vlans in the switchgroup.vlan_groups and switchgroup.vlans:
+        group_vlan_ids = self.group.get_allowed_vlan_ids()
         for switch_vlan_id, switch_vlan in self.vlans.items():
-            # if allow_all is set, or we are staff or supervisor, allow this vlan:
-            if self.group.allow_all_vlans or (
-                self.request and (self.request.user.is_superuser or self.request.user.is_staff)
-            ):
+            if int(switch_vlan_id) in group_vlan_ids:
+                # save using the switch vlan name, which is possibly different from the VLAN group name!
                 self.allowed_vlans[int(switch_vlan_id)] = switch_vlan
-                dprint(f"  {switch_vlan_id}: allowed per allow-all or superuser or staff")
-            else:
-                # 'regular' user, first check the switchgroup.vlan_groups:
-                found_vlan = False
-                for vlan_group in self.group.vlan_groups.all():
-                    for group_vlan in vlan_group.vlans.all():
-                        if int(group_vlan.vid) == int(switch_vlan_id):
-                            self.allowed_vlans[int(switch_vlan_id)] = switch_vlan
-                            found_vlan = True
-                            dprint(f"  {switch_vlan_id}: allowed per group.vlan_groups")
-                            continue
-                # check if this switch vlan is in the list of allowed vlans
-                if not found_vlan:
-                    for group_vlan in self.group.vlans.all():
-                        if int(group_vlan.vid) == int(switch_vlan_id):
-                            # save using the switch vlan name, which is possibly different from the VLAN group name!
-                            self.allowed_vlans[int(switch_vlan_id)] = switch_vlan
-                            dprint(f"  {switch_vlan_id}: allowed per group.vlans(individual)")
-                            continue
+        dprint(f"  {len(self.allowed_vlans)} vlans allowed per group.vlan_groups and group.vlans")
+
+    def _get_interface_permissions(self) -> dict:
+        """
+        Get the user permission related attributes of all interfaces.
+
+        Args:
+            none
+
+        Returns:
+            (dict): key is the interface key, value is a tuple of the attribute values in INTERFACE_PERMISSION_ATTRIBUTES
+        """
+        permissions = {}
+        for key, iface in self.interfaces.items():
+            permissions[key] = tuple(getattr(iface, name) for name in INTERFACE_PERMISSION_ATTRIBUTES)
+        return permissions
+
+    def _apply_interface_permissions(self, permissions: dict):
+        """
+        Set the user permission related attributes of the interfaces,
+        as returned from _get_interface_permissions()
+
+        Args:
+            permissions (dict): key is the interface key, value is a tuple (or list) of attribute values.
+
+        Returns:
+            none
+        """
+        for key, values in permissions.items():
+            iface = self.interfaces.get(key)
+            if iface:
+                for name, value in zip(INTERFACE_PERMISSION_ATTRIBUTES, values):
+                    setattr(iface, name, value)
 
     def _set_interfaces_permissions(self):
         """
@@ -2177,16 +2654,23 @@ class Connector:
             (int): number of entries attempted to resolve.
         """
         dprint("_lookup_hostname_from_arp() called.")
-        count = 0
-        for interface in self.interfaces.values():
-            for eth in interface.eth.values():
-                if eth.address_ip4:
-                    eth.hostname = get_ip_dns_name(eth.address_ip4[0])
-                    count += 1
-                # only resolve IPv6 if IPv4 did not resolve hostname
-                if not eth.hostname and eth.address_ip6:
-                    eth.hostname = get_ip_dns_name(eth.address_ip6[0])
-                    count += 1
+        # resolve all addresses at once, with an overall deadline for both IPv4 and IPv6:
+        deadline = time.time() + settings.DNS_BATCH_TIMEOUT
+        eths = [eth for interface in self.interfaces.values() for eth in interface.eth.values()]
+        ip4_eths = [eth for eth in eths if eth.address_ip4]
+        names = get_ip_dns_names(ips=[eth.address_ip4[0] for eth in ip4_eths], timeout=settings.DNS_BATCH_TIMEOUT)
+        for eth in ip4_eths:
+            eth.hostname = names.get(eth.address_ip4[0], "")
+        count = len(ip4_eths)
+        # only resolve IPv6 if IPv4 did not resolve hostname
+        ip6_eths = [eth for eth in eths if not eth.hostname and eth.address_ip6]
+        if ip6_eths:
+            names = get_ip_dns_names(
+                ips=[eth.address_ip6[0] for eth in ip6_eths], timeout=max(deadline - time.time(), 0)
+            )
+            for eth in ip6_eths:
+                eth.hostname = names.get(eth.address_ip6[0], "")
+            count += len(ip6_eths)
         return count
 
     def _lookup_hostname_from_lldp(self):
@@ -2202,15 +2686,17 @@ class Connector:
             (int): number of entries attemted to resolve.
         """
         dprint("_lookup_hostname_from_lldp() called.")
-        count = 0
+        neighbors = []
         for interface in self.interfaces.values():
             for neighbor in interface.lldp.values():
                 # networkAddress(5), first byte is address type, next bytes are address.
                 # see https://www.iana.org/assignments/address-family-numbers/address-family-numbers.xhtml
                 if neighbor.chassis_type == LLDP_CHASSIC_TYPE_NET_ADDR and neighbor.chassis_string_type in [IANA_TYPE_IPV4, IANA_TYPE_IPV6]:
-                    count += 1
-                    neighbor.hostname = get_ip_dns_name(neighbor.chassis_string)
-        return count
+                    neighbors.append(neighbor)
+        names = get_ip_dns_names(ips=[neighbor.chassis_string for neighbor in neighbors])
+        for neighbor in neighbors:
+            neighbor.hostname = names.get(neighbor.chassis_string, "")
+        return len(neighbors)
 
     def _lookup_ethernet_vendors(self):
         """Look up the vendor names for the ethernet addresses found on interfaces.
@@ -2224,54 +2710,44 @@ class Connector:
         """
         dprint("_lookup_ethernet_vendors() called.")
 
-        # load the Wireshark ethernet OUI parser
-        parser = manuf.manuf.MacParser()
-
-        # go through the list of ethernet addresses on each interface
+        # go through the list of ethernet addresses on each interface, and lldp neighbors
+        # where the chassis-string is an ethernet address. Then look them up as one batch.
         self.eth_count = 0
         self.neighbor_count = 0
+        eths = []
+        neighbors = []
         for interface in self.interfaces.values():
-            dprint(f"  Interface '{interface.name}'")
             for eth in interface.eth.values():
                 self.eth_count += 1
                 if not eth.is_multicast and not eth.is_locally_administered:
-                    # get regular vendor
-                    eth.vendor = self._get_oui_vendor(parser=parser, ethernet_address=str(eth))
-                dprint(f"  Eth Vendor = {eth.vendor}")
-            # also lookup vendor for Neighbors where the chassis-string is an ethernet address:
+                    eths.append(eth)
             for neighbor in interface.lldp.values():
                 self.neighbor_count += 1
                 if neighbor.chassis_type == LLDP_CHASSIC_TYPE_ETH_ADDR and not neighbor.vendor:
-                    neighbor.vendor = self._get_oui_vendor(parser=parser, ethernet_address=neighbor.chassis_string)
-                    dprint(f"  Neighbor vendor = {neighbor.vendor}")
+                    neighbors.append(neighbor)
         dprint(f"  VENDOR LOOKUPS: ETH {self.eth_count}, LLDP {self.neighbor_count}")
+        if not eths and not neighbors:
+            return
 
-    def _get_oui_vendor(self, parser, ethernet_address: str) -> str:
-        """Look up an ethernet address in the OUI database, and return vendor information.
-
-        Args:
-            parser: a pre-loaded manuf.MacParser() object.
-            ethernet_address (str): the string representing the ethernet address
-
-        Returns:
-            (str): vendor name with either .manuf_long or .manuf string representing OUI vendor name.
-            if unknown, returns ""
-        """
-        dprint(f"_get_oui_vendor() for '{ethernet_address}'")
-        # try to get the vendor from the OUI list
+        # the Wireshark ethernet OUI database, loaded once per process:
         try:
-            vendor = parser.get_all(ethernet_address)
-            if vendor.manuf_long:
-                return vendor.manuf_long
-            if vendor.manuf:
-                return vendor.manuf
+            database = get_oui_database()
         except Exception as err:
-            dprint(f"ERROR: cannot get Ethernet vendor for '{ethernet_address}'")
+            dprint(f"ERROR: cannot load Ethernet vendor database: {err}")
             # this will also add log entry:
-            self.add_warning(f"Error retrieving Ethernet vendor for '{ethernet_address}' (error: {err})")
-            return ""
-
-        return ""
+            self.add_warning(f"Error loading the Ethernet vendor database (error: {err})")
+            return
+        vendors, errors = database.lookup_many(
+            [str(eth) for eth in eths] + [neighbor.chassis_string for neighbor in neighbors]
+        )
+        for eth in eths:
+            eth.vendor = vendors.get(str(eth), "")
+        for neighbor in neighbors:
+            neighbor.vendor = vendors.get(neighbor.chassis_string, "")
+        for address, err in errors.items():
+            dprint(f"ERROR: cannot get Ethernet vendor for '{address}'")
+            # this will also add log entry:
+            self.add_warning(f"Error retrieving Ethernet vendor for '{address}' (error: {err})")
 
     def display_name(self) -> str:
         """
@@ -2316,3 +2792,19 @@ def clear_switch_cache(request: HttpRequest):
         del request.session["switch_id"]
         request.session.modified = True
     # if not found, we had not selected a switch before. ie upon login!
+
+
+def clear_switch_snapshot(switch_id: int):
+    """
+    Clear the shared snapshot of the device data, if used, so the device will be read again.
+    Does not return anything.
+
+    Args:
+        switch_id (int): the Switch().id of the device.
+
+    Returns:
+        none
+    """
+    dprint(f"clear_switch_snapshot({switch_id}) called")
+    if snapshot_cache_enabled():
+        delete_snapshot(switch_id=switch_id)
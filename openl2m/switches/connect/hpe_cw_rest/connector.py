@@ -107,6 +107,9 @@ class HPECwRestConnector(RESTConnector):
         # this holds the custom REST api attributes
         self.token: str = ""  # REST token after username/password login
         self.set_do_not_cache_attribute("token")
+        # a logged-in session can be kept by the REST session broker, with these attributes:
+        self.rest_session_attributes = ["headers", "cookies", "base_url", "token"]
+        self.rest_session_check_path = "Device/Base"
 
         self.port_index_to_if_index: dict[int, str] = (
             {}
@@ -171,6 +174,10 @@ class HPECwRestConnector(RESTConnector):
             # or all warnings:
             urllib3.disable_warnings()
 
+        # can we use a token that is already logged in?
+        if self._borrow_rest_session():
+            return True
+
         return self.login()
 
     def _close_device(self) -> bool:
@@ -178,6 +185,9 @@ class HPECwRestConnector(RESTConnector):
         eAPI is stateless, but we will delete the token on the device.
         """
         dprint("HPECwRestConnector._close_device()")
+        # the session broker can keep the token for the next request:
+        if self.token and self._release_rest_session(logout_method="DELETE", logout_path=f"tokens/{self.token}"):
+            self.token = ""
         if self.token:
             # do should not have to check creds if we get to closing state!
             # do we want to check SSL certificates?
@@ -652,9 +652,15 @@ class PyEZConnector(Connector):
         # Most details come from the RPC call to
         #     get_lldp_interface_neighbors(interface_device=<name>)
         # This RPC is cli equivalent of "show lldp neigbor interface <name>"
-        # So we are going to loop through all interfaces:
+        # So we are going to loop through the physical interfaces that have neighbors:
         #
+        lldp_interfaces = self._get_lldp_neighbor_interfaces()
         for iface in self.interfaces.values():
+            if iface.type != IF_TYPE_ETHERNET:
+                # lldp runs on physical ports only, not on vlan, aggregate or special interfaces
+                continue
+            if lldp_interfaces is not None and iface.name not in lldp_interfaces:
+                continue
             dprint(f"  Interface:{iface.name}")
             try:
                 #
@@ -699,6 +705,40 @@ class PyEZConnector(Connector):
         self._close_device()
         return True
 
+    def _get_lldp_neighbor_interfaces(self) -> set | None:
+        """
+        Find the interfaces that have lldp neighbors, with a single RPC for the whole device.
+        This RPC is cli equivalent of "show lldp neighbors", and does not have all the neighbor details.
+
+        Args:
+            none
+
+        Returns:
+            (set): the names of the physical interfaces with lldp neighbors,
+                   or None if this is not known, and all interfaces need to be checked.
+        """
+        dprint("PyEZConnector()._get_lldp_neighbor_interfaces()")
+        try:
+            lldp_data = self.device.rpc.get_lldp_neighbors_information()
+        except Exception as err:
+            dprint(f"dev.rpc.get_lldp_neighbors_information() error: {err}")
+            return None
+        if_names = set()
+        for nb in lldp_data.findall(".//lldp-neighbor-information"):
+            # ELS devices show the port, e.g. "ge-0/0/1", others show the unit, e.g. "ge-0/0/1.0"
+            if_name = nb.findtext(".//lldp-local-interface") or nb.findtext(".//lldp-local-port-id")
+            if not if_name:
+                dprint("  local interface not found!")
+                return None
+            if_names.add(junos_remove_unit(if_name))
+        unknown = if_names - self.interfaces.keys()
+        if unknown:
+            # e.g. a port index instead of a name, we cannot tell which interfaces have neighbors:
+            dprint(f"  unknown local interfaces: {unknown}")
+            return None
+        dprint(f"  interfaces with neighbors: {if_names}")
+        return if_names
+
     def _parse_powersupply(self, supply):
         """
         Parse out XML data with power suply information, and update
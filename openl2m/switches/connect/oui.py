@@ -0,0 +1,135 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Ethernet vendor (OUI) lookups, using the Wireshark "manuf" database.
+
+The database file is parsed once per process, the first time it is needed, and again
+only when the file changes (e.g. after "manuf.py --update" in upgrade.sh).
+The parsed data is stored as a compact index: for each prefix (mask) length, a sorted array
+of integer prefixes, and the matching vendor names. Lookups are binary searches, most specific prefix first.
+"""
+
+import array
+import bisect
+import os
+import threading
+
+from lib.manuf import manuf
+from switches.utils import dprint
+
+# remove the characters allowed between the hex digits of an ethernet address:
+_STRIP_SEPARATORS = str.maketrans("", "", "-:.")
+
+
+class OuiDatabase:
+    """
+    Pre-indexed copy of the Wireshark manuf database.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): the location of the manuf file.
+
+        Raises:
+            OSError: if the file cannot be read.
+        """
+        self.path = path
+        self.mtime = os.stat(path).st_mtime
+        # use the manuf parser for the file format, then index its (mask, prefix) entries:
+        parser = manuf.MacParser(manuf_name=path)
+        by_mask: dict[int, list[tuple[int, str]]] = {}
+        for (mask, prefix), vendor in parser._masks.items():
+            by_mask.setdefault(mask, []).append((prefix, vendor.manuf_long or vendor.manuf or ""))
+        # list of (mask, sorted prefixes, vendor names), smallest mask (i.e. most specific prefix) first:
+        self.index: list[tuple[int, array.array, tuple[str, ...]]] = []
+        for mask in sorted(by_mask):
+            entries = sorted(by_mask[mask])
+            self.index.append((mask, array.array("q", [entry[0] for entry in entries]), tuple(e[1] for e in entries)))
+        self.count = len(parser._masks)
+
+    def lookup(self, ethernet_address: str) -> str:
+        """Find the vendor of an ethernet address.
+
+        Args:
+            ethernet_address (str): the ethernet address, in any format with '-', ':' or '.' separators.
+
+        Returns:
+            (str): the vendor name, or "" if not found.
+
+        Raises:
+            ValueError: if the address cannot be parsed.
+        """
+        digits = ethernet_address.translate(_STRIP_SEPARATORS)
+        bits_left = 48 - 4 * len(digits)
+        mac_int = int(digits, 16) << bits_left
+        for mask, prefixes, names in self.index:
+            # if we were only given X bits, only check X bits. No partial matching!
+            if mask < bits_left:
+                continue
+            prefix = mac_int >> mask
+            position = bisect.bisect_left(prefixes, prefix)
+            if position < len(prefixes) and prefixes[position] == prefix:
+                return names[position]
+        return ""
+
+    def lookup_many(self, ethernet_addresses) -> tuple[dict[str, str], dict[str, str]]:
+        """Find the vendors of a batch of ethernet addresses. Duplicates are looked up once.
+
+        Args:
+            ethernet_addresses (iterable): the ethernet address strings.
+
+        Returns:
+            (vendors, errors): dictionaries keyed by address, with the vendor name ("" if not found),
+                               or the error for addresses that cannot be parsed.
+        """
+        vendors = {}
+        errors = {}
+        for address in ethernet_addresses:
+            if address in vendors or address in errors:
+                continue
+            try:
+                vendors[address] = self.lookup(address)
+            except ValueError as err:
+                errors[address] = str(err)
+        return (vendors, errors)
+
+
+_database: OuiDatabase | None = None
+_database_lock = threading.Lock()
+
+
+def get_oui_database(path: str = "") -> OuiDatabase:
+    """Get the process-wide OUI database. It is loaded on first use, and reloaded if the file has changed.
+
+    Args:
+        path (str): the location of the manuf file, defaults to the file in the manuf library.
+
+    Returns:
+        (OuiDatabase): the database object.
+
+    Raises:
+        OSError: if the file cannot be read.
+    """
+    global _database
+    path = path or manuf.MacParser.get_packaged_manuf_file_path()
+    database = _database
+    if database is not None and database.path == path and database.mtime == os.stat(path).st_mtime:
+        return database
+    with _database_lock:
+        # another thread may have loaded it while we waited:
+        if _database is None or _database.path != path or _database.mtime != os.stat(path).st_mtime:
+            dprint(f"get_oui_database(): loading {path}")
+            _database = OuiDatabase(path)
+        return _database
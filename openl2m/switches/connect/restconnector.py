@@ -14,9 +14,17 @@
 """
 Driver that adds basic REST connectibity to the base Connector() class.
 This implements base HTTP(s) GET, POST, PUT, and DELETE to other REST API drivers to inherit.
+
+It also implements a per-process broker of logged-in REST sessions. Instead of logging out at the end of
+every web request, a driver returns its session to the broker, and the next request for the same device
+and credentials borrows it, instead of logging in again. Idle sessions are logged out after
+REST_SESSION_IDLE_TIMEOUT seconds, and at most REST_SESSION_MAX_PER_DEVICE idle sessions are kept per device.
 """
 
+import concurrent.futures
+import hashlib
 import json
+import threading
 import time
 import ssl
 import sys
@@ -29,7 +37,7 @@ import requests
 from switches.connect.connector import Connector
 from switches.connect.utils import debug_response
 from switches.models import Switch, SwitchGroup
-from switches.utils import dprint
+from switches.utils import BackgroundWorker, dprint, get_process_object
 
 
 # for python >= 3.13, we need to ignore a number of cert errors for older switches.
@@ -59,6 +67,136 @@ class SslFlagAdapter(requests.adapters.HTTPAdapter):
         return super().init_poolmanager(*args, **kwargs)
 
 
+# a session that was idle for this many seconds is checked before it is used again:
+REST_SESSION_CHECK_IDLE = 10
+
+
+class RESTSession:
+    """
+    A logged-in REST session to a device, with the driver attributes needed to use it,
+    e.g. cookies, headers with CSRF or authentication tokens, and the API url.
+    """
+
+    def __init__(self, key: tuple, ssl_session: requests.Session, state: dict, logout: tuple, verify: bool):
+        """
+        Args:
+            key (tuple): the device and credentials this session belongs to.
+            ssl_session (requests.Session): the http(s) session, with its connection pool and cookies.
+            state (dict): the driver attribute values that belong to this login, by attribute name.
+            logout (tuple): the http method and full url to log out, e.g. ("POST", "https://.../logout")
+            verify (bool): True to verify the device certificate.
+        """
+        self.key = key
+        self.ssl_session = ssl_session
+        self.state = state
+        self.logout_method, self.logout_url = logout
+        self.verify = verify
+        self.last_used = time.monotonic()
+
+    def logout(self):
+        """Log out of the device, ignoring any errors."""
+        dprint(f"RESTSession.logout(): {self.logout_method} {self.logout_url}")
+        try:
+            self.ssl_session.request(
+                method=self.logout_method,
+                url=self.logout_url,
+                headers=self.state.get("headers"),
+                cookies=self.state.get("cookies"),
+                verify=self.verify,
+                timeout=settings.REST_CLIENT_TIMEOUT,
+            )
+        except Exception as err:
+            dprint(f"  logout error: {err}")
+        self.ssl_session.close()
+
+
+class RESTSessionBroker(BackgroundWorker):
+    """
+    Keep idle logged-in REST sessions per device, so they can be used again by later web requests.
+    A session is used by one driver at a time: it is borrowed, and returned when the driver is done.
+    """
+
+    thread_name = "openl2m-rest-sessions"
+
+    def __init__(self, idle_timeout: float, max_per_device: int):
+        """
+        Args:
+            idle_timeout (float): the number of seconds after which an idle session is logged out.
+            max_per_device (int): the maximum number of idle sessions kept per device.
+        """
+        self.idle_timeout = idle_timeout
+        self.max_per_device = max_per_device
+        self.sessions: dict[tuple, list[RESTSession]] = {}
+        self.lock = threading.Lock()
+        self.logins_saved = 0
+        self.logouts = 0
+
+    def borrow(self, key: tuple) -> RESTSession | None:
+        """Get the most recently used idle session for this key, or None if there is none."""
+        with self.lock:
+            sessions = self.sessions.get(key, [])
+            session = sessions.pop() if sessions else None
+        if session and time.monotonic() - session.last_used >= self.idle_timeout:
+            # expired, the cleanup thread has not seen it yet:
+            self.discard(session)
+            return None
+        return session
+
+    def release(self, session: RESTSession) -> bool:
+        """Keep a session that is no longer used. Returns False if there are too many idle sessions for
+        this device already, and the caller should log out."""
+        session.last_used = time.monotonic()
+        with self.lock:
+            sessions = self.sessions.setdefault(session.key, [])
+            if len(sessions) >= self.max_per_device:
+                return False
+            sessions.append(session)
+            self.logins_saved += 1
+        return True
+
+    def discard(self, session: RESTSession):
+        """Log out of a session that is expired or no longer valid."""
+        with self.lock:
+            self.logouts += 1
+        session.logout()
+
+    def close(self):
+        """Log out of all idle sessions, e.g. when the process exits."""
+        with self.lock:
+            sessions = [session for device_sessions in self.sessions.values() for session in device_sessions]
+            self.sessions = {}
+        for session in sessions:
+            self.discard(session)
+
+    def _run(self):
+        """Log out of the expired idle sessions."""
+        while True:
+            time.sleep(min(self.idle_timeout, REST_SESSION_CHECK_IDLE))
+            expired = []
+            now = time.monotonic()
+            with self.lock:
+                for key, sessions in list(self.sessions.items()):
+                    expired.extend(session for session in sessions if now - session.last_used >= self.idle_timeout)
+                    sessions[:] = [session for session in sessions if now - session.last_used < self.idle_timeout]
+                    if not sessions:
+                        del self.sessions[key]
+            for session in expired:
+                self.discard(session)
+
+
+def get_rest_session_broker() -> RESTSessionBroker | None:
+    """Get the process-wide REST session broker, or None if disabled (REST_SESSION_IDLE_TIMEOUT = 0)."""
+    if not settings.REST_SESSION_IDLE_TIMEOUT or settings.REST_SESSION_MAX_PER_DEVICE < 1:
+        return None
+    return get_process_object(
+        "rest-session-broker",
+        lambda: RESTSessionBroker(
+            idle_timeout=settings.REST_SESSION_IDLE_TIMEOUT,
+            max_per_device=settings.REST_SESSION_MAX_PER_DEVICE,
+        ),
+    )
+
+
 class RESTConnector(Connector):
     """
     This implements a basic REST interface with HTTP GET, POST, PUT and DELETE functions.
@@ -72,13 +210,30 @@ class RESTConnector(Connector):
         self.server_url: str = ""  # the base server URL, e.g. https://<server-ip-or-name>/
         self.base_url: str = ""  # base URL (host + base rest uri) of REST queries
         self.cookies: dict = {}  # cookies to add to the request
-        self.ssl_session = requests.Session()
+        # the driver attributes that belong to a login, and are kept with a brokered REST session:
+        self.rest_session_attributes: list = ["headers", "cookies", "base_url"]
+        # a cheap API path to check that a brokered session that was idle is still logged in:
+        self.rest_session_check_path: str = ""
 
         # call the base connector init:
         super().__init__(request, group, switch)
 
         self.server_url = f"https://{self.switch.primary_ip4}"
 
+        # the REST login session data belongs to the user, and is not shared:
+        self.set_per_user_cache_attribute("headers")
+        self.set_per_user_cache_attribute("cookies")
+        self.set_per_user_cache_attribute("ssl_session")
+        self.set_per_user_cache_attribute("response")
+
+        self.ssl_session = self._new_ssl_session()
+
+    def _new_ssl_session(self) -> requests.Session:
+        """Create a new http(s) session to the device, with the proper SSL checks."""
+        ssl_session = requests.Session()
+        # keep a connection to the device for each concurrent GET, see _get_many():
+        pool_size = max(requests.adapters.DEFAULT_POOLSIZE, settings.REST_CLIENT_MAX_WORKERS)
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
         # do we ignore ssl warnings and errors?
         if not self.switch.netmiko_profile.verify_hostkey:
             dprint("DISABLING SSL Checks!!!")
@@ -90,7 +245,83 @@ class RESTConnector(Connector):
             if sys.version_info >= (3, 13):
                 # set the handler to disable other SSL checks in Python 3.13+
                 # this includes X.509 certs, hostname check, and allowing older ciphers
-                self.ssl_session.mount("https://", SslFlagAdapter())
+                adapter = SslFlagAdapter(pool_maxsize=pool_size)
+        ssl_session.mount("https://", adapter)
+        return ssl_session
+
+    def _get_rest_session_key(self) -> tuple:
+        """The device and credentials a brokered REST session belongs to."""
+        profile = self.switch.netmiko_profile
+        password_hash = hashlib.sha256(str(profile.password).encode()).hexdigest()
+        return (self.__class__.__name__, self.switch.id, self.switch.primary_ip4, profile.username, password_hash)
+
+    def _borrow_rest_session(self) -> bool:
+        """
+        Use an idle logged-in REST session to this device, if the session broker has one.
+        This sets the attributes in self.rest_session_attributes, as they were when the session was released.
+
+        Returns:
+            (bool): True if a session is ready to use, False if the driver needs to log in.
+        """
+        broker = get_rest_session_broker()
+        if not broker or not self.switch.netmiko_profile:
+            return False
+        key = self._get_rest_session_key()
+        while True:
+            session = broker.borrow(key=key)
+            if not session:
+                return False
+            # use the session, and check it if it was idle for a while:
+            self.ssl_session = session.ssl_session
+            for name, value in session.state.items():
+                setattr(self, name, value)
+            if time.monotonic() - session.last_used < REST_SESSION_CHECK_IDLE or self._check_rest_session():
+                dprint("  Using brokered REST session!")
+                return True
+            dprint("  Brokered REST session is no longer valid!")
+            broker.discard(session)
+            self.ssl_session = self._new_ssl_session()
+
+    def _check_rest_session(self) -> bool:
+        """Check that the REST session is still logged in, by reading self.rest_session_check_path (if set)."""
+        if not self.rest_session_check_path:
+            return True
+        try:
+            return self._get(path=self.rest_session_check_path, message="API SESSION CHECK") is not None
+        except Exception as err:
+            dprint(f"  REST session check failed: {err}")
+            return False
+
+    def _release_rest_session(self, logout_method: str, logout_path: str) -> bool:
+        """
+        Give the logged-in REST session to the session broker, instead of logging out.
+
+        Args:
+            logout_method (str): the http method to log out, e.g. "POST" or "DELETE"
+            logout_path (str): the API path to log out, relative to the base url.
+
+        Returns:
+            (bool): True if the broker keeps the session, False if the driver needs to log out.
+        """
+        broker = get_rest_session_broker()
+        if not broker or not self.switch.netmiko_profile:
+            return False
+        if self.response is not None and self.response.status_code == 401:
+            # the last request was not authorized, this session is no longer valid:
+            return False
+        session = RESTSession(
+            key=self._get_rest_session_key(),
+            ssl_session=self.ssl_session,
+            state={name: getattr(self, name) for name in self.rest_session_attributes},
+            logout=(logout_method, self.base_url + logout_path),
+            verify=self.switch.netmiko_profile.verify_hostkey,
+        )
+        if not broker.release(session=session):
+            return False
+        dprint("  REST session returned to the broker!")
+        # the session may be used by another request now, so do not share the http session and cookie jar:
+        self.ssl_session = self._new_ssl_session()
+        return True
 
     def _set_base_url(self, base_url: str):
         """Set the base URL for all REST queries, and return previous URL"""
@@ -196,6 +427,66 @@ class RESTConnector(Connector):
         # 200 without content, or likely 204 - Valid return, but No Content
         return None
 
+    def _get_many(self, uris: list, message: str = "") -> dict:
+        """GET several REST URIs at the same time, on the logged-in session, using a bounded pool of threads
+        (settings.REST_CLIENT_MAX_WORKERS). This is used for the per-interface or per-vlan sub-resources,
+        that would otherwise be read one after the other.
+
+        Args:
+            uris (list) - the proper (full) URIs to read, e.g. "/rest/v10.13/system/vlans/1/macs?depth=2"
+            message (str) - debug message added to debug_response(), and the name of the timing entry.
+
+        Returns:
+            (dict) - key is the uri, value is the json response, None if the request failed with an error status
+                     or had no content (as in _get()), or the Exception raised by the request.
+        """
+        dprint(f"RESTConnector()._get_many() for {len(uris)} uris")
+        if not message:
+            message = "_GET() Calls"
+
+        def get_uri(uri: str) -> requests.Response:
+            # runs in a worker thread. Do NOT touch any self.xxx data here!
+            start_time = time.time()
+            response = self.ssl_session.get(
+                url=self.server_url + uri,
+                headers=self.headers,
+                cookies=self.cookies,
+                verify=self.switch.netmiko_profile.verify_hostkey,
+                timeout=settings.REST_CLIENT_TIMEOUT,
+            )
+            dprint(f"  GET {uri}: {response.status_code} in {time.time() - start_time:.3f} seconds")
+            return response
+
+        uris = list(dict.fromkeys(uris))  # no need to read the same uri twice
+        start_time = time.time()
+        results = {}
+        failed = None
+        max_workers = max(1, min(settings.REST_CLIENT_MAX_WORKERS, len(uris)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(get_uri, uri): uri for uri in uris}
+            for future in concurrent.futures.as_completed(futures):
+                uri = futures[future]
+                try:
+                    response = future.result()
+                except Exception as err:
+                    results[uri] = err
+                    continue
+                debug_response(response=response, message=message)
+                if not response.ok:
+                    # keep the failed response, e.g. to check for an expired login:
+                    failed = response
+                    results[uri] = None
+                elif response.status_code == 200 and response.text:
+                    results[uri] = json.loads(response.text)
+                else:
+                    results[uri] = None
+                # note that a failed Response() is False, so do not use 'or' here:
+                self.response = response if failed is None else failed
+
+        # the real time spent, not the sum of the individual calls:
+        self.add_timing(message, len(uris), time.time() - start_time)
+        return results
+
     def _post(
         self, path: str, params: dict | None = None, data: dict | None = None, headers: dict | None = None, cookies: dict | None = None, message: str = ""
     ):
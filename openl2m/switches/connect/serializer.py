@@ -0,0 +1,281 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Serialization of the Connector() data for the session and snapshot caches.
+
+Two formats are supported, selected with settings.SWITCH_CACHE_SERIALIZER:
+
+"jsonpickle": the original format, encodes every object with full type information.
+
+"compact": a versioned, schema driven format. The known classes from switches.connect.classes
+    are encoded as lists of attribute values, with the attribute names stored once per class
+    in the schema header. A few other types (netaddr.EUI, PortList, datetime) have their own short encoding.
+    Any other object is encoded with jsonpickle. The data is prefixed with the format version and the
+    OpenL2M version, and data written by any other version is rejected with StaleCacheData.
+
+Decoding detects the format, so changing the setting does not break existing cached data.
+"""
+
+import array
+import datetime
+import json
+
+import jsonpickle
+import netaddr
+from django.conf import settings
+
+from switches.connect.classes import (
+    EthernetAddress,
+    Interface,
+    IPNetworkHostname,
+    NeighborDevice,
+    PoePort,
+    PoePSE,
+    PortList,
+    StackMember,
+    SyslogMsg,
+    Transceiver,
+    Vlan,
+    Vrf,
+)
+
+# increase this when the encoding below changes:
+COMPACT_FORMAT_VERSION = 1
+COMPACT_PREFIX = "openl2m-compact"
+
+# the classes encoded as attribute value lists, with their (short) type code:
+COMPACT_CLASSES = {
+    "I": Interface,
+    "E": EthernetAddress,
+    "N": NeighborDevice,
+    "V": Vlan,
+    "P": PoePort,
+    "S": PoePSE,
+    "T": Transceiver,
+    "M": StackMember,
+    "L": SyslogMsg,
+    "R": Vrf,
+}
+_CLASS_CODES = {cls: code for code, cls in COMPACT_CLASSES.items()}
+
+
+class StaleCacheData(ValueError):
+    """Raised when cached data was written with a different format or OpenL2M version."""
+
+
+def encode_cache_data(value) -> str:
+    """Encode a value for storage in the cache, in the format set in settings.SWITCH_CACHE_SERIALIZER
+
+    Args:
+        value: the data to encode.
+
+    Returns:
+        (str): the encoded data.
+    """
+    if settings.SWITCH_CACHE_SERIALIZER == "compact":
+        return _CompactEncoder().encode(value)
+    # keys=True ensures that integer dictionary keys are maintained! (e.g self.vlans)
+    return jsonpickle.encode(value, keys=True)
+
+
+def decode_cache_data(data: str):
+    """Decode data from the cache, in either format.
+
+    Args:
+        data (str): the encoded data.
+
+    Returns:
+        the decoded value.
+
+    Raises:
+        StaleCacheData: if the data was written with a different compact format or OpenL2M version.
+    """
+    if data.startswith(COMPACT_PREFIX):
+        return _CompactDecoder().decode(data)
+    return jsonpickle.decode(data, keys=True)
+
+
+def _header() -> str:
+    return f"{COMPACT_PREFIX}:{COMPACT_FORMAT_VERSION}:{settings.VERSION}:"
+
+
+class _CompactEncoder:
+    """
+    Encode to JSON, where every non-primitive value is a list with a type tag as first element:
+        ["l", items...]  list
+        ["t", items...]  tuple
+        ["s", items...]  set
+        ["d", key1, value1, key2, value2...]  dictionary, keys keep their type
+        ["o", code, values...]  known class, values in the order of the attribute names in the schema
+        ["k", code, name1, value1, name2, value2...]  known class with attributes that differ from the schema
+        ["e", int]  netaddr.EUI
+        ["h", cidr, hostname]  IPNetworkHostname
+        ["b", hex]  PortList
+        ["z", isoformat]  datetime
+        ["j", jsonpickle]  anything else
+    """
+
+    def __init__(self):
+        # the attribute names of each known class, as found on the first object encoded.
+        self.schemas: dict[str, tuple] = {}
+        self.encoders = {
+            str: self._primitive,
+            int: self._primitive,
+            bool: self._primitive,
+            float: self._primitive,
+            type(None): self._primitive,
+            list: self._list,
+            tuple: self._tuple,
+            set: self._set,
+            dict: self._dict,
+            netaddr.EUI: self._eui,
+            IPNetworkHostname: self._ip_network,
+            PortList: self._portlist,
+            datetime.datetime: self._datetime,
+        }
+        for cls in COMPACT_CLASSES.values():
+            self.encoders[cls] = self._object
+
+    def encode(self, value) -> str:
+        data = self._encode(value)
+        return _header() + json.dumps([self.schemas, data], separators=(",", ":"))
+
+    def _encode(self, value):
+        encoder = self.encoders.get(type(value), self._jsonpickle)
+        return encoder(value)
+
+    def _primitive(self, value):
+        return value
+
+    def _list(self, value):
+        return ["l", *map(self._encode, value)]
+
+    def _tuple(self, value):
+        return ["t", *map(self._encode, value)]
+
+    def _set(self, value):
+        return ["s", *map(self._encode, value)]
+
+    def _dict(self, value):
+        data = ["d"]
+        for key, item in value.items():
+            data.append(self._encode(key))
+            data.append(self._encode(item))
+        return data
+
+    def _object(self, value):
+        code = _CLASS_CODES[type(value)]
+        attributes = value.__dict__
+        schema = self.schemas.get(code)
+        if schema is None:
+            schema = tuple(attributes)
+            self.schemas[code] = schema
+        if len(schema) == len(attributes) and schema == tuple(attributes):
+            return ["o", code, *map(self._encode, attributes.values())]
+        # this object has different attributes (e.g. set by a driver), so encode by name
+        data = ["k", code]
+        for name, item in attributes.items():
+            data.append(name)
+            data.append(self._encode(item))
+        return data
+
+    def _eui(self, value):
+        return ["e", int(value)]
+
+    def _ip_network(self, value):
+        return ["h", str(value), value.hostname]
+
+    def _portlist(self, value):
+        return ["b", value.portlist.tobytes().hex()]
+
+    def _datetime(self, value):
+        return ["z", value.isoformat()]
+
+    def _jsonpickle(self, value):
+        return ["j", jsonpickle.encode(value, keys=True)]
+
+
+class _CompactDecoder:
+    """Decode the data written by _CompactEncoder()"""
+
+    def __init__(self):
+        self.schemas: dict[str, list] = {}
+        self.decoders = {
+            "l": self._list,
+            "t": self._tuple,
+            "s": self._set,
+            "d": self._dict,
+            "o": self._object,
+            "k": self._object_by_name,
+            "e": self._eui,
+            "h": self._ip_network,
+            "b": self._portlist,
+            "z": self._datetime,
+            "j": self._jsonpickle,
+        }
+
+    def decode(self, data: str):
+        header = _header()
+        if not data.startswith(header):
+            raise StaleCacheData(f"Cached data format '{data[:40]}' does not match '{header}'")
+        self.schemas, value = json.loads(data[len(header) :])
+        return self._decode(value)
+
+    def _decode(self, value):
+        if isinstance(value, list):
+            return self.decoders[value[0]](value)
+        return value
+
+    def _list(self, value):
+        return [self._decode(item) for item in value[1:]]
+
+    def _tuple(self, value):
+        return tuple(self._decode(item) for item in value[1:])
+
+    def _set(self, value):
+        return {self._decode(item) for item in value[1:]}
+
+    def _dict(self, value):
+        decode = self._decode
+        return {decode(value[i]): decode(value[i + 1]) for i in range(1, len(value), 2)}
+
+    def _object(self, value):
+        obj = COMPACT_CLASSES[value[1]].__new__(COMPACT_CLASSES[value[1]])
+        obj.__dict__.update(zip(self.schemas[value[1]], map(self._decode, value[2:])))
+        return obj
+
+    def _object_by_name(self, value):
+        obj = COMPACT_CLASSES[value[1]].__new__(COMPACT_CLASSES[value[1]])
+        for i in range(2, len(value), 2):
+            obj.__dict__[value[i]] = self._decode(value[i + 1])
+        return obj
+
+    def _eui(self, value):
+        return netaddr.EUI(value[1], dialect=settings.MAC_DIALECT)
+
+    def _ip_network(self, value):
+        network = IPNetworkHostname(netaddr.IPNetwork(value[1]))
+        network.hostname = value[2]
+        return network
+
+    def _portlist(self, value):
+        portlist = PortList()
+        portlist.portlist = array.array("B", bytes.fromhex(value[1]))
+        return portlist
+
+    def _datetime(self, value):
+        return datetime.datetime.fromisoformat(value[1])
+
+    def _jsonpickle(self, value):
+        return jsonpickle.decode(value[1], keys=True)
@@ -0,0 +1,132 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Shared device snapshot cache.
+
+When settings.SWITCH_CACHE_BACKEND is not "session", the data read from a device is stored
+as a single serialized "snapshot" in the Django cache named "switches" (local memory, file or Redis).
+Snapshots are keyed by switch id and a data "generation". The generation is increased every time
+new data is saved, so all users of a device will see the latest data.
+The Django cache backend handles the time-to-live (TIMEOUT) and eviction (MAX_ENTRIES or Redis policy).
+Each snapshot also stores the time the device was read, so the background poller (manage.py pollswitches)
+can tell how fresh the data is.
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+from switches.utils import dprint
+
+# the name of the Django cache used for switch snapshots, see settings.CACHES
+SNAPSHOT_CACHE_NAME = "switches"
+
+
+def snapshot_cache_enabled() -> bool:
+    """Return True if device data is cached in the shared snapshot cache, False if in the user session."""
+    return settings.SWITCH_CACHE_BACKEND != "session"
+
+
+def _generation_key(switch_id: int) -> str:
+    return f"switch:{switch_id}:generation"
+
+
+def _snapshot_key(switch_id: int, generation: int) -> str:
+    return f"switch:{switch_id}:snapshot:{generation}"
+
+
+def _timestamp_key(switch_id: int) -> str:
+    return f"switch:{switch_id}:timestamp"
+
+
+def get_snapshot(switch_id: int) -> tuple[int, str | None]:
+    """Get the most recent snapshot of the device data.
+
+    Args:
+        switch_id (int): the Switch().id of the device.
+
+    Returns:
+        (generation, data): the current data generation, and the serialized snapshot data,
+                            or None if there is no (valid) snapshot.
+    """
+    cache = caches[SNAPSHOT_CACHE_NAME]
+    generation = cache.get(_generation_key(switch_id))
+    if generation is None:
+        dprint(f"get_snapshot({switch_id}): no generation found")
+        return (0, None)
+    data = cache.get(_snapshot_key(switch_id, generation))
+    dprint(f"get_snapshot({switch_id}): generation {generation}, found = {data is not None}")
+    return (generation, data)
+
+
+def save_snapshot(switch_id: int, data: str, timestamp: float = 0) -> int:
+    """Save a new snapshot of the device data, as the next data generation.
+
+    Args:
+        switch_id (int): the Switch().id of the device.
+        data (str): the serialized device data.
+        timestamp (float): the time.time() the data was read from the device, defaults to now.
+
+    Returns:
+        (int): the generation number of the saved data.
+    """
+    cache = caches[SNAPSHOT_CACHE_NAME]
+    key = _generation_key(switch_id)
+    # add() only sets the key if it does not exist yet:
+    cache.add(key, 0, timeout=None)
+    try:
+        generation = cache.incr(key)
+    except ValueError:
+        # key was evicted between add() and incr()
+        generation = 1
+        cache.set(key, generation, timeout=None)
+    cache.set(_snapshot_key(switch_id, generation), data)
+    cache.set(_timestamp_key(switch_id), timestamp or time.time())
+    dprint(f"save_snapshot({switch_id}): generation {generation}")
+    # the previous generation is no longer needed:
+    cache.delete(_snapshot_key(switch_id, generation - 1))
+    return generation
+
+
+def get_snapshot_age(switch_id: int) -> float | None:
+    """Get the age of the current snapshot of the device data.
+
+    Args:
+        switch_id (int): the Switch().id of the device.
+
+    Returns:
+        (float): the number of seconds since the data was read from the device, or None if there is no snapshot.
+    """
+    timestamp = caches[SNAPSHOT_CACHE_NAME].get(_timestamp_key(switch_id))
+    if timestamp is None:
+        return None
+    return time.time() - timestamp
+
+
+def delete_snapshot(switch_id: int):
+    """Remove the current snapshot of the device, so the next access will read the device again.
+
+    Args:
+        switch_id (int): the Switch().id of the device.
+
+    Returns:
+        none
+    """
+    cache = caches[SNAPSHOT_CACHE_NAME]
+    generation = cache.get(_generation_key(switch_id))
+    if generation is not None:
+        dprint(f"delete_snapshot({switch_id}): generation {generation}")
+        cache.delete(_snapshot_key(switch_id, generation))
+    cache.delete(_timestamp_key(switch_id))
@@ -115,6 +115,20 @@ class SnmpConnectorArubaCx(SnmpConnector):
         # setting this to True disables prompt checking, and uses send_command_timing() calls.
         self.netmiko_ignore_prompt = True
 
+        # we read vlan data from the IEEE Q-Bridge mib, see _get_vlan_data()
+        self.snmp_concurrent_vlan_branches = [
+            "ieee8021QBridgeVlanStaticName",
+            "ieee8021QBridgePvid",
+            "ieee8021QBridgeVlanCurrentEgressPorts",
+            "ieee8021QBridgeVlanStaticUntaggedPorts",
+            "ieee8021QBridgeVlanStaticEgressPorts",
+        ]
+        self.snmp_refresh_branches = [
+            ("ifAlias", "_parse_mibs_if_x_table"),
+            ("ieee8021QBridgePvid", "_parse_mibs_ieee_qbridge_pvid"),
+        ]
+        self.snmp_refresh_vlan_branch = "ieee8021QBridgeVlanStaticName"
+
         # we recommend using the AOS-CX API driver, tell the user so:
         self.add_warning(
             warning="For full functionality with this device use the AOS-CX API driver!. Please contact your OpenL2M administrator!",
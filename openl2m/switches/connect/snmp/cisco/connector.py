@@ -26,7 +26,7 @@ from django.http.request import HttpRequest
 
 from switches.models import Switch, SwitchGroup
 from switches.constants import LOG_TYPE_ERROR, LOG_SAVE_SWITCH, LOG_PORT_POE_FAULT, SNMP_VERSION_2C
-from switches.connect.classes import Interface, Transceiver, SyslogMsg
+from switches.connect.classes import Interface, PortList, Transceiver, SyslogMsg
 
 # from switches.connect.connector import Connector
 from switches.connect.constants import poe_status_name, POE_PORT_DETECT_FAULT, VLAN_TYPE_NORMAL
@@ -137,6 +137,17 @@ class SnmpConnectorCisco(SnmpConnector):
         # this is then used by portIfIndex to map 'stack id' to 'ifIndex'
         self.cisco_port_type_by_stack_id = {}
 
+        # we read vlan data from the VTP mib, see _get_vlan_data(), and add to the interface data:
+        self.snmp_concurrent_vlan_branches = ["vtpVlanState"]
+        self.snmp_concurrent_branches.append("cL2L3IfModeOper")
+        # and the untagged vlans for an incremental refresh, see refresh_my_basic_info()
+        self.snmp_refresh_branches = [
+            ("ifAlias", "_parse_mibs_if_x_table"),
+            ("vlanTrunkPortNativeVlan", "_parse_mibs_cisco_vtp"),
+            ("vmVlan", "_parse_mibs_cisco_vlan"),
+        ]
+        self.snmp_refresh_vlan_branch = "vtpVlanState"
+
     def _get_interface_data(self) -> bool:
         """
         Implement an override of the interface parsing routine,
@@ -252,16 +263,38 @@ class SnmpConnectorCisco(SnmpConnector):
         Return True on success (0 or more found), False on errors
         """
         dprint("SnmpConnectorCisco._get_known_ethernet_addresses()")
+        # little hack for Cisco devices, to see various vlan-specific tables:
+        contexts = {}
         for vlan_id in self.vlans:
-            # little hack for Cisco devices, to see various vlan-specific tables:
-            self.vlan_id_context = int(vlan_id)
-            com_or_ctx = ""
+            if settings.SNMP_SKIP_INACTIVE_VLANS and not self._vlan_has_active_interface(int(vlan_id)):
+                dprint(f"  Skipping vlan {vlan_id}, no active interfaces")
+                continue
             if self.switch.snmp_profile.version == SNMP_VERSION_2C:
                 # for v2, set community string to "Cisco format"
-                com_or_ctx = f"{self.switch.snmp_profile.community}@{vlan_id}"
+                contexts[int(vlan_id)] = f"{self.switch.snmp_profile.community}@{vlan_id}"
             else:
                 # v3, set context to "Cisco format":
-                com_or_ctx = f"vlan-{vlan_id}"
+                contexts[int(vlan_id)] = f"vlan-{vlan_id}"
+
+        if settings.SNMP_MAX_CONTEXT_WORKERS > 1 and len(contexts) > 1:
+            # walk all vlan contexts concurrently, and then parse in vlan order:
+            results = self.walk_snmp_contexts(
+                contexts=contexts, branch_names=["dot1dBasePortIfIndex", "dot1dTpFdbPort"]
+            )
+            if results is None:
+                return False
+            parsers = {
+                "dot1dBasePortIfIndex": self._parse_mibs_dot1d_port_to_ifindex_map,
+                "dot1dTpFdbPort": self._parse_mibs_dot1d_bridge_eth,
+            }
+            for vlan_id in contexts:
+                self.vlan_id_context = vlan_id
+                self.parse_snmp_context_items(results=results[vlan_id], parsers=parsers)
+            self.vlan_id_context = 0
+            return True
+
+        for vlan_id, com_or_ctx in contexts.items():
+            self.vlan_id_context = vlan_id
             self._set_snmp_session(com_or_ctx)
             # first map Q-Bridge ports to ifIndexes:
             retval = self.get_snmp_branch(
@@ -281,6 +314,23 @@ class SnmpConnectorCisco(SnmpConnector):
         self._set_snmp_session()
         return True
 
+    def _vlan_has_active_interface(self, vlan_id: int) -> bool:
+        """
+        Check if any interface that is up has this vlan as untagged, tagged or voice vlan.
+
+        Args:
+            vlan_id (int): the vlan to check.
+
+        Returns:
+            (bool): True if an active interface is on this vlan.
+        """
+        for iface in self.interfaces.values():
+            if iface.oper_status and (
+                iface.untagged_vlan == vlan_id or iface.voice_vlan == vlan_id or vlan_id in iface.vlans
+            ):
+                return True
+        return False
+
     def _get_poe_data(self) -> int:
         """
         Implement reading Cisco-specific PoE mib.
@@ -834,41 +884,17 @@ class SnmpConnectorCisco(SnmpConnector):
         Parse the 128 byte vlan bitmap entry from vlanTrunkPortVlansEnabled* entries
         to find the vlans on a trunk interface.
         val - the snmp return value for the vlanTrunkPortVlansEnabled* mib value.
+              EzSnmp v2 returns this as hexadecimal bytes, e.g. "00 40 00 C0 ..."
         vlan_base - 0, 1024, 2048 or 3072, for the 0, 2k, 3k, or 4k versions
         iface -  the interface these vlans belong to.
         return -1 on error, 0 otherwize
         """
-        offset = 0  # bit-offset in the byte
-        for byte in val:
-            byte = ord(byte)
-            # which bits are set? A hack but it works!
-            # note that the bits are actually in system order,
-            # ie. bit 1 is first bit in stream, i.e. HIGH order bit!
-            if byte & 128:
-                vlan_id = (offset * 8) + vlan_base
-                self.add_vlan_to_interface(iface, vlan_id)
-            if byte & 64:
-                vlan_id = (offset * 8) + 1 + vlan_base
-                self.add_vlan_to_interface(iface, vlan_id)
-            if byte & 32:
-                vlan_id = (offset * 8) + 2 + vlan_base
-                self.add_vlan_to_interface(iface, vlan_id)
-            if byte & 16:
-                vlan_id = (offset * 8) + 3 + vlan_base
-                self.add_vlan_to_interface(iface, vlan_id)
-            if byte & 8:
-                vlan_id = (offset * 8) + 4 + vlan_base
-                self.add_vlan_to_interface(iface, vlan_id)
-            if byte & 4:
-                vlan_id = (offset * 8) + 5 + vlan_base
-                self.add_vlan_to_interface(iface, vlan_id)
-            if byte & 2:
-                vlan_id = (offset * 8) + 6 + vlan_base
-                self.add_vlan_to_interface(iface, vlan_id)
-            if byte & 1:
-                vlan_id = (offset * 8) + 7 + vlan_base
+        # note that the bits are in system order, ie. bit 1 is the HIGH order bit of the first byte!
+        bitmap = PortList()
+        bitmap.from_hexadecimal(val)
+        for vlan_ids in bitmap.iter_set_bits(first=vlan_base):
+            for vlan_id in vlan_ids:
                 self.add_vlan_to_interface(iface, vlan_id)
-            offset += 1     # noqa: SIM113 Use `enumerate()` for index variable `offset` in `for` loop
         return True
 
     def _parse_mibs_cisco_config(self, oid: str, val: str) -> bool:
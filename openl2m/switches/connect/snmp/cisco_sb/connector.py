@@ -108,6 +108,13 @@ class SnmpConnectorCiscoSB(SnmpConnectorCisco):
         # Small Business devices (newer style) use the 'standard' Q-Bridge mibs. We will use this when we read vlan data.
         # see self._get_vlan_data() below.
         self.add_more_info(category="System", name="Hw Type", value="Cisco Small Business")
+        # and the untagged vlans for an incremental refresh, see refresh_my_basic_info()
+        self.snmp_refresh_branches = [
+            ("ifAlias", "_parse_mibs_if_x_table"),
+            ("dot1qPvid", "_parse_mibs_vlan_dot1q_pvid"),
+            ("vlanAccessPortModeVlanId", "_parse_mibs_sb_access_vlan"),
+        ]
+        self.snmp_refresh_vlan_branch = "dot1qVlanStaticRowStatus"
 
     def _get_interface_data(self) -> bool:
         """
@@ -20,8 +20,12 @@ Various vendor specific implementations that augment this class exist.
 # note that we use v3 of the new pysnmp HLAPI. This uses asyncio, instead of the old synchronous.
 # see https://docs.lextudio.com/pysnmp/v7.1/
 import asyncio
+import concurrent.futures
 import datetime
+import hashlib
 import pprint
+import queue
+import threading
 import time
 import traceback
 
@@ -133,6 +137,7 @@ from switches.connect.snmp.constants import (
     ifDescr,
     ifHighSpeed,
     ifIndex,
+    ifLastChange,
     ifMauType,
     ifMtu,
     ifName,
@@ -182,6 +187,7 @@ from switches.connect.snmp.constants import (
     vlan_createAndGo,
     vlan_destroy,
 )
+from switches.connect.snmp.dispatch import OidDispatcher
 from switches.connect.snmp.utils import (
     hex_string_to_ethernet,
     hex_string_to_ip,
@@ -216,7 +222,84 @@ from switches.constants import (
     SNMP_VERSION_3,
 )
 from switches.models import Log, Switch, SwitchGroup
-from switches.utils import dprint, get_remote_ip
+from switches.utils import BackgroundWorker, dprint, get_process_object, get_remote_ip
+
+
+class PysnmpEngine(BackgroundWorker):
+    """
+    Long-lived pysnmp engines for this process, with their own asyncio event loop in a background thread.
+    pysnmpHelper() runs its SET requests on this loop, instead of creating a new event loop, SnmpEngine()
+    and UDP transport for every request.
+
+    There is one SnmpEngine() per SNMP profile (and its credentials), with the auth data of that profile.
+    This way SNMPv3 users with the same name in different profiles do not share keys,
+    and the engine ids discovered and keys localized for each device are kept for the next request.
+    """
+
+    thread_name = "openl2m-pysnmp"
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.lock = threading.Lock()
+        # key is the profile key, value is (SnmpEngine(), auth data):
+        self.engines: dict[tuple, tuple] = {}
+        # key is (profile key, address), value is the UdpTransportTarget():
+        self.targets: dict[tuple, UdpTransportTarget] = {}
+        self.requests = 0
+
+    def run(self, coroutine):
+        """Run a coroutine on the event loop of the engines, and wait for the result."""
+        with self.lock:
+            self.requests += 1
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def get_engine(self, profile_key: tuple, auth_data) -> tuple:
+        """
+        Get the engine of an SNMP profile. Only call this from a coroutine running on our loop!
+
+        Args:
+            profile_key (tuple): the SNMP profile, and a hash of its credentials.
+            auth_data: the CommunityData() or UsmUserData() of the profile, used if the engine is new.
+
+        Returns:
+            (tuple): the SnmpEngine(), and the auth data to use with it.
+        """
+        if profile_key not in self.engines:
+            dprint(f"PysnmpEngine.get_engine(): new engine for profile {profile_key[0]}")
+            self.engines[profile_key] = (SnmpEngine(), auth_data)
+        return self.engines[profile_key]
+
+    async def get_target(self, profile_key: tuple, address: tuple) -> UdpTransportTarget:
+        """Get the transport target of a device. Only call this from a coroutine running on our loop!"""
+        key = (profile_key, address)
+        if key not in self.targets:
+            self.targets[key] = await UdpTransportTarget.create(address)
+        return self.targets[key]
+
+    def close(self):
+        """Close the dispatchers of all engines, and stop the loop, e.g. when the process exits."""
+
+        async def close_engines():
+            for engine, _ in self.engines.values():
+                engine.close_dispatcher()
+            self.engines = {}
+            self.targets = {}
+
+        try:
+            asyncio.run_coroutine_threadsafe(close_engines(), self.loop).result(timeout=5)
+        except Exception as err:
+            dprint(f"PysnmpEngine.close() error: {err}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _run(self):
+        """Run the event loop of the engines."""
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+
+def get_pysnmp_engine() -> PysnmpEngine:
+    """Get the process-wide pysnmp engine."""
+    return get_process_object("pysnmp-engine", PysnmpEngine)
 
 
 class pysnmpHelper:
@@ -242,6 +325,7 @@ class pysnmpHelper:
         if not self._set_auth_data():
             # cannot set auth data, throw an exception:
             raise Exception(f"{self.error.description}: {self.error.details}")
+        self._profile_key = self._get_profile_key()
 
     # async def run_get(self, oid: str):
 
@@ -301,12 +385,17 @@ class pysnmpHelper:
         """
         dprint("pysnmpHelper.run_set_oids_values() running...")
 
-        snmpEngine = SnmpEngine()
+        # the long-lived engine and transport of this profile and device:
+        engine = get_pysnmp_engine()
+        snmpEngine, auth_data = engine.get_engine(profile_key=self._profile_key, auth_data=self._auth_data)
+        target = await engine.get_target(
+            profile_key=self._profile_key, address=(self.switch.primary_ip4, self.switch.snmp_profile.udp_port)
+        )
 
         iterator = set_cmd(
             snmpEngine,
-            self._auth_data,
-            await UdpTransportTarget.create((self.switch.primary_ip4, self.switch.snmp_profile.udp_port)),
+            auth_data,
+            target,
             ContextData(),
             *oids_values,
             lookupMib=False,
@@ -319,7 +408,6 @@ class pysnmpHelper:
             self.error.description = "An SNMP error occurred!"
             self.error.details = f"ERROR 'errorIndication' pySNMP Engine: {pprint.pformat(errorStatus)} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
             dprint("pysnmp.run_set_oids_values() SNMP engine error!")
-            snmpEngine.close_dispatcher()
             return False
 
         if errorStatus:
@@ -327,7 +415,6 @@ class pysnmpHelper:
             self.error.description = "An SNMP error occurred!"
             self.error.details = f"ERROR 'errorStatus' in pySNMP PDU: {pprint.pformat(errorStatus)} at {errorIndex and varBinds[int(errorIndex) - 1][0] or '?'}"
             dprint("pysnmp.run_set_oids_values() SNMP PDU error!")
-            snmpEngine.close_dispatcher()
             return False
 
         dprint("pysnmpHelper.run_set_oids_values() OK!")
@@ -354,8 +441,10 @@ class pysnmpHelper:
             return False
 
         dprint("pysnmpHelper.set_oids_values() about to call async")
-        # we now call the worker function to perform this asynchronously
-        retval = asyncio.run(self.run_set_oids_values(oids_values=oids_values))
+        # we now call the worker function to perform this asynchronously, on the long-lived engine loop:
+        start_time = time.time()
+        retval = get_pysnmp_engine().run(self.run_set_oids_values(oids_values=oids_values))
+        dprint(f"pysnmpHelper.set_oids_values() took {time.time() - start_time:.3f} seconds")
 
         if not retval:
             dprint("pysnmpHelper().set_oids_values() returns False")
@@ -395,6 +484,46 @@ class pysnmpHelper:
         # now call set_oids_values() to do the work:
         return self.set_oids_values(oids_values)
 
+    def set_batched(self, oid_values: list) -> bool:
+        """
+        Set multiple OIDs that do not need to be set together, with up to settings.SNMP_SET_MAX_VARBINDS
+        in a single snmp set(). If the device does not accept a batch, e.g. as the packet is too big,
+        the OIDs of that batch are set one at a time.
+
+        Args:
+            oid_values (list): list of tuples (oid, value), as in set_multiple()
+
+        Returns:
+            (bool): True if all OIDs are set. On failure, returns False, and self.error.X will be set
+        """
+        dprint(f"pysnmpHelper.set_batched() for {len(oid_values)} oids")
+        batch_size = max(settings.SNMP_SET_MAX_VARBINDS, 1)
+        for start in range(0, len(oid_values), batch_size):
+            batch = oid_values[start : start + batch_size]
+            if len(batch) > 1:
+                if self.set_multiple(batch):
+                    continue
+                dprint(f"  batch of {len(batch)} failed: {self.error.details}, setting one at a time")
+            for oid, value in batch:
+                if not self.set(oid, value):
+                    return False
+        return True
+
+    def _get_profile_key(self) -> tuple:
+        """The SNMP profile, and a hash of its credentials, as key to the long-lived engine of that profile."""
+        profile = self.switch.snmp_profile
+        credentials = (
+            profile.version,
+            profile.community,
+            profile.username,
+            profile.passphrase,
+            profile.priv_passphrase,
+            profile.sec_level,
+            profile.auth_protocol,
+            profile.priv_protocol,
+        )
+        return (profile.id, hashlib.sha256(repr(credentials).encode()).hexdigest())
+
     def _set_auth_data(self) -> bool:
         """
         Set the UsmUserData() for v3 or CommunityData() for v2 based on the device snmp_profile.
@@ -565,6 +694,75 @@ class SnmpConnector(Connector):
     Note: in "vendors" folder are several classes that implement vendor-specific parts of this generic class.
     """
 
+    # The column handlers used by _parse_mibs_by_column(), per table parser. For each table, key is the OID branch,
+    # value is the name of the method that parses that branch. The method is called with
+    # the part of the OID after the branch (e.g. the ifIndex), and the value.
+    # A table parser only handles the branches of its own table.
+    # Vendor classes can add or replace handlers by setting their own snmp_column_handlers,
+    # these are merged per table with the handlers of the parent classes, see get_oid_dispatcher().
+    snmp_column_handlers = {
+        # IF-MIB ifTable, see _parse_mibs_if_table():
+        "if_table": {
+            ifIndex: "_parse_column_if_index",
+            ifDescr: "_parse_column_if_descr",
+            ifType: "_parse_column_if_type",
+            ifMtu: "_parse_column_if_mtu",
+            ifSpeed: "_parse_column_if_speed",
+            ifPhysAddress: "_parse_column_if_phys_address",
+            ifAdminStatus: "_parse_column_if_admin_status",
+            ifOperStatus: "_parse_column_if_oper_status",
+            ifLastChange: "_parse_column_if_last_change",
+        },
+        # IF-MIB ifXTable, see _parse_mibs_if_x_table():
+        "if_x_table": {
+            ifName: "_parse_column_if_name",
+            ifAlias: "_parse_column_if_alias",
+            ifHighSpeed: "_parse_column_if_high_speed",
+        },
+        # POWER-ETHERNET-MIB, see _parse_mibs_poe_port().
+        # pethPsePortPowerPriority and pethPsePortType are currently not used:
+        "poe_port": {
+            pethPsePortAdminEnable: "_parse_column_peth_pse_port_admin_enable",
+            pethPsePortDetectionStatus: "_parse_column_peth_pse_port_detection_status",
+        },
+        # LLDP-MIB lldpRemTable, see _parse_mibs_lldp():
+        "lldp": {
+            lldpRemPortId: "_parse_column_lldp_rem_port_id",
+            lldpRemPortIdSubType: "_parse_column_lldp_rem_port_id_sub_type",
+            lldpRemPortDesc: "_parse_column_lldp_rem_port_desc",
+            lldpRemSysName: "_parse_column_lldp_rem_sys_name",
+            lldpRemSysDesc: "_parse_column_lldp_rem_sys_desc",
+            lldpRemSysCapEnabled: "_parse_column_lldp_rem_sys_cap_enabled",
+            lldpRemChassisIdSubtype: "_parse_column_lldp_rem_chassis_id_subtype",
+            lldpRemChassisId: "_parse_column_lldp_rem_chassis_id",
+        },
+    }
+
+    @classmethod
+    def get_oid_dispatcher(cls, table: str) -> OidDispatcher:
+        """
+        Get the OID dispatcher of a table parser for this class, with the snmp_column_handlers of that table
+        in this class and all parent classes. This is built once per class and table.
+
+        Args:
+            table (str): the table parser, a key in snmp_column_handlers, e.g. "if_table".
+
+        Returns:
+            (OidDispatcher): the dispatcher object.
+        """
+        dispatchers = cls.__dict__.get("_oid_dispatchers")
+        if dispatchers is None:
+            dispatchers = {}
+            cls._oid_dispatchers = dispatchers
+        dispatcher = dispatchers.get(table)
+        if dispatcher is None:
+            handlers = {}
+            for klass in reversed(cls.__mro__):
+                handlers.update(klass.__dict__.get("snmp_column_handlers", {}).get(table, {}))
+            dispatcher = OidDispatcher(handlers)
+            dispatchers[table] = dispatcher
+        return dispatcher
+
     def __init__(self, request: HttpRequest, group: SwitchGroup, switch: Switch):
         """
         Initialize the SNMP object
@@ -639,6 +837,53 @@ class SnmpConnector(Connector):
         attributes to track ezsnmp library
         """
         self._snmp_session = False  # ezsnmp session object
+        # raw results of branches walked concurrently, keyed by branch name, see prefetch_snmp_branches()
+        self._snmp_prefetch: dict[str, tuple] = {}
+        # the branches read by get_my_basic_info() that do not depend on each other, and can be walked
+        # concurrently before parsing. Sub-classes can add to these lists, or change them if they
+        # override the functions that read them (eg. _get_vlan_data() for a vendor specific vlan mib)
+        self.snmp_concurrent_branches = [
+            "system",
+            "ifIndex",
+            "ifType",
+            "ifAdminStatus",
+            "ifOperStatus",
+            "ifName",
+            "ifAlias",
+            "ifHighSpeed",
+            "dot3StatsDuplexStatus",
+            "ipAdEntIfIndex",
+            "ipv6AddrPfxLength",
+            "ipAddressIfIndex",
+            "dot3adAggActorAdminKey",
+            "pethMainPseEntry",
+            "ifMauType",
+        ]
+        self.snmp_concurrent_vlan_branches = [
+            "dot1qBase",
+            "dot1dBasePortIfIndex",
+            "dot1qVlanStaticRowStatus",
+            "dot1qPvid",
+            "dot1qVlanCurrentEgressPorts",
+            "dot1qVlanStaticEgressPorts",
+            "ieee8021QBridgeMvrpEnabledStatus",
+        ]
+        if settings.RELOAD_INCREMENTAL:
+            # when the oper status last changed, only used by refresh_my_basic_info()
+            self.snmp_concurrent_branches.append("ifLastChange")
+        # the number of items found in each branch walked, see _parse_snmp_branch_items()
+        self.snmp_branch_counts: dict[str, int] = {}
+        # incremental refresh, see refresh_my_basic_info(). These branches are walked again on every refresh,
+        # as changes to them do not update ifLastChange. Entries are tuples of (branch name, parser method name).
+        # Sub-classes that read the untagged vlan from a vendor mib should change this.
+        self.snmp_refresh_branches = [
+            ("ifAlias", "_parse_mibs_if_x_table"),
+            ("dot1qPvid", "_parse_mibs_vlan_dot1q_pvid"),
+        ]
+        # the branch that lists the vlans. If the number of vlans changes, we read everything again.
+        self.snmp_refresh_vlan_branch = "dot1qVlanStaticRowStatus"
+        # if more interfaces changed, we walk the interface status branches instead of reading each interface.
+        self.snmp_refresh_max_gets = 8
         # initialize the snmp "connection/session"
         if not self._set_snmp_session():
             dprint("   ERROR: cannot get SNMP session!")
@@ -647,6 +892,7 @@ class SnmpConnector(Connector):
 
         # caching related. Add attributes that do not get cached:
         self.set_do_not_cache_attribute("_snmp_session")
+        self.set_do_not_cache_attribute("_snmp_prefetch")
         self.set_do_not_cache_attribute("poe_port_entries")
 
     ##########################################
@@ -668,10 +914,30 @@ class SnmpConnector(Connector):
 
         """
         dprint("_set_snmp_session()")
+        session = self._get_new_snmp_session(com_or_ctx=com_or_ctx)
+        if session is None:
+            return False
+        self._snmp_session = session
+        return True
+
+    def _get_new_snmp_session(self, com_or_ctx: str = ""):
+        """
+        Create a new ezsnmp Session() object for this device, using the snmp profile settings.
+        This is used for the main session of the connector, and for the pool of sessions
+        used by the concurrent branch walks in prefetch_snmp_branches().
+
+        params:
+            com_or_ctx - the community to override the snmp profile settings if v2,
+                         or the snmp v3 context to use.
+
+        Return:
+            (ezsnmp.Session) - the new session object, or None on failure.
+        """
+        dprint("_get_new_snmp_session()")
         if not self.switch.snmp_profile:
             # should never happen!
             dprint("  ERROR: switch.snmp_profile NOT set!")
-            return False
+            return None
 
         snmp_profile = self.switch.snmp_profile
         if snmp_profile.version == SNMP_VERSION_2C:
@@ -683,7 +949,7 @@ class SnmpConnector(Connector):
                 # use profile setting
                 community = snmp_profile.community
             try:
-                self._snmp_session = ezsnmp.Session(
+                session = ezsnmp.Session(
                     hostname=self.switch.primary_ip4,
                     version=snmp_profile.version,
                     community=community,
@@ -700,9 +966,9 @@ class SnmpConnector(Connector):
                 self.add_log(
                     description=f"ERROR with snmp v2 session: {err}", type=LOG_TYPE_ERROR, action=LOG_SNMP_ERROR
                 )
-                return False
+                return None
 
-            return True
+            return session
 
         # everything else is version 3
         if snmp_profile.version == SNMP_VERSION_3:
@@ -732,7 +998,7 @@ class SnmpConnector(Connector):
                 elif snmp_profile.auth_protocol == SNMP_V3_AUTH_SHA512:
                     auth_protocol = "SHA-512"
                 else:
-                    return False
+                    return None
 
             # AuthPriv
             elif snmp_profile.sec_level == SNMP_V3_SECURITY_AUTH_PRIV:
@@ -753,7 +1019,7 @@ class SnmpConnector(Connector):
                     auth_protocol = "SHA-512"
                 else:
                     dprint(f"Invalid AUTH protocol: {snmp_profile.auth_protocol}")
-                    return False
+                    return None
 
                 # priv protocols next:
                 if snmp_profile.priv_protocol == SNMP_V3_PRIV_DES:
@@ -770,12 +1036,12 @@ class SnmpConnector(Connector):
                     privacy_protocol = "AES-256C"
                 else:
                     dprint(f"Invalid PRIV protocol: {snmp_profile.priv_protocol}")
-                    return False
+                    return None
 
             else:
                 # should never happen:
                 dprint(f"  Unknown auth-priv security level: {snmp_profile.sec_level}")
-                return False
+                return None
 
             # now try to connect with SNMP v3:
             dprint(f"  Trying v3 with: sec_level={security_level}, auth={auth_protocol}, priv={privacy_protocol}")
@@ -788,7 +1054,7 @@ class SnmpConnector(Connector):
             else:
                 priv_passphrase = snmp_profile.priv_passphrase
             try:
-                self._snmp_session = ezsnmp.Session(
+                session = ezsnmp.Session(
                     hostname=self.switch.primary_ip4,
                     version=snmp_profile.version,
                     port_number=snmp_profile.udp_port,
@@ -807,24 +1073,23 @@ class SnmpConnector(Connector):
                     privacy_passphrase=priv_passphrase,
                     context=str(com_or_ctx),
                 )
-                return True
+                return session
 
             except Exception as err:
                 dprint(f"ERROR with snmp v3 session: {err!r}")
                 self.add_log(
                     description=f"ERROR with snmp v3 session: {err}", type=LOG_TYPE_ERROR, action=LOG_SNMP_ERROR
                 )
-                return False
+                return None
 
         # unknown SNMP version - this *should* never happen:
-        self._snmp_session = False
         self.add_log(
             description=f"ERROR: UNKNOWN snmp version '{snmp_profile.version}'",
             type=LOG_TYPE_ERROR,
             action=LOG_SNMP_ERROR,
         )
         dprint("UNKNOWN snmp version!")
-        return False
+        return None
 
     # The following methods implement basic snmp functionality based on the ezsnmp library (for speed reasons).
     # If you want to use some other snmp library, inherit from SnmpConnector()
@@ -923,8 +1188,18 @@ class SnmpConnector(Connector):
             return -1
 
         start_oid = snmp_mib_variables[branch_name]
-        # Perform an SNMP walk
         self.error.clear()
+
+        # see if this branch was already walked concurrently by prefetch_snmp_branches()
+        # if so, we only need to parse the data. Prefetched data is used only once!
+        if branch_name in self._snmp_prefetch:
+            dprint(f"   Using prefetched data for {start_oid}")
+            items, walk_time = self._snmp_prefetch.pop(branch_name)
+            return self._parse_snmp_branch_items(
+                branch_name=branch_name, items=items, parser=parser, walk_time=walk_time
+            )
+
+        # Perform an SNMP walk
         try:
             dprint(f"   Calling BulkWalk {start_oid}")
             # EzSnmp v2.x no longer accepts non_repeaters/max_repetitions on the call;
@@ -951,7 +1226,25 @@ class SnmpConnector(Connector):
             )
             return -1
 
-        dprint(f"   Reading return items from {start_oid}")
+        return self._parse_snmp_branch_items(
+            branch_name=branch_name, items=items, parser=parser, walk_time=stop_time - start_time
+        )
+
+    def _parse_snmp_branch_items(self, branch_name: str, items, parser, walk_time: float) -> int:
+        """
+        Parse the items returned from a bulk-walk of a mib branch, by calling the parser on each item.
+
+        Args:
+            branch_name(str):   SNMP OID name, e.g. "system".
+            items(tuple):       the list of ezsnmp Result() objects returned by the walk.
+            parser(*function):  function to call to parse the MIB data.
+            walk_time(float):   the time it took to walk the branch.
+
+        Returns:
+            (int): the count of valid objects parsed.
+            On parsing error, self.error() is set appropriately.
+        """
+        dprint(f"   Reading return items from {branch_name}")
         # EzSnmp v2.x returns a tuple of Result objects for each result:
         #      oid (str), index (str), value (str), and type (str)
         # See docs at https://carlkidcrypto.github.io/ezsnmp/html_v2.3.0/session_python.html#ezsnmp.session.Session.bulk_walk
@@ -1005,11 +1298,159 @@ class SnmpConnector(Connector):
             count = count + 1
 
         # add to timing data, for admin use!
-        self.add_timing(branch_name, count, stop_time - start_time)
+        self.add_timing(branch_name, count, walk_time)
+        self.snmp_branch_counts[branch_name] = count
 
         dprint(f"get_snmp_branch() returns {count}")
         return count
 
+    def prefetch_snmp_branches(self, branch_names: list) -> int:
+        """
+        Concurrently bulk-walk a list of mib branches that do not depend on each other,
+        using a bounded pool of threads, each with its own ezsnmp session.
+        The raw results are stored, and consumed by the next get_snmp_branch() call for that branch.
+        This means the existing get_xxx() functions call the parsers in the proper (dependency) order,
+        and all existing fallback logic (e.g. ifName -> ifDescr) still applies.
+
+        If a branch walk fails, nothing is stored for it, and get_snmp_branch() will walk it again
+        the normal way, which handles the error reporting.
+
+        Args:
+            branch_names(list): list of SNMP OID names, e.g. ["system", "ifIndex"]
+
+        Returns:
+            (int): the number of branches prefetched successfully.
+        """
+        dprint(f"prefetch_snmp_branches({branch_names})")
+        # only walk what is valid, and not already fetched:
+        branch_names = [name for name in branch_names if name in snmp_mib_variables and name not in self._snmp_prefetch]
+        max_workers = min(settings.SNMP_MAX_WORKERS, len(branch_names))
+        if max_workers < 2:
+            # nothing to gain, get_snmp_branch() will do the walking.
+            return 0
+
+        # create the pool of sessions in this thread, so any error is logged as usual:
+        sessions = queue.SimpleQueue()
+        for _ in range(max_workers):
+            session = self._get_new_snmp_session()
+            if session is None:
+                break
+            sessions.put(session)
+        if sessions.empty():
+            return 0
+
+        def walk_branch(branch_name: str) -> tuple:
+            # runs in a worker thread. Do NOT touch any self.xxx data here!
+            session = sessions.get()
+            try:
+                start_time = time.time()
+                items = session.bulk_walk(snmp_mib_variables[branch_name])
+                return (items, time.time() - start_time)
+            finally:
+                sessions.put(session)
+
+        start_time = time.time()
+        count = 0
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(walk_branch, name): name for name in branch_names}
+            for future in concurrent.futures.as_completed(futures):
+                branch_name = futures[future]
+                try:
+                    self._snmp_prefetch[branch_name] = future.result()
+                    count += 1
+                except Exception as err:
+                    # ignore, will be walked (and error reported) by get_snmp_branch()
+                    dprint(f"   prefetch of {branch_name} failed: {err!r}")
+
+        # show the real time spent in the concurrent walks. The individual branch times are
+        # added to the "Total" timing when they get parsed, so do not use add_timing() here!
+        self.timing["Concurrent Walks"] = (count, time.time() - start_time)
+        dprint(f"prefetch_snmp_branches() fetched {count} branches")
+        return count
+
+    def walk_snmp_contexts(self, contexts: dict, branch_names: list) -> dict | None:
+        """
+        Bulk-walk the same mib branches in several community or snmp v3 contexts (e.g. per-vlan contexts on Cisco),
+        using a bounded pool of threads (settings.SNMP_MAX_CONTEXT_WORKERS), with one session per context.
+        The raw results are returned, so the caller can parse them in order, e.g. with
+        parse_snmp_context_items(), as parsers may depend on the context (e.g. self.vlan_id_context)
+
+        Args:
+            contexts(dict): key is any caller value (e.g. vlan id), value is the community or context,
+                            as used in _get_new_snmp_session().
+            branch_names(list): list of SNMP OID names to walk in each context, e.g. ["dot1dTpFdbPort"]
+
+        Returns:
+            (dict): key is the contexts key, value is a list of (branch_name, items, walk_time) in branch_names order.
+                    None if a session or walk failed, and self.error is set.
+        """
+        dprint(f"walk_snmp_contexts() for {len(contexts)} contexts")
+        # create the sessions in this thread, so any error is logged as usual:
+        sessions = {}
+        for key, com_or_ctx in contexts.items():
+            session = self._get_new_snmp_session(com_or_ctx)
+            if session is None:
+                self.error.status = True
+                self.error.description = f"Cannot create snmp session for context '{key}'"
+                return None
+            sessions[key] = session
+
+        def walk_context(key) -> list:
+            # runs in a worker thread. Do NOT touch any self.xxx data here!
+            results = []
+            for branch_name in branch_names:
+                start_time = time.time()
+                items = sessions[key].bulk_walk(snmp_mib_variables[branch_name])
+                results.append((branch_name, items, time.time() - start_time))
+            return results
+
+        start_time = time.time()
+        results = {}
+        max_workers = max(1, min(settings.SNMP_MAX_CONTEXT_WORKERS, len(contexts)))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(walk_context, key): key for key in contexts}
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    self.error.status = True
+                    self.error.description = "A timeout or network error occured!"
+                    self.error.details = f"SNMP Error: walk_snmp_contexts() in context '{key}': {e!r} ({type(e)!s})"
+                    dprint(f"   {self.error.details}")
+                    self.add_log(
+                        type=LOG_TYPE_ERROR,
+                        action=LOG_SNMP_ERROR,
+                        description=f"ERROR walking {branch_names} in context '{key}': {e!r}",
+                    )
+                    # do not wait for the other contexts:
+                    for pending in futures:
+                        pending.cancel()
+                    return None
+
+        # the individual branch times are added to the "Total" timing when they get parsed,
+        # so do not use add_timing() here!
+        self.timing["Concurrent Context Walks"] = (len(contexts), time.time() - start_time)
+        return results
+
+    def parse_snmp_context_items(self, results: list, parsers: dict) -> int:
+        """
+        Parse the data of one context, as returned by walk_snmp_contexts()
+
+        Args:
+            results(list): list of (branch_name, items, walk_time)
+            parsers(dict): key is the branch name, value the parser function for that branch.
+
+        Returns:
+            (int): the count of valid objects parsed.
+        """
+        count = 0
+        for branch_name, items, walk_time in results:
+            count += self._parse_snmp_branch_items(
+                branch_name=branch_name, items=items, parser=parsers[branch_name], walk_time=walk_time
+            )
+        return count
+
     def set(self, oid: str, value, snmp_type, parser=None) -> bool:
         """
         Set a single OID value. Note that 'value' has to be properly typed!
@@ -1162,6 +1603,18 @@ class SnmpConnector(Connector):
         """
         dprint("get_my_basic_info()")
         self.error.clear()
+        # walk the independent branches concurrently. The data gets parsed in order in _get_basic_info_data()
+        self.prefetch_snmp_branches(self.snmp_concurrent_branches + self.snmp_concurrent_vlan_branches)
+        retval = self._get_basic_info_data()
+        # and forget any prefetched data that was not used.
+        self._snmp_prefetch.clear()
+        return retval
+
+    def _get_basic_info_data(self) -> bool:
+        """
+        Read and parse all the mib branches needed for the basic info, in dependency order.
+        Returns True on success, False on failure
+        """
         retval = self._get_system_data()
         if retval != -1:
             retval = self._get_interface_data()
@@ -1181,6 +1634,74 @@ class SnmpConnector(Connector):
                                 return True
         return False
 
+    def refresh_my_basic_info(self) -> int:
+        """
+        Incremental refresh of the cached basic info, called from Connector.refresh_basic_info()
+        Read sysUpTime and ifLastChange, and then only read the status of the interfaces that changed.
+        The branches in self.snmp_refresh_branches (descriptions, untagged vlans) are walked again,
+        as changes to those do not update ifLastChange. All other (cached) data is kept as is.
+
+        Returns:
+            (int): the number of interfaces that changed, or -1 if all data needs to be read again,
+                   ie. on errors, after a reboot, or if interfaces or vlans were added or removed.
+        """
+        dprint("SnmpConnector.refresh_my_basic_info()")
+        # sysUpTime goes backwards after a reboot:
+        cached_uptime = self.sys_uptime
+        self._get_sys_uptime()
+        if self.error.status or self.sys_uptime < cached_uptime:
+            dprint("  sysUpTime error, or device rebooted!")
+            return -1
+
+        # did the number of vlans change?
+        if self.snmp_refresh_vlan_branch:
+            vlan_count = self.snmp_branch_counts.get(self.snmp_refresh_vlan_branch, 0)
+            count = self.get_snmp_branch(branch_name=self.snmp_refresh_vlan_branch, parser=lambda oid, val: True)
+            if count != vlan_count:
+                dprint("  vlans were added or removed!")
+                return -1
+
+        # find the interfaces with a new ifLastChange:
+        last_changes = {key: iface.last_change for key, iface in self.interfaces.items()}
+        if self.get_snmp_branch(branch_name="ifLastChange", parser=self._parse_mibs_if_table) != len(last_changes):
+            dprint("  interfaces were added or removed!")
+            return -1
+        changed = [key for key, iface in self.interfaces.items() if iface.last_change != last_changes[key]]
+        dprint(f"  {len(changed)} interfaces changed")
+
+        # the interface status branches to read again. ifSpeed and duplex are only read if found before:
+        branches = [
+            ("ifAdminStatus", ifAdminStatus, self._parse_mibs_if_table),
+            ("ifOperStatus", ifOperStatus, self._parse_mibs_if_table),
+        ]
+        if self.snmp_branch_counts.get("ifHighSpeed"):
+            branches.append(("ifHighSpeed", ifHighSpeed, self._parse_mibs_if_x_table))
+        elif self.snmp_branch_counts.get("ifSpeed"):
+            branches.append(("ifSpeed", ifSpeed, self._parse_mibs_if_table))
+        if self.snmp_branch_counts.get("dot3StatsDuplexStatus"):
+            branches.append(("dot3StatsDuplexStatus", dot3StatsDuplexStatus, self._parse_mibs_ether_like))
+
+        if len(changed) > self.snmp_refresh_max_gets:
+            # faster to walk the branches:
+            for branch_name, _, parser in branches:
+                if self.get_snmp_branch(branch_name=branch_name, parser=parser) < 0:
+                    return -1
+        else:
+            for key in changed:
+                for branch_name, oid, parser in branches:
+                    # duplex only exists on ethernet interfaces:
+                    if branch_name == "dot3StatsDuplexStatus" and self.interfaces[key].type != IF_TYPE_ETHERNET:
+                        continue
+                    error, _ = self.get(f"{oid}.{key}", parser=parser)
+                    if error:
+                        return -1
+
+        for branch_name, parser_name in self.snmp_refresh_branches:
+            if self.get_snmp_branch(branch_name=branch_name, parser=getattr(self, parser_name)) < 0:
+                return -1
+        self.error.clear()
+        return len(changed)
+
     def get_my_client_data(self) -> bool:
         """
         Get additional information about switch ports, eg. ethernet address, counters...
@@ -1308,6 +1829,12 @@ class SnmpConnector(Connector):
         if retval < 0:
             self.add_warning(f"Error getting 'ifOperStatus' ({ifOperStatus})")
             return retval
+        # when the oper status last changed, only used by refresh_my_basic_info()
+        if settings.RELOAD_INCREMENTAL:
+            retval = self.get_snmp_branch(branch_name="ifLastChange", parser=self._parse_mibs_if_table)
+            if retval < 0:
+                self.add_warning(f"Error getting 'ifLastChange' ({ifLastChange})")
+                return retval
 
         # find the interface name, start with the newer IF-MIB
         retval = self.get_snmp_branch(branch_name="ifName", parser=self._parse_mibs_if_x_table)
@@ -1868,6 +2395,23 @@ class SnmpConnector(Connector):
         # we did not parse the OID.
         return False
 
+    def _parse_mibs_by_column(self, table: str, oid: str, val: str) -> bool:
+        """Parse an OID with the column handler registered for its branch in a table, see snmp_column_handlers.
+
+        Params:
+            table (str): the table parser, a key in snmp_column_handlers
+            oid (str): the SNMP OID to parse
+            val (str): the value of the SNMP OID we are parsing
+
+        Returns:
+            (boolean): True if we parse the OID, False if not.
+        """
+        handler, oid_end = self.get_oid_dispatcher(table).lookup(oid)
+        if handler:
+            return getattr(self, handler)(oid_end, val)
+        # we did not parse the OID.
+        return False
+
     def _parse_mibs_if_table(self, oid: str, val: str) -> bool:
         """Function to parse the original(old) MIB-II ifTable entries
         This contains the interface index, and a number of other attributes
@@ -1881,65 +2425,61 @@ class SnmpConnector(Connector):
             (boolean): True if we parse the OID, False if not.
         """
         dprint(f"Base _parse_mibs_if_table() {oid!s}")
+        return self._parse_mibs_by_column("if_table", oid, val)
 
-        oid_end = oid_in_branch(ifIndex, oid)
-        if oid_end:
-            # ifIndex branch is special, the snmp return "val" is the index, not the oid ending!
-            # create new interface object and store, with index as string key!
-            return self.add_interface(Interface(val))
+    def _parse_column_if_index(self, oid_end: str, val: str) -> bool:
+        """Parse the ifIndex column, see _parse_mibs_if_table()"""
+        # ifIndex branch is special, the snmp return "val" is the index, not the oid ending!
+        # create new interface object and store, with index as string key!
+        return self.add_interface(Interface(val))
 
+    def _parse_column_if_descr(self, if_index: str, val: str) -> bool:
+        """Parse the ifDescr column, see _parse_mibs_if_table()"""
         # this is the old ifDescr, superceded by the IF-MIB name
-        if_index = oid_in_branch(ifDescr, oid)
-        if if_index:
-            # set new 'name'. Latter will later be overwritten with ifName bulkwalk
-            return self.set_interface_attribute_by_key(if_index, "name", str(val))
-
-        if_index = oid_in_branch(ifType, oid)
-        if if_index:
-            if_type = int(val)
-            if self.set_interface_attribute_by_key(if_index, "type", if_type) and if_type != IF_TYPE_ETHERNET:
-                # non-Ethernet interfaces are NOT manageable, no matter who
-                self.set_interface_attribute_by_key(if_index, "manageable", False)
-                self.set_interface_attribute_by_key(
-                    if_index, "unmanage_reason", "Access denied: not an Ethernet interface!"
-                )
-            return True
+        # set new 'name'. Latter will later be overwritten with ifName bulkwalk
+        return self.set_interface_attribute_by_key(if_index, "name", str(val))
+
+    def _parse_column_if_type(self, if_index: str, val: str) -> bool:
+        """Parse the ifType column, see _parse_mibs_if_table()"""
+        if_type = int(val)
+        if self.set_interface_attribute_by_key(if_index, "type", if_type) and if_type != IF_TYPE_ETHERNET:
+            # non-Ethernet interfaces are NOT manageable, no matter who
+            self.set_interface_attribute_by_key(if_index, "manageable", False)
+            self.set_interface_attribute_by_key(
+                if_index, "unmanage_reason", "Access denied: not an Ethernet interface!"
+            )
+        return True
 
-        if_index = oid_in_branch(ifMtu, oid)
-        if if_index:
-            return self.set_interface_attribute_by_key(if_index, "mtu", int(val))
+    def _parse_column_if_mtu(self, if_index: str, val: str) -> bool:
+        """Parse the ifMtu column, see _parse_mibs_if_table()"""
+        return self.set_interface_attribute_by_key(if_index, "mtu", int(val))
 
+    def _parse_column_if_speed(self, if_index: str, val: str) -> bool:
+        """Parse the ifSpeed column, see _parse_mibs_if_table()"""
         # the old speed, but really we want HCSpeed from IF-MIB, see below
-        if_index = oid_in_branch(ifSpeed, oid)
-        if if_index:
-            # save this in 1Mbps, as per IF-MIB hcspeed
-            return self.set_interface_attribute_by_key(if_index, "speed", int(val) / 1000000)
+        # save this in 1Mbps, as per IF-MIB hcspeed
+        return self.set_interface_attribute_by_key(if_index, "speed", int(val) / 1000000)
 
+    def _parse_column_if_phys_address(self, if_index: str, val: str) -> bool:
+        """Parse the ifPhysAddress column, see _parse_mibs_if_table()"""
         # do we care about this one?
-        if_index = oid_in_branch(ifPhysAddress, oid)
-        if if_index:
-            return self.set_interface_attribute_by_key(if_index, "phys_addr", val)
+        return self.set_interface_attribute_by_key(if_index, "phys_addr", val)
 
-        if_index = oid_in_branch(ifAdminStatus, oid)
-        if if_index:
-            # status = True if int(val) == IF_ADMIN_STATUS_UP else False
-            status = int(val) == IF_ADMIN_STATUS_UP
-            return self.set_interface_attribute_by_key(if_index, "admin_status", status)
+    def _parse_column_if_admin_status(self, if_index: str, val: str) -> bool:
+        """Parse the ifAdminStatus column, see _parse_mibs_if_table()"""
+        # status = True if int(val) == IF_ADMIN_STATUS_UP else False
+        status = int(val) == IF_ADMIN_STATUS_UP
+        return self.set_interface_attribute_by_key(if_index, "admin_status", status)
 
-        if_index = oid_in_branch(ifOperStatus, oid)
-        if if_index:
-            # status = True if int(val) == IF_OPER_STATUS_UP else False
-            status = int(val) == IF_OPER_STATUS_UP
-            return self.set_interface_attribute_by_key(if_index, "oper_status", status)
+    def _parse_column_if_oper_status(self, if_index: str, val: str) -> bool:
+        """Parse the ifOperStatus column, see _parse_mibs_if_table()"""
+        # status = True if int(val) == IF_OPER_STATUS_UP else False
+        status = int(val) == IF_OPER_STATUS_UP
+        return self.set_interface_attribute_by_key(if_index, "oper_status", status)
 
-        #
-        # if_index = int(oid_in_branch(ifLastChange, oid))
-        # if if_index:
-        #     return self.set_interface_attribute_by_key(if_index, "last_change", int(val))
-        #
-
-        # we did not parse the OID.
-        return False
+    def _parse_column_if_last_change(self, if_index: str, val: str) -> bool:
+        """Parse the ifLastChange column, see _parse_mibs_if_table()"""
+        return self.set_interface_attribute_by_key(if_index, "last_change", int(val))
 
     def _parse_mibs_if_x_table(self, oid: str, val: str) -> bool:
         """Function to parse the more modern IF-MIB "ifXTable" entries
@@ -1953,22 +2493,20 @@ class SnmpConnector(Connector):
             (boolean): True if we parse the OID, False if not.
         """
         dprint(f"Base _parse_mibs_if_x_table() {oid!s}")
+        return self._parse_mibs_by_column("if_x_table", oid, val)
 
-        if_index = oid_in_branch(ifName, oid)
-        if if_index:
-            return self.set_interface_attribute_by_key(if_index, "name", str(val))
+    def _parse_column_if_name(self, if_index: str, val: str) -> bool:
+        """Parse the ifName column, see _parse_mibs_if_x_table()"""
+        return self.set_interface_attribute_by_key(if_index, "name", str(val))
 
-        if_index = oid_in_branch(ifAlias, oid)
-        if if_index:
-            return self.set_interface_attribute_by_key(if_index, "description", str(val))
+    def _parse_column_if_alias(self, if_index: str, val: str) -> bool:
+        """Parse the ifAlias column, see _parse_mibs_if_x_table()"""
+        return self.set_interface_attribute_by_key(if_index, "description", str(val))
 
+    def _parse_column_if_high_speed(self, if_index: str, val: str) -> bool:
+        """Parse the ifHighSpeed column, see _parse_mibs_if_x_table()"""
         # ifMIB high speed counter:
-        if_index = oid_in_branch(ifHighSpeed, oid)
-        if if_index:
-            return self.set_interface_attribute_by_key(if_index, "speed", int(val))
-
-        # we did not parse the OID.
-        return False
+        return self.set_interface_attribute_by_key(if_index, "speed", int(val))
 
     def _parse_mibs_dot1d_port_to_ifindex_map(self, oid: str, val: str) -> bool:
         """Function to parse the mapping of a (switch) port id to an interface ifIndex value.
@@ -2125,17 +2663,17 @@ class SnmpConnector(Connector):
                 self.add_warning(warning)
                 # log this as well
                 log = Log(
-                    user=self.request.user,
                     group=self.group,
                     switch=self.switch,
-                    ip_address=get_remote_ip(self.request),
                     if_index=if_index,
                     type=LOG_TYPE_ERROR,
                     action=LOG_UNDEFINED_VLAN,
                     description=f"ERROR: {warning}",
                 )
+                # there is no request when running in the background poller:
                 if self.request:
                     log.user = self.request.user
+                    log.ip_address = get_remote_ip(self.request)
                 log.save()
                 # not sure what to do here
             return True
@@ -2434,44 +2972,13 @@ class SnmpConnector(Connector):
             self.add_vlan_by_id(vlan_id=vlan_id)
 
         # and go figure out what ports are part of this vlan.
-        # we loop through all bytes, and then the bits in that byte
-        # to find bits that are set (1). This indicates that port-id is part of the vlan given!
-
-        # THIS NEEDS WORK FOR EzSnmp v2 - now return a string of Hex values representing bytes...
-        # dprint("PARSING BITMAP, THIS NEEDS WORK!!!!")
-
-        offset = 0
-        for hexadecimal in bitmap.split():
-            # dprint(f"Found: {hexadecimal}")
-            byte = ord(bytes.fromhex(hexadecimal))
-            # which bits are set? A hack but it works!
-            # note that the bits are actually in system order,
-            # ie. bit 1 is first bit in stream, i.e. HIGH order bit!
-            if byte & 128:
-                port_id = (offset * 8) + 1
-                handler(port_id=port_id, vlan_id=vlan_id)
-            if byte & 64:
-                port_id = (offset * 8) + 2
-                handler(port_id=port_id, vlan_id=vlan_id)
-            if byte & 32:
-                port_id = (offset * 8) + 3
-                handler(port_id=port_id, vlan_id=vlan_id)
-            if byte & 16:
-                port_id = (offset * 8) + 4
-                handler(port_id=port_id, vlan_id=vlan_id)
-            if byte & 8:
-                port_id = (offset * 8) + 5
-                handler(port_id=port_id, vlan_id=vlan_id)
-            if byte & 4:
-                port_id = (offset * 8) + 6
+        # every bit that is set (1) indicates that port-id is part of the vlan given!
+        # Note that the bits are in system order, ie. port 1 is the HIGH order bit of the first byte.
+        portlist = PortList()
+        portlist.from_hexadecimal(bitmap)
+        for port_ids in portlist.iter_set_bits():
+            for port_id in port_ids:
                 handler(port_id=port_id, vlan_id=vlan_id)
-            if byte & 2:
-                port_id = (offset * 8) + 7
-                handler(port_id=port_id, vlan_id=vlan_id)
-            if byte & 1:
-                port_id = (offset * 8) + 8
-                handler(port_id=port_id, vlan_id=vlan_id)
-            offset += 1  # noqa: SIM113 Use `enumerate()` for index variable `offset` in `for` loop
 
     #####################################
     #                                   #
@@ -2664,17 +3171,17 @@ class SnmpConnector(Connector):
                 self.add_warning(warning)
                 # log this as well
                 log = Log(
-                    user=self.request.user,
                     group=self.group,
                     switch=self.switch,
-                    ip_address=get_remote_ip(self.request),
                     if_index=if_index,
                     type=LOG_TYPE_ERROR,
                     action=LOG_UNDEFINED_VLAN,
                     description=f"ERROR: {warning}",
                 )
+                # there is no request when running in the background poller:
                 if self.request:
                     log.user = self.request.user
+                    log.ip_address = get_remote_ip(self.request)
                 log.save()
                 # not sure what else to do here
             return True  # parsed!
@@ -3459,35 +3966,18 @@ class SnmpConnector(Connector):
         # (i.e. implemented in the device-specific classes in
         # vendor/cisco/snmp.py, vendor/comware/snmp.py, etc.)
         #
+        return self._parse_mibs_by_column("poe_port", oid, val)
 
-        pe_index = oid_in_branch(pethPsePortAdminEnable, oid)
-        if pe_index:
-            self.poe_port_entries[pe_index] = PoePort(pe_index, int(val))
-            return True
-
-        pe_index = oid_in_branch(pethPsePortDetectionStatus, oid)
-        if pe_index:
-            if pe_index in self.poe_port_entries:
-                self.poe_port_entries[pe_index].detect_status = int(val)
-            return True
-
-        #
-        # These are currently not used:
-        # pe_index = oid_in_branch(pethPsePortPowerPriority, oid)
-        # if pe_index:
-        #     if pe_index in self.poe_port_entries:
-        #         self.poe_port_entries[pe_index].priority = int(val)
-        #     return True
-
-        # pe_index = oid_in_branch(pethPsePortType, oid)
-        # if pe_index:
-        #     if pe_index in self.poe_port_entries:
-        #         self.poe_port_entries[pe_index].description = str(val)
-        #     return True
-        #
+    def _parse_column_peth_pse_port_admin_enable(self, pe_index: str, val: str) -> bool:
+        """Parse the pethPsePortAdminEnable column, see _parse_mibs_poe_port()"""
+        self.poe_port_entries[pe_index] = PoePort(pe_index, int(val))
+        return True
 
-        # we did not parse the OID.
-        return False
+    def _parse_column_peth_pse_port_detection_status(self, pe_index: str, val: str) -> bool:
+        """Parse the pethPsePortDetectionStatus column, see _parse_mibs_poe_port()"""
+        if pe_index in self.poe_port_entries:
+            self.poe_port_entries[pe_index].detect_status = int(val)
+        return True
 
     #
     # LLDP MIB parsing
@@ -3553,168 +4043,168 @@ class SnmpConnector(Connector):
         # if lldp:
         #    dprint(f"LLDP REMOTE_LOCAL PORT ENTRY {lldp} = {str(val)}")
         #    return True
+        return self._parse_mibs_by_column("lldp", oid, val)
+
+    def _parse_column_lldp_rem_port_id(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemPortId column, see _parse_mibs_lldp()"""
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        # store the new lldp object, based on the string index.
+        # need to find the ifIndex first.
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces:
+            # add new LLDP neighbor
+            # self.interfaces[if_index].lldp[lldp_index] = NeighborDevice(lldp_index, if_index)
+            neighbor = NeighborDevice(lldp_index)
+            # val is likely the "name" of the remote port, depending on the value of "lldapRemPortIdSubType" !
+            neighbor.port_name = val
+            # and add to interface lldp info:
+            self.interfaces[if_index].lldp[lldp_index] = neighbor
+        return True
 
-        lldp_index = oid_in_branch(lldpRemPortId, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            # store the new lldp object, based on the string index.
-            # need to find the ifIndex first.
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces:
-                # add new LLDP neighbor
-                # self.interfaces[if_index].lldp[lldp_index] = NeighborDevice(lldp_index, if_index)
-                neighbor = NeighborDevice(lldp_index)
-                # val is likely the "name" of the remote port, depending on the value of "lldapRemPortIdSubType" !
-                neighbor.port_name = val
-                # and add to interface lldp info:
-                self.interfaces[if_index].lldp[lldp_index] = neighbor
-            return True
-
+    def _parse_column_lldp_rem_port_id_sub_type(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemPortIdSubType column, see _parse_mibs_lldp()"""
         # lldpRemPortIdSubType is used to indicate what the value from "lldpRemPortId" means.
-        lldp_index = oid_in_branch(lldpRemPortIdSubType, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            # store the new lldp object, based on the string index.
-            # need to find the ifIndex first.
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces:
-                sub_type = int(val)
-                # depending on type, we may need to blank neighbor.port_name!
-                # we 'think' we can handle these: LLDP_PORT_SUBTYPE_INTERFACE_ALIAS, LLDP_PORT_SUBTYPE_MAC_ADDRESS
-                # LLDP_PORT_SUBTYPE_NETWORK_ADDRESS, LLDP_PORT_SUBTYPE_INTERFACE_NAME
-                # not sure how to interpret these:
-                if sub_type in (
-                    LLDP_PORT_SUBTYPE_CHASSIS_COMPONENT,
-                    LLDP_PORT_SUBTYPE_PORT_COMPONENT,
-                    LLDP_PORT_SUBTYPE_LOCAL,
-                ):
-                    dprint(f"  Clearning LLDP.port_name - interface subtype: {sub_type}")
-                    self.interfaces[if_index].lldp[lldp_index].port_name = ""
-            return True
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        # store the new lldp object, based on the string index.
+        # need to find the ifIndex first.
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces:
+            sub_type = int(val)
+            # depending on type, we may need to blank neighbor.port_name!
+            # we 'think' we can handle these: LLDP_PORT_SUBTYPE_INTERFACE_ALIAS, LLDP_PORT_SUBTYPE_MAC_ADDRESS
+            # LLDP_PORT_SUBTYPE_NETWORK_ADDRESS, LLDP_PORT_SUBTYPE_INTERFACE_NAME
+            # not sure how to interpret these:
+            if sub_type in (
+                LLDP_PORT_SUBTYPE_CHASSIS_COMPONENT,
+                LLDP_PORT_SUBTYPE_PORT_COMPONENT,
+                LLDP_PORT_SUBTYPE_LOCAL,
+            ):
+                dprint(f"  Clearning LLDP.port_name - interface subtype: {sub_type}")
+                self.interfaces[if_index].lldp[lldp_index].port_name = ""
+        return True
 
-        lldp_index = oid_in_branch(lldpRemPortDesc, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            # at this point, we should have already found the lldp neighbor and created an object
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
-                # now update with system port description
-                self.interfaces[if_index].lldp[lldp_index].port_descr = str(val)
-            return True
+    def _parse_column_lldp_rem_port_desc(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemPortDesc column, see _parse_mibs_lldp()"""
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        # at this point, we should have already found the lldp neighbor and created an object
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
+            # now update with system port description
+            self.interfaces[if_index].lldp[lldp_index].port_descr = str(val)
+        return True
 
-        lldp_index = oid_in_branch(lldpRemSysName, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            # at this point, we should have already found the lldp neighbor and created an object
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
-                # now update with system name
-                self.interfaces[if_index].lldp[lldp_index].sys_name = str(val)
-            return True
+    def _parse_column_lldp_rem_sys_name(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemSysName column, see _parse_mibs_lldp()"""
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        # at this point, we should have already found the lldp neighbor and created an object
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
+            # now update with system name
+            self.interfaces[if_index].lldp[lldp_index].sys_name = str(val)
+        return True
 
-        lldp_index = oid_in_branch(lldpRemSysDesc, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            port_id = int(port_id)
-            # at this point, we should have already found the lldp neighbor and created an object
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
-                # now update with system description
-                self.interfaces[if_index].lldp[lldp_index].sys_descr = str(val)
-            return True
+    def _parse_column_lldp_rem_sys_desc(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemSysDesc column, see _parse_mibs_lldp()"""
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        port_id = int(port_id)
+        # at this point, we should have already found the lldp neighbor and created an object
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
+            # now update with system description
+            self.interfaces[if_index].lldp[lldp_index].sys_descr = str(val)
+        return True
 
+    def _parse_column_lldp_rem_sys_cap_enabled(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemSysCapEnabled column, see _parse_mibs_lldp()"""
         # parse enabled capabilities
-        lldp_index = oid_in_branch(lldpRemSysCapEnabled, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            # at this point, we should have already found the lldp neighbor and created an object
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
-                # now update with system capabilities
-                cap_bytes = bytes(val, "utf-8")
-                # self.interfaces[if_index].lldp[lldp_index].capabilities = cap_bytes
-                self.interfaces[if_index].lldp[lldp_index].capabilities = int(cap_bytes[0])
-            return True
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        # at this point, we should have already found the lldp neighbor and created an object
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
+            # now update with system capabilities
+            cap_bytes = bytes(val, "utf-8")
+            # self.interfaces[if_index].lldp[lldp_index].capabilities = cap_bytes
+            self.interfaces[if_index].lldp[lldp_index].capabilities = int(cap_bytes[0])
+        return True
 
+    def _parse_column_lldp_rem_chassis_id_subtype(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemChassisIdSubtype column, see _parse_mibs_lldp()"""
         # this defines the value of the 'lldpRemChassisId' entry (parsed later, see below)
         # the return data is an integer indicating the address type.
         # Most common, and what we can handle, are:
         # LLDP_CHASSIC_TYPE_ETH_ADDR = 4  macAddress(4), standard Ethernet address
         # LLDP_CHASSIC_TYPE_NET_ADDR = 5  networkAddress(5), first byte is address type,
         #                                 next bytes are address.
-        lldp_index = oid_in_branch(lldpRemChassisIdSubtype, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            # at this point, we should have already found the lldp neighbor and created an object
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
-                # now update with system chassis type
-                if self.interfaces[if_index].lldp[lldp_index].chassis_type > LLDP_CHASSIS_TYPE_NONE:
-                    self.add_warning(
-                        f"Chassis Type for {lldp_index} already "
-                        "{self.interfaces[if_index].lldp[lldp_index].chassis_type},"
-                        " now {val}!"
-                    )
-                self.interfaces[if_index].lldp[lldp_index].chassis_type = int(val)
-            return True
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        # at this point, we should have already found the lldp neighbor and created an object
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
+            # now update with system chassis type
+            if self.interfaces[if_index].lldp[lldp_index].chassis_type > LLDP_CHASSIS_TYPE_NONE:
+                self.add_warning(
+                    f"Chassis Type for {lldp_index} already "
+                    "{self.interfaces[if_index].lldp[lldp_index].chassis_type},"
+                    " now {val}!"
+                )
+            self.interfaces[if_index].lldp[lldp_index].chassis_type = int(val)
+        return True
 
-        lldp_index = oid_in_branch(lldpRemChassisId, oid)
-        if lldp_index:
-            _unused_one, port_id, _unused_two = lldp_index.split(".")
-            # at this point, we should have already found the lldp neighbor and created an object
-            # did we find Q-Bridge mappings?
-            if_index = self._get_if_index_from_port_id(int(port_id))
-            if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
-                # now update with system chassis info, but only if chassis type is known (should be by now)
-                # Note: EzSNMP v2 returns this as hex-encoded strings, eg "AA BB CC DD EE FF"
-                # instead of the byte array returned with EzSNMP v1
-                neighbor = self.interfaces[if_index].lldp[lldp_index]
-                if neighbor.chassis_type > LLDP_CHASSIS_TYPE_NONE:
-                    if neighbor.chassis_type == LLDP_CHASSIC_TYPE_ETH_ADDR:
-                        # chassis_info = bytes_ethernet_to_string(val)  # EzSNMP v1 format conversion
-                        chassis_info = hex_string_to_ethernet(val)  # EzSNMP v2 format conversion
-                    elif neighbor.chassis_type == LLDP_CHASSIC_TYPE_NET_ADDR:
-                        # the value is the 'hex string encoded IP bytes with spaces' (EzSNMP v2)
-                        # per MIB LldpChassisId, the first byte is the IANA Address Family Number:
-                        chassis_info = hex_string_to_ip(val)
-
-                        # this is the old EzSNMP v1 parsing code:
-                        # per MIB LldpChassisId, the first byte is the IANA Address Family Number:
-                        # net_addr_type = ord(val[0])
-                        # if net_addr_type == IANA_TYPE_IPV4:
-                        #     neighbor.chassis_string_type = IANA_TYPE_IPV4
-                        #     addr_bytes = val[1:]
-                        #     chassis_info = ".".join(
-                        #         "%d" % ord(b) for b in addr_bytes  # pylint: disable=consider-using-f-string
-                        #     )  # pylint: disable=consider-using-f-string
-                        # elif net_addr_type == IANA_TYPE_IPV6:
-                        #     neighbor.chassis_string_type = IANA_TYPE_IPV6
-                        #     addr_bytes = val[1:]
-                        #     chassis_info = ":".join(
-                        #         "%d" % ord(b) for b in addr_bytes  # pylint: disable=consider-using-f-string
-                        #     )  # pylint: disable=consider-using-f-string
-                        #     # we should simplify this here - TBD
-
-                    elif neighbor.chassis_type == LLDP_CHASSIC_TYPE_LOCAL:
-                        # a locally assigned string, we are going to assume name!
-                        chassis_info = ""
-                        if not neighbor.sys_name:
-                            neighbor.sys_name = str(val)
-                    else:
-                        dprint(f"WARNING: Can not parse chassis info type: {neighbor.chassis_type}")
-                        # we don't parse this chassis_type, so just assume it is a string :-)
-                        chassis_info = str(val)
-                    neighbor.chassis_string = chassis_info
+    def _parse_column_lldp_rem_chassis_id(self, lldp_index: str, val: str) -> bool:
+        """Parse the lldpRemChassisId column, see _parse_mibs_lldp()"""
+        _unused_one, port_id, _unused_two = lldp_index.split(".")
+        # at this point, we should have already found the lldp neighbor and created an object
+        # did we find Q-Bridge mappings?
+        if_index = self._get_if_index_from_port_id(int(port_id))
+        if if_index in self.interfaces and lldp_index in self.interfaces[if_index].lldp:
+            # now update with system chassis info, but only if chassis type is known (should be by now)
+            # Note: EzSNMP v2 returns this as hex-encoded strings, eg "AA BB CC DD EE FF"
+            # instead of the byte array returned with EzSNMP v1
+            neighbor = self.interfaces[if_index].lldp[lldp_index]
+            if neighbor.chassis_type > LLDP_CHASSIS_TYPE_NONE:
+                if neighbor.chassis_type == LLDP_CHASSIC_TYPE_ETH_ADDR:
+                    # chassis_info = bytes_ethernet_to_string(val)  # EzSNMP v1 format conversion
+                    chassis_info = hex_string_to_ethernet(val)  # EzSNMP v2 format conversion
+                elif neighbor.chassis_type == LLDP_CHASSIC_TYPE_NET_ADDR:
+                    # the value is the 'hex string encoded IP bytes with spaces' (EzSNMP v2)
+                    # per MIB LldpChassisId, the first byte is the IANA Address Family Number:
+                    chassis_info = hex_string_to_ip(val)
+
+                    # this is the old EzSNMP v1 parsing code:
+                    # per MIB LldpChassisId, the first byte is the IANA Address Family Number:
+                    # net_addr_type = ord(val[0])
+                    # if net_addr_type == IANA_TYPE_IPV4:
+                    #     neighbor.chassis_string_type = IANA_TYPE_IPV4
+                    #     addr_bytes = val[1:]
+                    #     chassis_info = ".".join(
+                    #         "%d" % ord(b) for b in addr_bytes  # pylint: disable=consider-using-f-string
+                    #     )  # pylint: disable=consider-using-f-string
+                    # elif net_addr_type == IANA_TYPE_IPV6:
+                    #     neighbor.chassis_string_type = IANA_TYPE_IPV6
+                    #     addr_bytes = val[1:]
+                    #     chassis_info = ":".join(
+                    #         "%d" % ord(b) for b in addr_bytes  # pylint: disable=consider-using-f-string
+                    #     )  # pylint: disable=consider-using-f-string
+                    #     # we should simplify this here - TBD
+
+                elif neighbor.chassis_type == LLDP_CHASSIC_TYPE_LOCAL:
+                    # a locally assigned string, we are going to assume name!
+                    chassis_info = ""
+                    if not neighbor.sys_name:
+                        neighbor.sys_name = str(val)
+                else:
+                    dprint(f"WARNING: Can not parse chassis info type: {neighbor.chassis_type}")
+                    # we don't parse this chassis_type, so just assume it is a string :-)
+                    chassis_info = str(val)
+                neighbor.chassis_string = chassis_info
 
-            return True
-        return False
+        return True
 
     def _parse_mibs_lldp_management(self, oid: str, val: str) -> bool:
         """Parse LLDP entries related to remote management info.
@@ -4629,6 +5119,8 @@ class SnmpConnector(Connector):
         ###############################################################
 
         try:
+            # the changed vlan port bitmaps, these are written together at the end:
+            changes = []
             for vlan_id in self.vlans:
                 dprint(f"---\nChecking vlan {vlan_id}")
 
@@ -4681,17 +5173,20 @@ class SnmpConnector(Connector):
                     dprint(f"  NEW Egress Ports = {vlan_port_bitmap.to_hex_string()}")
                     # and write it back to the vlan bitmap! We use PySNMP to do this work
                     octet_string = OctetString(hexValue=vlan_port_bitmap.to_hex_string())
-                    if not pysnmp.set(f"{dot1qVlanStaticEgressPorts}.{vlan_id}", octet_string):
-                        self.error.status = True
-                        self.error.description = f"Error setting port tagged vlan {vlan_id}"
-                        # copy over the error details from the call:
-                        self.error.details = pysnmp.error.details
-                        dprint(f"ERROR setting port tagged vlan {vlan_id} using dot1qVlanStaticEgressPorts")
-                        return False
-                    dprint("  CHANGE OK!")
+                    changes.append((f"{dot1qVlanStaticEgressPorts}.{vlan_id}", octet_string))
                 else:
                     dprint("  NO CHANGE NEEDED!")
 
+            # write the changed vlans, several at a time if the device allows:
+            if changes and not pysnmp.set_batched(changes):
+                self.error.status = True
+                self.error.description = "Error setting port tagged vlans"
+                # copy over the error details from the call:
+                self.error.details = pysnmp.error.details
+                dprint("ERROR setting port tagged vlans using dot1qVlanStaticEgressPorts")
+                return False
+            dprint(f"  {len(changes)} CHANGES OK!")
+
         except Exception as err:
             self.error.status = True
             self.error.description = "Error adding vlans to trunk! Interface is now in UNKNOWN state!"
@@ -152,12 +152,13 @@ snmp_mib_variables["ifOperStatus"] = ifOperStatus
 IF_OPER_STATUS_UP = 1
 IF_OPER_STATUS_DOWN = 2
 
+# sysUpTime ticks when the interface status last changed, used for incremental refresh:
+ifLastChange = ".1.3.6.1.2.1.2.2.1.9"
+snmp_mib_variables["ifLastChange"] = ifLastChange
+
 """
 Currently not used, best served from a Network Management application:
 
-ifLastChange = '.1.3.6.1.2.1.2.2.1.9'
-snmp_mib_variables['ifLastChange'] =  ifLastChange
-
 ifInOctets = '.1.3.6.1.2.1.2.2.1.10'
 snmp_mib_variables['ifInOctets'] = ifInOctets
 
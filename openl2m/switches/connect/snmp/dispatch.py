@@ -0,0 +1,74 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+OID prefix dispatch for the SNMP mib parsers.
+
+Instead of testing every returned OID against a chain of branches with oid_in_branch(),
+the branches (table columns) are registered once with the name of the method that parses them.
+A lookup then only needs one dictionary lookup per distinct branch length, no matter how many
+branches are registered. See SnmpConnector.snmp_column_handlers for how drivers register handlers.
+"""
+
+
+class OidDispatcher:
+    """
+    Map OID branches to the names of their column handler methods.
+    The longest registered branch that matches an OID wins.
+    """
+
+    def __init__(self, handlers: dict | None = None):
+        """
+        Args:
+            handlers (dict): key is the OID branch (with starting dot, no trailing dot),
+                             value is the name of the handler method.
+        """
+        self.handlers: dict[str, str] = {}
+        # the distinct lengths of the registered branches, longest first:
+        self.lengths: tuple[int, ...] = ()
+        if handlers:
+            for branch, handler in handlers.items():
+                self.register(branch, handler)
+
+    def register(self, branch: str, handler: str):
+        """Register (or replace) the handler method name for an OID branch.
+
+        Args:
+            branch (str): the OID branch, e.g. ".1.3.6.1.2.1.2.2.1.2" (ifDescr)
+            handler (str): the name of the method to call for OIDs in this branch.
+
+        Returns:
+            none
+        """
+        self.handlers[branch] = handler
+        self.lengths = tuple(sorted({len(b) for b in self.handlers}, reverse=True))
+
+    def lookup(self, oid: str) -> tuple[str | None, str]:
+        """Find the handler for an OID.
+
+        Args:
+            oid (str): the full OID returned by a walk or get.
+
+        Returns:
+            (handler, oid_end): the handler method name, and the part of the OID after the branch,
+                                e.g. the ifIndex. (None, "") if no registered branch matches.
+        """
+        oid_len = len(oid)
+        handlers = self.handlers
+        for length in self.lengths:
+            # same rules as oid_in_branch(): a dot after the branch, and something after that dot.
+            if oid_len > length + 1 and oid[length] == ".":
+                handler = handlers.get(oid[:length])
+                if handler:
+                    return (handler, oid[length + 1 :])
+        return (None, "")
@@ -123,6 +123,23 @@ SWITCH_STATUS_CHOICES = [
     [SWITCH_STATUS_DECOMMISSIONING, "Decommissioning"],
 ]
 
+# the Switch() fields used in the device permissions of a user, see get_my_device_groups().
+# Changes to these invalidate the cached permissions, see switches/signals.py
+PERMISSIONS_SWITCH_FIELDS = (
+    "id",
+    "name",
+    "hostname",
+    "description",
+    "default_view",
+    "connector_type",
+    "read_only",
+    "primary_ip4",
+    "comments",
+    "driver_info",
+    "nms_id",
+    "status",
+)
+
 
 CMD_TYPE_GLOBAL = 0
 CMD_TYPE_INTERFACE = 1
@@ -182,6 +199,14 @@ LOG_TYPE_CHOICES = [
     [LOG_TYPE_LOGIN_OUT, "Login/out"],
 ]
 
+# the time period of a LogRollup() entry, see switches/rollups.py
+ROLLUP_PERIOD_HOUR = 1
+ROLLUP_PERIOD_DAY = 2
+ROLLUP_PERIOD_CHOICES = [
+    [ROLLUP_PERIOD_HOUR, "Hour"],
+    [ROLLUP_PERIOD_DAY, "Day"],
+]
+
 # Actions to log
 LOG_VIEW_SWITCHGROUPS = 0
 LOG_VIEW_SWITCH = 1
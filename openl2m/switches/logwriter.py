@@ -0,0 +1,194 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Buffered writing of the activity log, and background syslog forwarding.
+
+Log.save() of a new entry adds it to a per-process buffer, instead of writing it to the database right away.
+The buffer is written with a single bulk_create() when it holds LOG_BUFFER_SIZE entries,
+every LOG_BUFFER_INTERVAL seconds by a background thread, at the end of each web request
+(see switches.middleware.LogFlushMiddleware), and when the process exits.
+
+Syslog records are sent by a separate thread, from a queue of at most SYSLOG_QUEUE_SIZE records.
+If the syslog host cannot keep up and the queue is full, new records are dropped and counted.
+"""
+
+import logging.handlers
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+from switches.utils import BackgroundWorker, dprint, get_process_object
+
+
+class LogBuffer(BackgroundWorker):
+    """
+    Collect new Log() entries, and write them to the database in batches.
+    """
+
+    thread_name = "openl2m-log-buffer"
+
+    def __init__(self, size: int, interval: float):
+        """
+        Args:
+            size (int): the number of entries that triggers a write.
+            interval (float): the maximum number of seconds between writes of pending entries.
+        """
+        self.size = size
+        self.interval = interval
+        self.entries: list = []
+        self.lock = threading.Lock()
+        # held while entries are written, so a save() of an entry that is being written can wait for it:
+        self.flush_lock = threading.Lock()
+        self.written = 0
+        self.failed = 0
+
+    def add(self, log) -> bool:
+        """
+        Add a new Log() entry, and write the buffer if it is full.
+        An entry that is still waiting in the buffer is not added again, it is written with its current values.
+
+        Returns:
+            (bool): True if the buffer writes the entry. False if the entry was being written when it was saved
+                    again. This waits for that write to finish, and the caller needs to save the changes.
+        """
+        with self.lock:
+            if log._buffered:
+                if any(entry is log for entry in self.entries):
+                    return True
+                writing = True
+            else:
+                log._buffered = True
+                self.entries.append(log)
+                writing = False
+                full = len(self.entries) >= self.size
+        if writing:
+            with self.flush_lock:
+                return False
+        if full:
+            self.flush()
+        return True
+
+    def flush(self) -> int:
+        """Write all pending entries to the database. Returns the number of entries written."""
+        with self.flush_lock:
+            with self.lock:
+                entries, self.entries = self.entries, []
+            if not entries:
+                return 0
+            model = type(entries[0])
+            written = len(entries)
+            try:
+                # in its own (sub)transaction, so a failure does not affect the caller:
+                with transaction.atomic():
+                    model.objects.bulk_create(entries)
+            except Exception as err:
+                # write them one by one, so a single bad entry does not lose the others:
+                dprint(f"LogBuffer.flush(): bulk write of {len(entries)} entries failed: {err}")
+                for entry in entries:
+                    try:
+                        with transaction.atomic():
+                            model.objects.bulk_create([entry])
+                    except Exception as entry_err:
+                        dprint(f"LogBuffer.flush(): dropped entry '{entry.description}': {entry_err}")
+                        written -= 1
+            with self.lock:
+                # a later save() of these entries is a normal save:
+                for entry in entries:
+                    entry._buffered = False
+                self.written += written
+                self.failed += len(entries) - written
+        return written
+
+    def close(self):
+        """Write the pending entries when the process exits."""
+        self.flush()
+
+    def _run(self):
+        """Write the pending entries every 'interval' seconds."""
+        while True:
+            time.sleep(self.interval)
+            if self.entries:
+                # this thread has its own database connection, that may have timed out:
+                close_old_connections()
+                self.flush()
+
+
+class SyslogForwarder(BackgroundWorker):
+    """
+    Send log records to the syslog host from a background thread.
+    """
+
+    thread_name = "openl2m-syslog"
+
+    def __init__(self, queue_size: int):
+        """
+        Args:
+            queue_size (int): the maximum number of records waiting to be sent.
+        """
+        self.queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self.lock = threading.Lock()
+        self.sent = 0
+        self.dropped = 0
+
+    def send(self, message: str):
+        """Queue a record to be sent to syslog. If the queue is full, the record is dropped."""
+        try:
+            self.queue.put_nowait(message)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+            dprint(f"SyslogForwarder.send(): queue full, {self.dropped} records dropped")
+
+    def _run(self):
+        """Send the queued records."""
+        # we are defining a logger, and then check if it has a handler.
+        # each time you create a named logger, python will add handler to existing,
+        # even if you delete the object.
+        syslogger = logging.getLogger("openl2m_log_to_syslog")
+        if not syslogger.hasHandlers():
+            handler = logging.handlers.SysLogHandler(
+                address=(settings.SYSLOG_HOST, settings.SYSLOG_PORT), facility=settings.SYSLOG_FACILITY
+            )
+            syslogger.addHandler(handler)
+        syslogger.setLevel(settings.SYSLOG_LEVEL)
+        while True:
+            message = self.queue.get()
+            syslogger.info(message)
+            with self.lock:
+                self.sent += 1
+
+
+def get_log_buffer() -> LogBuffer | None:
+    """Get the process-wide log buffer, or None if buffering is disabled (LOG_BUFFER_SIZE = 0)."""
+    if not settings.LOG_BUFFER_SIZE:
+        return None
+    return get_process_object(
+        "log-buffer", lambda: LogBuffer(size=settings.LOG_BUFFER_SIZE, interval=settings.LOG_BUFFER_INTERVAL)
+    )
+
+
+def get_syslog_forwarder() -> SyslogForwarder:
+    """Get the process-wide syslog forwarder."""
+    return get_process_object("syslog-forwarder", lambda: SyslogForwarder(queue_size=settings.SYSLOG_QUEUE_SIZE))
+
+
+def flush_log_buffer() -> int:
+    """Write any pending log entries of this process to the database. Returns the number written."""
+    log_buffer = get_process_object("log-buffer")
+    if log_buffer is None:
+        return 0
+    return log_buffer.flush()
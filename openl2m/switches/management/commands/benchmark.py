@@ -0,0 +1,405 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Custom command line commands, see also:
+#    https://docs.djangoproject.com/en/2.2/howto/custom-management-commands/
+
+#
+# add the command 'benchmark' to measure the performance of some internal functions,
+# using synthetic device data, or a recorded SNMP walk. No devices are contacted,
+# except by 'snmpset', that writes the current values of a device back to it.
+#
+# Usage: python3 manage.py benchmark cache [--interfaces 500] [--macs 20000]
+#        python3 manage.py benchmark oid [--interfaces 500] [--walk <file>]
+#        python3 manage.py benchmark bitmap [--interfaces 500] [--vlans 100]
+#        python3 manage.py benchmark oui [--macs 20000] [--manuf <path>]
+#        python3 manage.py benchmark snmpset --device <name> [--host <ip>] [--port <udp port>] [--sets 50] [--vlans 100]
+#
+
+import asyncio
+import math
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from pysnmp.hlapi.v3arch.asyncio import (
+    ContextData,
+    ObjectIdentity,
+    ObjectType,
+    SnmpEngine,
+    UdpTransportTarget,
+    get_cmd,
+    set_cmd,
+    walk_cmd,
+)
+from pysnmp.proto.rfc1902 import ObjectName
+
+from lib.manuf import manuf
+from switches.connect.classes import EthernetAddress, Interface, NeighborDevice, PortList, Vlan
+from switches.connect.constants import IF_TYPE_ETHERNET
+from switches.connect.oui import OuiDatabase
+from switches.connect.serializer import decode_cache_data, encode_cache_data
+from switches.connect.snmp.connector import SnmpConnector, get_pysnmp_engine, oid_in_branch, pysnmpHelper
+from switches.connect.snmp.constants import dot1qVlanStaticEgressPorts, sysLocation
+from switches.models import Switch
+
+
+class Command(BaseCommand):
+    help = "Benchmark internal functions with synthetic device data, a recorded SNMP walk, or a test device."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "test", choices=["cache", "oid", "bitmap", "oui", "snmpset"], help="The function to benchmark."
+        )
+        parser.add_argument("--interfaces", type=int, default=500, help="Number of interfaces of the synthetic device.")
+        parser.add_argument("--macs", type=int, default=20000, help="Number of ethernet addresses on the device.")
+        parser.add_argument("--vlans", type=int, default=100, help="Number of vlans on the device.")
+        parser.add_argument("--rounds", type=int, default=3, help="Number of times to run each test.")
+        parser.add_argument("--manuf", default="", help="The Wireshark manuf file, defaults to the installed file.")
+        parser.add_argument(
+            "--walk",
+            default="",
+            help="A recorded walk of a device, from 'snmpwalk -On', to use instead of synthetic walk data.",
+        )
+        parser.add_argument("--device", default="", help="The name of the device to send SNMP SET requests to.")
+        parser.add_argument("--host", default="", help="Send the requests to this address instead, e.g. a simulator.")
+        parser.add_argument("--port", type=int, default=0, help="Send the requests to this UDP port instead.")
+        parser.add_argument("--sets", type=int, default=50, help="Number of SNMP SET requests to time.")
+
+    def handle(self, *args, **options):
+        if options["test"] == "cache":
+            self.benchmark_cache(options)
+        elif options["test"] == "oid":
+            self.benchmark_oid(options)
+        elif options["test"] == "bitmap":
+            self.benchmark_bitmap(options)
+        elif options["test"] == "oui":
+            self.benchmark_oui(options)
+        elif options["test"] == "snmpset":
+            self.benchmark_snmpset(options)
+        self.stdout.write("Finished.", self.style.SUCCESS)
+
+    def get_synthetic_device(self, options) -> dict:
+        """Create the data of a device with interfaces, vlans, ethernet addresses and neighbors."""
+        interface_count = max(options["interfaces"], 1)
+        vlans = {}
+        for vlan_id in range(1, options["vlans"] + 1):
+            vlan = Vlan(id=vlan_id, index=vlan_id, name=f"Vlan {vlan_id}")
+            vlan.current_egress_portlist.from_byte_count(interface_count // 8 + 1)
+            vlans[vlan_id] = vlan
+        interfaces = {}
+        for index in range(1, interface_count + 1):
+            iface = Interface(str(index))
+            iface.name = f"GigabitEthernet{index // 48 + 1}/0/{index % 48 + 1}"
+            iface.type = IF_TYPE_ETHERNET
+            iface.description = f"Port {index} description"
+            iface.speed = 1000
+            iface.untagged_vlan = index % options["vlans"] + 1
+            interfaces[iface.key] = iface
+            neighbor = NeighborDevice(lldp_index=f"{index}.1")
+            neighbor.sys_name = f"device-{index}"
+            iface.lldp[neighbor.index] = neighbor
+        for count in range(options["macs"]):
+            iface = interfaces[str(count % interface_count + 1)]
+            eth = EthernetAddress(
+                f"02:00:{(count >> 24) & 0xFF:02x}:{(count >> 16) & 0xFF:02x}:{(count >> 8) & 0xFF:02x}:{count & 0xFF:02x}"
+            )
+            eth.vlan_id = iface.untagged_vlan
+            eth.address_ip4.append(f"10.{(count >> 16) & 0xFF}.{(count >> 8) & 0xFF}.{count & 0xFF}")
+            iface.eth[eth.address_formatted] = eth
+        return {"interfaces": interfaces, "vlans": vlans, "vlan_count": len(vlans)}
+
+    def benchmark_cache(self, options):
+        """Compare the cache serializers, see switches/connect/serializer.py"""
+        self.stdout.write(
+            f"Cache serializers with {options['interfaces']} interfaces, {options['macs']} ethernet addresses, "
+            f"{options['vlans']} vlans:"
+        )
+        data = self.get_synthetic_device(options)
+        current = settings.SWITCH_CACHE_SERIALIZER
+        for serializer in ("jsonpickle", "compact"):
+            settings.SWITCH_CACHE_SERIALIZER = serializer
+            encode_time = decode_time = 0
+            for _ in range(options["rounds"]):
+                start_time = time.perf_counter()
+                encoded = encode_cache_data(data)
+                encode_time += time.perf_counter() - start_time
+                start_time = time.perf_counter()
+                decode_cache_data(encoded)
+                decode_time += time.perf_counter() - start_time
+            self.stdout.write(
+                f"\t{serializer:12} size: {len(encoded):>10} bytes, "
+                f"encode: {encode_time / options['rounds']:.3f} sec, decode: {decode_time / options['rounds']:.3f} sec"
+            )
+        settings.SWITCH_CACHE_SERIALIZER = current
+
+    def benchmark_oid(self, options):
+        """Compare the oid_in_branch() chains with the OID dispatchers, see switches/connect/snmp/dispatch.py"""
+        # each table parser used to check its own branches one by one, and now has its own dispatcher:
+        dispatchers = {table: SnmpConnector.get_oid_dispatcher(table) for table in SnmpConnector.snmp_column_handlers}
+        if options["walk"]:
+            rows = self.get_recorded_walk(options["walk"], dispatchers)
+        else:
+            rows = self.get_synthetic_walk(options, dispatchers)
+        branch_count = sum(len(dispatcher.handlers) for dispatcher in dispatchers.values())
+        self.stdout.write(f"OID parsing of {len(rows)} walked rows, {branch_count} branches:")
+
+        chain_time = dispatch_time = 0
+        for _ in range(options["rounds"]):
+            start_time = time.perf_counter()
+            for table, oid in rows:
+                for branch in dispatchers[table].handlers:
+                    if oid_in_branch(branch, oid):
+                        break
+            chain_time += time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            for table, oid in rows:
+                dispatchers[table].lookup(oid)
+            dispatch_time += time.perf_counter() - start_time
+        for name, duration in (("oid_in_branch", chain_time), ("dispatcher", dispatch_time)):
+            self.stdout.write(f"\t{name:14} {len(rows) * options['rounds'] / duration:>12,.0f} rows/sec")
+
+    def get_synthetic_walk(self, options, dispatchers: dict) -> list:
+        """Create walk data with every column of every table, for each interface. Returns (table, OID) tuples."""
+        rows = []
+        for table, dispatcher in dispatchers.items():
+            for branch in dispatcher.handlers:
+                for index in range(1, options["interfaces"] + 1):
+                    if table == "lldp":
+                        rows.append((table, f"{branch}.0.{index}.1"))
+                    elif table == "poe_port":
+                        rows.append((table, f"{branch}.1.{index}"))
+                    else:
+                        rows.append((table, f"{branch}.{index}"))
+        return rows
+
+    def get_recorded_walk(self, filename: str, dispatchers: dict) -> list:
+        """
+        Read the OIDs of a recorded walk, with lines as written by 'snmpwalk -On', e.g.
+        ".1.3.6.1.2.1.2.2.1.2.1 = STRING: GigabitEthernet1/0/1". Returns (table, OID) tuples of the OIDs
+        that one of the table parsers handles, other OIDs are skipped.
+        """
+        rows = []
+        try:
+            with open(filename, encoding="utf-8", errors="replace") as walk:
+                for line in walk:
+                    oid = line.split(" = ", 1)[0].strip()
+                    if not oid.startswith("."):
+                        continue  # not an OID, e.g. a multi-line value
+                    for table, dispatcher in dispatchers.items():
+                        if dispatcher.lookup(oid)[0]:
+                            rows.append((table, oid))
+                            break
+        except OSError as err:
+            raise CommandError(f"Cannot read walk file: {err}") from err
+        if not rows:
+            raise CommandError(f"No interface, PoE or LLDP table OIDs found in '{filename}'")
+        return rows
+
+    def benchmark_bitmap(self, options):
+        """
+        Compare the per-bit decoding of vlan port bitmaps, as used before, with PortList.iter_set_bits().
+        This also verifies that both find the same ports.
+        """
+        byte_count = max(options["interfaces"] // 8, 1)
+        bitmaps = []
+        rng = random.Random(42)  # nosec - the same test data every run
+        for vlan_id in range(options["vlans"]):
+            # mostly empty bitmaps, some ports per vlan, and some full "trunk" bitmaps:
+            if vlan_id % 10 == 0:
+                data = bytes([0xFF] * byte_count)
+            else:
+                data = bytearray(byte_count)
+                for _ in range(rng.randint(0, 8)):
+                    data[rng.randrange(byte_count)] |= 128 >> rng.randrange(8)
+            bitmaps.append(" ".join(f"{byte:02X}" for byte in data))
+        self.stdout.write(f"Decoding {len(bitmaps)} vlan bitmaps of {byte_count} bytes:")
+
+        def per_bit(bitmap: str) -> list:
+            # the decoding as done in SnmpConnector()._add_ports_to_vlan_from_bitmap() before:
+            ports = []
+            offset = 0
+            for hexadecimal in bitmap.split():
+                byte = ord(bytes.fromhex(hexadecimal))
+                for bit in range(8):
+                    if byte & (128 >> bit):
+                        ports.append((offset * 8) + bit + 1)
+                offset += 1  # noqa: SIM113 Use `enumerate()` for index variable `offset` in `for` loop
+            return ports
+
+        def portlist(bitmap: str) -> list:
+            bits = PortList()
+            bits.from_hexadecimal(bitmap)
+            ports = []
+            for port_ids in bits.iter_set_bits():
+                ports.extend(port_ids)
+            return ports
+
+        for bitmap in bitmaps:
+            if per_bit(bitmap) != portlist(bitmap):
+                raise CommandError(f"Decoders do not match for bitmap '{bitmap}'")
+        for name, decoder in (("per bit", per_bit), ("PortList", portlist)):
+            start_time = time.perf_counter()
+            for _ in range(options["rounds"]):
+                for bitmap in bitmaps:
+                    decoder(bitmap)
+            duration = time.perf_counter() - start_time
+            self.stdout.write(f"\t{name:14} {len(bitmaps) * options['rounds'] / duration:>12,.0f} bitmaps/sec")
+
+    def benchmark_oui(self, options):
+        """Compare the manuf MacParser() as used before with the pre-indexed OuiDatabase(), see switches/connect/oui.py"""
+        path = options["manuf"] or manuf.MacParser.get_packaged_manuf_file_path()
+        try:
+            start_time = time.perf_counter()
+            parser = manuf.MacParser(manuf_name=path)
+            parse_time = time.perf_counter() - start_time
+        except OSError as err:
+            raise CommandError(f"Cannot read manuf file: {err}") from err
+        start_time = time.perf_counter()
+        database = OuiDatabase(path)
+        index_time = time.perf_counter() - start_time
+        self.stdout.write(f"OUI database {path} with {database.count} entries:")
+        self.stdout.write(f"\tMacParser() load    {parse_time:.3f} sec, on every lookup batch")
+        self.stdout.write(f"\tOuiDatabase() load  {index_time:.3f} sec, once per process")
+
+        # addresses with known vendor prefixes, and some random ones:
+        rng = random.Random(42)  # nosec - the same test data every run
+        prefixes = [prefix << mask for (mask, prefix) in parser._masks]
+        addresses = []
+        for count in range(options["macs"]):
+            mac = rng.choice(prefixes) | rng.getrandbits(12) if count % 4 else rng.getrandbits(48)
+            addresses.append(":".join(f"{(mac >> shift) & 0xFF:02x}" for shift in range(40, -8, -8)))
+        for address in addresses:
+            vendor = parser.get_all(address)
+            if (vendor.manuf_long or vendor.manuf or "") != database.lookup(address):
+                raise CommandError(f"Lookups do not match for '{address}'")
+
+        start_time = time.perf_counter()
+        for address in addresses:
+            parser.get_all(address)
+        parser_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        database.lookup_many(addresses)
+        database_time = time.perf_counter() - start_time
+        for name, duration in (("MacParser", parser_time), ("OuiDatabase", database_time)):
+            self.stdout.write(f"\t{name:14} {len(addresses) / duration:>12,.0f} lookups/sec")
+
+    def benchmark_snmpset(self, options):
+        """
+        Compare SNMP SET requests with a new pysnmp engine per request, as used before, with the long-lived
+        engine of get_pysnmp_engine(), and vlan bitmaps set one at a time with pysnmpHelper.set_batched().
+        This needs a device with a read-write SNMP profile. The current values are read first,
+        and written back unchanged.
+        """
+        if not options["device"]:
+            raise CommandError("Please give the device to send the requests to, with --device <name>")
+        try:
+            switch = Switch.objects.select_related("snmp_profile").get(name=options["device"])
+        except Switch.DoesNotExist as err:
+            raise CommandError(f"Device '{options['device']}' not found!") from err
+        if not switch.snmp_profile or switch.snmp_profile.read_only:
+            raise CommandError(f"Device '{switch.name}' does not have a read-write SNMP profile!")
+        # these changes are not saved:
+        if options["host"]:
+            switch.primary_ip4 = options["host"]
+        if options["port"]:
+            switch.snmp_profile.udp_port = options["port"]
+        address = (switch.primary_ip4, switch.snmp_profile.udp_port)
+        helper = pysnmpHelper(switch)
+        engine = get_pysnmp_engine()
+
+        async def read_values(oid: str, count: int) -> list:
+            # read with the long-lived engine, the values to write back:
+            snmp_engine, auth_data = engine.get_engine(profile_key=helper._profile_key, auth_data=helper._auth_data)
+            target = await engine.get_target(profile_key=helper._profile_key, address=address)
+            object_type = ObjectType(ObjectIdentity(ObjectName(oid)))
+            if count == 1:
+                responses = [await get_cmd(snmp_engine, auth_data, target, ContextData(), object_type, lookupMib=False)]
+            else:
+                responses = [
+                    response
+                    async for response in walk_cmd(
+                        snmp_engine,
+                        auth_data,
+                        target,
+                        ContextData(),
+                        object_type,
+                        lookupMib=False,
+                        lexicographicMode=False,
+                    )
+                ]
+            values = []
+            for error_indication, error_status, _error_index, var_binds in responses:
+                if error_indication or error_status:
+                    raise CommandError(f"Cannot read {oid}: {error_indication or error_status.prettyPrint()}")
+                values.extend((str(name), value) for name, value in var_binds)
+            return values[:count]
+
+        async def set_new_engine(oid: str, value) -> bool:
+            # a SET as done in pysnmpHelper.run_set_oids_values() before, with a new engine and transport:
+            snmp_engine = SnmpEngine()
+            target = await UdpTransportTarget.create(address)
+            error_indication, error_status, _error_index, _var_binds = await set_cmd(
+                snmp_engine,
+                helper._auth_data,
+                target,
+                ContextData(),
+                ObjectType(ObjectIdentity(ObjectName(oid)), value),
+                lookupMib=False,
+            )
+            snmp_engine.close_dispatcher()
+            return not error_indication and not error_status
+
+        def set_engine(oid: str, value) -> bool:
+            return pysnmpHelper(switch).set(oid, value)
+
+        ((oid, value),) = engine.run(read_values(sysLocation, 1))
+        self.stdout.write(f"SNMP SET of sysLocation to {switch.name} at {address[0]}:{address[1]}:")
+        for name, setter in (
+            ("new engine", lambda: asyncio.run(set_new_engine(oid, value))),
+            ("long-lived", lambda: set_engine(oid, value)),
+        ):
+            durations = []
+            for _ in range(options["sets"]):
+                start_time = time.perf_counter()
+                if not setter():
+                    raise CommandError(f"SNMP SET with {name} engine failed!")
+                durations.append(time.perf_counter() - start_time)
+            self.stdout.write(
+                f"\t{name:14} median {statistics.median(durations) * 1000:8.2f} ms, "
+                f"mean {statistics.mean(durations) * 1000:8.2f} ms, max {max(durations) * 1000:8.2f} ms per SET"
+            )
+
+        bitmaps = engine.run(read_values(dot1qVlanStaticEgressPorts, options["vlans"]))
+        if not bitmaps:
+            self.stdout.write("No vlans found, skipping the vlan bitmap test.")
+            return
+        batch_size = max(settings.SNMP_SET_MAX_VARBINDS, 1)
+        self.stdout.write(f"SNMP SET of {len(bitmaps)} vlan egress port bitmaps:")
+        start_time = time.perf_counter()
+        for oid, value in bitmaps:
+            if not helper.set(oid, value):
+                raise CommandError(f"SNMP SET of {oid} failed: {helper.error.details}")
+        duration = time.perf_counter() - start_time
+        self.stdout.write(f"\t{'set() per vlan':16} {duration * 1000:8.1f} ms, {len(bitmaps)} requests")
+        start_time = time.perf_counter()
+        if not helper.set_batched(bitmaps):
+            raise CommandError(f"SNMP SET of vlan bitmaps failed: {helper.error.details}")
+        duration = time.perf_counter() - start_time
+        self.stdout.write(
+            f"\t{'set_batched()':16} {duration * 1000:8.1f} ms, {math.ceil(len(bitmaps) / batch_size)} requests "
+            f"of up to {batch_size} (SNMP_SET_MAX_VARBINDS), if the device accepts them"
+        )
@@ -0,0 +1,196 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Custom command line commands, see also:
+#    https://docs.djangoproject.com/en/2.2/howto/custom-management-commands/
+
+#
+# add the command 'loadtestlogs' to fill the Log() table with synthetic entries (PostgreSQL),
+# and time the queries used by the device, activity, statistics and top activity pages.
+# Do NOT run this on a production server! The synthetic entries use the ip address 192.0.2.1,
+# and can be removed with --remove.
+#
+# Usage: python3 manage.py loadtestlogs [--rows 1000000] [--days 180] [--rounds 3] [--explain]
+#        python3 manage.py loadtestlogs --remove
+#
+
+import datetime
+import time
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from switches.constants import (
+    LOG_CHANGE_INTERFACE_ALIAS,
+    LOG_CHANGE_INTERFACE_DOWN,
+    LOG_CHANGE_INTERFACE_PVID,
+    LOG_EXECUTE_COMMAND,
+    LOG_LOGIN,
+    LOG_LOGIN_REST_API,
+    LOG_SNMP_ERROR,
+    LOG_TYPE_CHANGE,
+    LOG_TYPE_COMMAND,
+    LOG_TYPE_ERROR,
+    LOG_TYPE_LOGIN_OUT,
+    LOG_TYPE_VIEW,
+    LOG_VIEW_SWITCH,
+)
+from switches.models import Log, Switch
+from switches.rollups import get_log_usage
+from switches.stats import get_top_log_counts, get_usage_info
+
+LOADTEST_IP_ADDRESS = "192.0.2.1"
+
+# the (type, action) mix of the synthetic entries, roughly that of a busy server:
+LOADTEST_ENTRY_MIX = [(LOG_TYPE_VIEW, LOG_VIEW_SWITCH)] * 14 + [
+    (LOG_TYPE_CHANGE, LOG_CHANGE_INTERFACE_PVID),
+    (LOG_TYPE_CHANGE, LOG_CHANGE_INTERFACE_ALIAS),
+    (LOG_TYPE_CHANGE, LOG_CHANGE_INTERFACE_DOWN),
+    (LOG_TYPE_COMMAND, LOG_EXECUTE_COMMAND),
+    (LOG_TYPE_ERROR, LOG_SNMP_ERROR),
+    (LOG_TYPE_LOGIN_OUT, LOG_LOGIN),
+    (LOG_TYPE_LOGIN_OUT, LOG_LOGIN_REST_API),
+]
+
+
+class Command(BaseCommand):
+    help = "Insert synthetic log entries, and time the common log queries."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=0, help="Number of synthetic log entries to add first.")
+        parser.add_argument("--days", type=int, default=180, help="Spread the new entries over this many days.")
+        parser.add_argument("--batch", type=int, default=100000, help="Number of entries to add per transaction.")
+        parser.add_argument("--rounds", type=int, default=3, help="Number of times to run each query.")
+        parser.add_argument("--explain", action="store_true", help="Show the query plans.")
+        parser.add_argument("--remove", action="store_true", help="Remove all synthetic log entries, and exit.")
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("The log load test requires a PostgreSQL database!")
+        if options["remove"]:
+            count = Log.objects.filter(ip_address=LOADTEST_IP_ADDRESS)._raw_delete(using=DEFAULT_DB_ALIAS)
+            self.stdout.write(f"{count} synthetic log entries removed.")
+        else:
+            if options["rows"] > 0:
+                self.add_entries(options)
+            self.time_queries(options)
+        self.stdout.write("Finished.", self.style.SUCCESS)
+
+    def add_entries(self, options):
+        """Add the synthetic log entries, in batches, for existing devices and users."""
+        switch_ids = list(Switch.objects.values_list("id", flat=True)[:1000])
+        user_ids = list(User.objects.values_list("id", flat=True)[:200])
+        types = [entry[0] for entry in LOADTEST_ENTRY_MIX]
+        actions = [entry[1] for entry in LOADTEST_ENTRY_MIX]
+        # the random index into the lists is chosen once per row, so the type and action match.
+        # Indexing an empty id list returns NULL, i.e. entries without device or user.
+        sql = (
+            f'INSERT INTO "{Log._meta.db_table}" '
+            "(timestamp, user_id, switch_id, if_index, if_name, ip_address, type, action, description) "
+            "SELECT now() - random() * %s * interval '1 day', "
+            "(%s::int[])[1 + floor(random() * %s)::int], (%s::int[])[1 + floor(random() * %s)::int], "
+            "0, '', %s, (%s::int[])[r.k], (%s::int[])[r.k], 'Synthetic load test entry' "
+            "FROM (SELECT 1 + floor(random() * %s)::int AS k FROM generate_series(1, %s)) r"
+        )
+        self.stdout.write(
+            f"Adding {options['rows']} log entries over {options['days']} days, "
+            f"for {len(switch_ids)} devices and {len(user_ids)} users:"
+        )
+        start = time.perf_counter()
+        added = 0
+        while added < options["rows"]:
+            count = min(options["batch"], options["rows"] - added)
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.execute(
+                    sql,
+                    [
+                        options["days"],
+                        user_ids,
+                        len(user_ids),
+                        switch_ids,
+                        len(switch_ids),
+                        LOADTEST_IP_ADDRESS,
+                        types,
+                        actions,
+                        len(types),
+                        count,
+                    ],
+                )
+            added += count
+            self.stdout.write(f"\t{added} entries added")
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE "{Log._meta.db_table}"')
+        elapsed = time.perf_counter() - start
+        self.stdout.write(f"\t{added / elapsed:.0f} entries/sec")
+
+    def time_query(self, name: str, function, options, queryset=None):
+        """Run a query function several times, and show the fastest time."""
+        times = []
+        for _ in range(max(options["rounds"], 1)):
+            start = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start)
+        self.stdout.write(f"{name:<32} {min(times) * 1000:10.1f} ms")
+        if options["explain"] and queryset is not None:
+            self.stdout.write(queryset.explain())
+
+    def time_queries(self, options):
+        """Time the common log queries, for a recently active device and user."""
+        now = timezone.now()
+        self.stdout.write(f"Log entries: {Log.objects.count()}")
+        recent = Log.objects.order_by("-timestamp")
+        switch_id = recent.filter(switch_id__isnull=False).values_list("switch_id", flat=True).first()
+        user_id = recent.filter(user_id__isnull=False).values_list("user_id", flat=True).first()
+        queries = {
+            # the device "Recent Activity", see switch_view():
+            "device recent activity": Log.objects.filter(switch_id=switch_id, type__gt=LOG_TYPE_VIEW).order_by(
+                "-timestamp"
+            )[: settings.RECENT_SWITCH_LOG_COUNT],
+            # the first page of the device activity, and the admin logs pages:
+            "device activity page": Log.objects.filter(switch_id=switch_id).order_by("-timestamp")[:50],
+            "user activity page": Log.objects.filter(user_id=user_id).order_by("-timestamp")[:50],
+            "all logs page": Log.objects.order_by("-timestamp")[:50],
+            "change logs page": Log.objects.filter(type=LOG_TYPE_CHANGE).order_by("-timestamp")[:50],
+        }
+        for name, queryset in queries.items():
+            self.time_query(name, lambda queryset=queryset: list(queryset.all()), options, queryset=queryset)
+
+        self.time_query(
+            "usage last 7 days",
+            lambda: get_log_usage(start=now - datetime.timedelta(days=7), end=now),
+            options,
+        )
+        self.time_query("usage statistics", get_usage_info, options)
+        with override_settings(TOP_ACTIVITY_CACHE_TIMEOUT=0):
+            self.time_query(
+                "top changed devices",
+                lambda: get_top_log_counts(
+                    group_by="switch_id", name_field="switch__name", log_types=[LOG_TYPE_CHANGE]
+                ),
+                options,
+            )
+            self.time_query(
+                "top active users",
+                lambda: get_top_log_counts(
+                    group_by="user_id", name_field="user__username", log_types=[LOG_TYPE_VIEW, LOG_TYPE_CHANGE]
+                ),
+                options,
+            )
+        if settings.LOG_MAX_AGE:
+            queryset = Log.objects.filter(timestamp__lt=now - datetime.timedelta(days=settings.LOG_MAX_AGE))
+            self.time_query("count expired logs", queryset.count, options, queryset=queryset)
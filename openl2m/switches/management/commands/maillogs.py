@@ -15,16 +15,20 @@
 # Custom command line commands, see also:
 #    https://docs.djangoproject.com/en/4.2/howto/custom-management-commands/
 #    https://simpleisbetterthancomplex.com/tutorial/2018/08/27/how-to-create-custom-django-management-commands.html
+import csv
 from datetime import timedelta
+import gzip
+import json
 import tempfile
 import xlsxwriter
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.core.mail import EmailMessage
+from django.db.models import Q
 from django.utils import timezone
 
-from switches.models import Log
+from switches.models import Log, LogCheckpoint
 from switches.constants import (
     LOG_TYPE_CHOICES,
     LOG_ACTION_CHOICES,
@@ -32,14 +36,31 @@ from switches.constants import (
 
 MY_TIMEFORMAT = "%x %X"
 
-# the columns in the output spreadsheet, if requested:
-COLUMN_TIME = 0
-COLUMN_TYPE = 1
-COLUMN_ACTION = 2
-COLUMN_DEVICE = 3
-COLUMN_USER = 4
-COLUMN_IP = 5
-COLUMN_DESCRIPTION = 6
+# the columns in the output spreadsheet, if requested, with their width:
+XLSX_COLUMNS = (
+    ("Time", 25),
+    ("Type", 10),
+    ("Action", 15),
+    ("Device", 25),
+    ("User", 15),
+    ("IP", 20),
+    ("Description", 150),
+)
+# the field names in the CSV and JSON output:
+FIELD_NAMES = ("time", "type", "action", "device", "user", "ip", "description")
+
+# the number of log entries read from the database at a time:
+LOG_CHUNK_SIZE = 2000
+# the default attachment names of the output formats:
+FORMAT_FILENAMES = {
+    "xlsx": "openl2m_logs.xlsx",
+    "csv": "openl2m_logs.csv.gz",
+    "json": "openl2m_logs.jsonl.gz",
+}
+# with a checkpoint, only send entries older than this many seconds plus settings.LOG_BUFFER_INTERVAL.
+# Entries are timestamped when created, but saved later, and possibly buffered. Newer entries may not be
+# in the database yet, and would be skipped by the next run. They are sent next time instead.
+CHECKPOINT_MARGIN = 30
 
 
 class Command(BaseCommand):
@@ -100,14 +121,35 @@ class Command(BaseCommand):
         parser.add_argument(
             "--attach",
             action="store_true",
-            help="Create Excel spreadsheet as attachment.",
+            help="Create an attachment with the log entries, see --format. Default is an Excel spreadsheet.",
+        )
+
+        parser.add_argument(
+            "--format",
+            choices=FORMAT_FILENAMES.keys(),
+            default="xlsx",
+            help='The attachment format: Excel spreadsheet, or gzip compressed CSV or JSON lines. Default is "xlsx".',
         )
 
         parser.add_argument(
             "--filename",
             type=str,
-            default="openl2m_logs.xlsx",
-            help='Log entries attachment filename. Default is "openl2m_logs.xlsx."',
+            default="",
+            help='Log entries attachment filename. Default is "openl2m_logs" with the extension of the format.',
+        )
+
+        parser.add_argument(
+            "--output",
+            type=str,
+            default="",
+            help="Write the attachment to this file. If --to is not given, no email is sent.",
+        )
+
+        parser.add_argument(
+            "--checkpoint",
+            type=str,
+            default="",
+            help="Name of a checkpoint, to only send the log entries added since the last run with this name.",
         )
 
         parser.add_argument(
@@ -137,16 +179,18 @@ class Command(BaseCommand):
             return
 
         # validate a few things...
-        if not settings.EMAIL_HOST:
+        if options["to"] and not settings.EMAIL_HOST:
             self.stdout.write("Error: settings.EMAIL_HOST is NOT set!", self.style.ERROR)
             return
 
-        if not options["to"]:
-            self.stdout.write("Error: 'to' argument needed!", self.style.ERROR)
+        if not options["to"] and not options["output"]:
+            self.stdout.write("Error: 'to' or 'output' argument needed!", self.style.ERROR)
             return
 
         # for email, "to" needs to be a list or tuple:
-        to = options["to"].split(",")
+        to = options["to"].split(",") if options["to"] else []
+        # writing to a file implies an attachment:
+        attach = options["attach"] or bool(options["output"])
 
         # prepare some convenience dictionaries:
         log_types = {}
@@ -296,94 +340,95 @@ class Command(BaseCommand):
             cutoff_string = cutoff.strftime(MY_TIMEFORMAT)
             self.stdout.write(f"Now: {now_string}, Logs since: {cutoff_string}", self.style.SUCCESS)
 
-        # looks like we are good to go!
-        self.stdout.write(
-            f"Sending most recent {options['hours']} hours of log entries for type '{log_types[log_type]}' to '{options['to']}'"
-        )
+        # with a checkpoint, we send the entries after the last one sent, by (timestamp, id).
+        # The first time, the most recent number of hours is sent:
+        checkpoint = None
+        after_checkpoint = Q()
+        if options["checkpoint"]:
+            checkpoint, _ = LogCheckpoint.objects.get_or_create(name=options["checkpoint"])
+            filter_values["timestamp__lte"] = now - timedelta(seconds=settings.LOG_BUFFER_INTERVAL + CHECKPOINT_MARGIN)
 
-        # get log since cut-off time
-        filter_values["timestamp__gt"] = cutoff_local
+        # looks like we are good to go!
+        destination = options["to"] or options["output"]
+        if checkpoint and checkpoint.timestamp:
+            self.stdout.write(
+                f"Sending log entries since checkpoint '{options['checkpoint']}' for type '{log_types[log_type]}' to '{destination}'"
+            )
+            after_checkpoint = Q(timestamp__gt=checkpoint.timestamp) | Q(
+                timestamp=checkpoint.timestamp, id__gt=checkpoint.log_id
+            )
+        else:
+            self.stdout.write(
+                f"Sending most recent {options['hours']} hours of log entries for type '{log_types[log_type]}' to '{destination}'"
+            )
+            # get log since cut-off time
+            filter_values["timestamp__gt"] = cutoff_local
 
         # and exclude as need. Note that filter() can include, but removing items is done by exclude():
+        logs = Log.objects.all().select_related("switch", "user")
         if excludes:
-            logs = Log.objects.all().exclude(action__in=excludes).filter(**filter_values).order_by("timestamp")
-        else:
-            # all logs in time-range, and filtered as needed:
-            logs = Log.objects.all().filter(**filter_values).order_by("timestamp")
+            logs = logs.exclude(action__in=excludes)
+        # all logs in time-range, and filtered as needed. With a checkpoint, in the order we store:
+        logs = logs.filter(after_checkpoint, **filter_values).order_by("timestamp", "id")
 
         # go output them!
-        if logs:
-            self.stdout.write(f"Emailing {logs.count()} log records... ", self.style.WARNING)
-            self.stdout.flush()
-            # need for-loop here!
-            lines = []
-            row = 0
-            if options["attach"]:
-                # open the Excel file:
-                try:
-                    tmp_file = f"{tempfile.gettempdir()}/{options['filename']}"
-                    if options["verbosity"] > 1:
-                        self.stdout.write(f"Attachment filename: {tmp_file}")
-                    workbook = xlsxwriter.Workbook(tmp_file)
-                    format_bold = workbook.add_format({"bold": True, "font_name": "Calibri", "font_size": 14})
-                    format_regular = workbook.add_format({"font_name": "Calibri", "font_size": 12})
-
-                    worksheet = workbook.add_worksheet()
-
-                    worksheet.write(row, COLUMN_TIME, "Time", format_bold)
-                    worksheet.set_column(COLUMN_TIME, COLUMN_TIME, 25)  # Adjust the column width.
-
-                    worksheet.write(row, COLUMN_TYPE, "Type", format_bold)
-                    worksheet.set_column(COLUMN_TYPE, COLUMN_TYPE, 10)  # Adjust the column width.
-
-                    worksheet.write(row, COLUMN_ACTION, "Action", format_bold)
-                    worksheet.set_column(COLUMN_ACTION, COLUMN_ACTION, 15)  # Adjust the column width.
-
-                    worksheet.write(row, COLUMN_DEVICE, "Device", format_bold)
-                    worksheet.set_column(COLUMN_DEVICE, COLUMN_DEVICE, 25)  # Adjust the column width.
-
-                    worksheet.write(row, COLUMN_USER, "User", format_bold)
-                    worksheet.set_column(COLUMN_USER, COLUMN_USER, 15)  # Adjust the column width.
-
-                    worksheet.write(row, COLUMN_IP, "IP", format_bold)
-                    worksheet.set_column(COLUMN_IP, COLUMN_IP, 20)  # Adjust the column width.
-
-                    worksheet.write(row, COLUMN_DESCRIPTION, "Description", format_bold)
-                    worksheet.set_column(COLUMN_DESCRIPTION, COLUMN_DESCRIPTION, 150)  # Adjust the column width.
+        count = logs.count()
+        if not count:
+            self.stdout.write("No log records found.")
+            self.stdout.write("Finished.", self.style.SUCCESS)
+            return
 
-                    lines.append("Log entries are in the attached file!")
-                except Exception as err:
-                    self.stdout.write(
-                        f"ERROR creating attachment at '{tmp_file}': {err}",
-                        self.style.ERROR,
+        self.stdout.write(f"Sending {count} log records... ", self.style.WARNING)
+        self.stdout.flush()
+        lines = []
+        if attach:
+            filename = options["filename"] or FORMAT_FILENAMES[options["format"]]
+            tmp_file = options["output"] or f"{tempfile.gettempdir()}/{filename}"
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Attachment filename: {tmp_file}")
+            try:
+                writer = LogFileWriter(tmp_file, options["format"])
+            except Exception as err:
+                self.stdout.write(
+                    f"ERROR creating attachment at '{tmp_file}': {err}",
+                    self.style.ERROR,
+                )
+                return
+            lines.append("Log entries are in the attached file!")
+
+        # stream the entries from the database, so memory use does not depend on the number of entries:
+        row = 0
+        last_log = None
+        for log in logs.iterator(chunk_size=LOG_CHUNK_SIZE):
+            row += 1
+            last_log = log
+            entry = f"#{row}, {log.timestamp.strftime(MY_TIMEFORMAT)}, type '{log_types[log.type]}', action '{log_actions[log.action]}', client ip '{log.ip_address}', device '{log.switch}', description '{log.description}'"
+            if attach:
+                writer.write(
+                    (
+                        log.timestamp.astimezone(tz=None),
+                        log_types[log.type],
+                        log_actions[log.action],
+                        f"{log.switch}",
+                        f"{log.user}",
+                        log.ip_address,
+                        log.description,
                     )
-                    return
-
-            for log in logs:
-                row += 1
-                entry = f"#{row}, {log.timestamp.strftime(MY_TIMEFORMAT)}, type '{log_types[log.type]}', action '{log_actions[log.action]}', client ip '{log.ip_address}', device '{log.switch}', description '{log.description}'"
-                timestamp = log.timestamp.astimezone(tz=None)
-                if options["attach"]:
-                    worksheet.write(row, COLUMN_TIME, timestamp.strftime(MY_TIMEFORMAT), format_regular)
-                    worksheet.write(row, COLUMN_TYPE, log_types[log.type], format_regular)
-                    worksheet.write(row, COLUMN_ACTION, log_actions[log.action], format_regular)
-                    worksheet.write(row, COLUMN_DEVICE, f"{log.switch}", format_regular)
-                    worksheet.write(row, COLUMN_USER, f"{log.user}", format_regular)
-                    worksheet.write(row, COLUMN_IP, log.ip_address, format_regular)
-                    worksheet.write(row, COLUMN_DESCRIPTION, log.description, format_regular)
-                else:
-                    lines.append(entry)
-                if options["verbosity"] > 1:
-                    self.stdout.write(entry)
+                )
+            else:
+                lines.append(entry)
+            if options["verbosity"] > 1:
+                self.stdout.write(entry)
 
-            if options["attach"]:
-                try:
-                    workbook.close()
-                except Exception as err:
-                    self.stdout.write(f"ERROR saving attachment file '{tmp_file}': {err}")
-                    return
+        if attach:
+            try:
+                writer.close()
+            except Exception as err:
+                self.stdout.write(f"ERROR saving attachment file '{tmp_file}': {err}")
+                return
 
-            # email it:
+        # email it:
+        if to:
             try:
                 message = EmailMessage(
                     subject=options["subject"],
@@ -391,13 +436,18 @@ class Command(BaseCommand):
                     from_email=f"OpenL2M Log Mailer {settings.EMAIL_FROM_ADDRESS}",
                     to=to,
                 )
-                if options["attach"]:
+                if attach:
                     message.attach_file(tmp_file)
                 message.send()
             except Exception as err:
                 self.stdout.write(f"ERROR emailing: {err}", self.style.ERROR)
-        else:
-            self.stdout.write("No log records found.")
+                return
+
+        # all sent, so the next run can start after this:
+        if checkpoint and last_log:
+            checkpoint.timestamp = last_log.timestamp
+            checkpoint.log_id = last_log.id
+            checkpoint.save()
 
         self.stdout.write("Finished.", self.style.SUCCESS)
 
@@ -415,3 +465,54 @@ class Command(BaseCommand):
         for item in LOG_ACTION_CHOICES:
             # number => description
             self.stdout.write(f"{item[0]} = {item[1]}")
+
+
+class LogFileWriter:
+    """
+    Write log entries to an attachment file, one at a time, so memory use does not depend on the number of entries.
+    The file is an Excel spreadsheet, or a gzip compressed CSV or JSON lines file.
+    """
+
+    def __init__(self, filename: str, output_format: str):
+        """
+        Args:
+            filename (str): the file to create.
+            output_format (str): "xlsx", "csv" or "json".
+        """
+        self.output_format = output_format
+        self.row = 0
+        if output_format == "xlsx":
+            # in constant memory mode, each row is written to disk when the next row starts:
+            self.workbook = xlsxwriter.Workbook(filename, {"constant_memory": True})
+            self.format_bold = self.workbook.add_format({"bold": True, "font_name": "Calibri", "font_size": 14})
+            self.format_regular = self.workbook.add_format({"font_name": "Calibri", "font_size": 12})
+            self.worksheet = self.workbook.add_worksheet()
+            for column, (title, width) in enumerate(XLSX_COLUMNS):
+                self.worksheet.write(0, column, title, self.format_bold)
+                self.worksheet.set_column(column, column, width)  # Adjust the column width.
+        else:
+            self.file = gzip.open(filename, "wt", encoding="utf-8", newline="")
+            if output_format == "csv":
+                self.csv_writer = csv.writer(self.file)
+                self.csv_writer.writerow(FIELD_NAMES)
+
+    def write(self, entry: tuple):
+        """Write a log entry, a tuple of (timestamp, type, action, device, user, ip, description)"""
+        self.row += 1
+        if self.output_format == "xlsx":
+            values = (entry[0].strftime(MY_TIMEFORMAT),) + entry[1:]
+            for column, value in enumerate(values):
+                self.worksheet.write(self.row, column, value, self.format_regular)
+        else:
+            values = (entry[0].isoformat(),) + entry[1:]
+            if self.output_format == "csv":
+                self.csv_writer.writerow(values)
+            else:
+                self.file.write(json.dumps(dict(zip(FIELD_NAMES, values))) + "\n")
+
+    def close(self):
+        """Finish writing the file."""
+        if self.output_format == "xlsx":
+            self.workbook.close()
+        else:
+            self.file.close()
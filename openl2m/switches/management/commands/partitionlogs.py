@@ -0,0 +1,70 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Custom command line commands, see also:
+#    https://docs.djangoproject.com/en/2.2/howto/custom-management-commands/
+
+#
+# add the command 'partitionlogs' to convert the Log() table into a monthly partitioned table (PostgreSQL),
+# or show and create the partitions of an already partitioned table. See switches/partitions.py
+#
+# Usage: python3 manage.py partitionlogs [--convert] [--months 3]
+#
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from switches.partitions import (
+    LOG_PARTITION_MONTHS_AHEAD,
+    convert_log_table,
+    create_log_partitions,
+    get_log_partitions,
+    is_log_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = "Partition the log table by month, or create the partitions of the coming months."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--convert",
+            action="store_true",
+            help="Convert the log table into a partitioned table. This locks the log table while copying!",
+        )
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=LOG_PARTITION_MONTHS_AHEAD,
+            help=f"Number of future months to create partitions for. Default is {LOG_PARTITION_MONTHS_AHEAD}.",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Log partitioning requires a PostgreSQL database!")
+        if not is_log_partitioned():
+            if not options["convert"]:
+                self.stdout.write("The log table is not partitioned. Use --convert to partition it.")
+                return
+            self.stdout.write("Converting the log table to monthly partitions... ", self.style.WARNING, ending="")
+            self.stdout.flush()
+            count = convert_log_table(months_ahead=options["months"])
+            self.stdout.write(f"{count} log entries copied.", self.style.WARNING)
+        else:
+            for name in create_log_partitions(months_ahead=options["months"]):
+                self.stdout.write(f"\tCreated partition {name}")
+        if options["verbosity"] > 1:
+            for name in get_log_partitions():
+                self.stdout.write(f"\tPartition: {name}")
+        self.stdout.write("Finished.", self.style.SUCCESS)
@@ -0,0 +1,153 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Custom command line commands, see also:
+#    https://docs.djangoproject.com/en/2.2/howto/custom-management-commands/
+
+#
+# add the command 'pollswitches' to read devices in the background, and keep the shared device cache warm.
+# This way the first user to view a busy device does not have to wait for the device to be read.
+# Devices are polled if "Background Poll" is set, or if they are among the most accessed devices,
+# see SWITCH_POLL_TOP_COUNT and SWITCH_POLL_ACCESS_DAYS.
+#
+# Usage: python3 manage.py pollswitches [--once] [--interval 300] [--workers 4]
+#
+# This can be run as a systemd service, or from cron with --once.
+#
+
+import concurrent.futures
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.db.models import Q
+from django.utils import timezone
+
+from switches.connect.connect import get_connection_object
+from switches.connect.snapshot import get_snapshot_age
+from switches.constants import SWITCH_STATUS_ACTIVE
+from switches.models import Switch
+
+# seconds between checks for devices that need to be polled:
+POLL_LOOP_SLEEP = 10
+
+
+class Command(BaseCommand):
+    help = "Read devices in the background, to keep the shared device cache warm."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Poll the devices once, then exit.")
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=settings.SWITCH_POLL_INTERVAL,
+            help="Seconds between reads of a device.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=settings.SWITCH_POLL_WORKERS,
+            help="Number of devices read at the same time.",
+        )
+
+    def handle(self, *args, **options):
+        if settings.SWITCH_CACHE_BACKEND not in ("file", "redis"):
+            raise CommandError(
+                f"The background poller requires a shared SWITCH_CACHE_BACKEND, 'file' or 'redis' "
+                f"(value: {settings.SWITCH_CACHE_BACKEND})"
+            )
+        self.verbosity = options["verbosity"]
+        self.interval = max(options["interval"], POLL_LOOP_SLEEP)
+        # devices with read errors, key is Switch().id, value is (error count, time of next poll):
+        self.backoff: dict[int, tuple[int, float]] = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(options["workers"], 1)) as executor:
+            while True:
+                self.poll_switches(executor)
+                if options["once"]:
+                    break
+                time.sleep(POLL_LOOP_SLEEP)
+        self.stdout.write("Finished.", self.style.SUCCESS)
+
+    def get_switches(self) -> list[Switch]:
+        """Get the active devices that should be polled, ie. with 'Background Poll' set, or most accessed."""
+        selected = Q(background_poll=True)
+        if settings.SWITCH_POLL_TOP_COUNT:
+            cutoff = timezone.now() - timedelta(days=settings.SWITCH_POLL_ACCESS_DAYS)
+            top_ids = (
+                Switch.objects.filter(status=SWITCH_STATUS_ACTIVE, last_accessed__gte=cutoff)
+                .order_by("-access_count")
+                .values_list("id", flat=True)[: settings.SWITCH_POLL_TOP_COUNT]
+            )
+            selected |= Q(id__in=list(top_ids))
+        return list(Switch.objects.filter(selected, status=SWITCH_STATUS_ACTIVE))
+
+    def is_due(self, switch: Switch, now: float) -> bool:
+        """Check if the device needs to be read, ie. no errors are pending, and the cached data is old or missing."""
+        if switch.id in self.backoff and self.backoff[switch.id][1] > now:
+            return False
+        age = get_snapshot_age(switch_id=switch.id)
+        # the data may also have been read recently by a user:
+        return age is None or age >= self.interval
+
+    def poll_switches(self, executor: concurrent.futures.ThreadPoolExecutor):
+        """Read all devices that are due, in parallel, and wait for them to finish."""
+        now = time.time()
+        due = [switch for switch in self.get_switches() if self.is_due(switch, now)]
+        if not due:
+            return
+        if self.verbosity > 1:
+            self.stdout.write(f"Polling {len(due)} devices:")
+        futures = {executor.submit(self.poll_switch, switch): switch for switch in due}
+        for future in concurrent.futures.as_completed(futures):
+            switch = futures[future]
+            error = future.result()
+            if error:
+                errors = self.backoff.get(switch.id, (0, 0))[0] + 1
+                delay = min(self.interval * 2 ** (errors - 1), settings.SWITCH_POLL_MAX_BACKOFF)
+                self.backoff[switch.id] = (errors, time.time() + delay)
+                self.stderr.write(f"\t{switch.name}: {error} (error {errors}, next poll in {delay} seconds)")
+            else:
+                self.backoff.pop(switch.id, None)
+                if self.verbosity > 1:
+                    self.stdout.write(f"\t{switch.name}: OK")
+
+    def poll_switch(self, switch: Switch) -> str:
+        """
+        Read the basic info of a device, and save it in the shared snapshot cache.
+        This runs in a worker thread.
+
+        Args:
+            switch (Switch): the device to read.
+
+        Returns:
+            (str): an error description, or "" on success.
+        """
+        try:
+            group = switch.switchgroups.first()
+            if not group:
+                return "device is not a member of any group"
+            conn = get_connection_object(request=None, group=group, switch=switch)
+            conn.read_in_background = True
+            if not conn.get_basic_info() or conn.error.status:
+                return f"cannot read device: {conn.error.description}"
+            conn.save_cache()
+            return ""
+        except Exception as err:
+            return f"cannot read device: {err}"
+        finally:
+            # every worker thread has its own database connection:
+            close_old_connections()
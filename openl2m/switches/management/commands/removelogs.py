@@ -21,20 +21,77 @@
 # this is heavily inspired by the Netbox housekeeping code in
 # /netbox/extras/management/commands/housekeeping.py
 #
+# Entries are deleted in chunks of ids, each in its own transaction, with a short pause in between,
+# so the web application is not blocked. If interrupted, simply run again to continue.
+# Optionally, the entries are first saved to a compressed archive file, in JSON lines format.
+# Entries that are already in the archive, e.g. after a failed run, are not saved again.
+#
+# Usage: python3 manage.py removelogs [--dry-run] [--chunk 10000] [--pause 0.1] [--archive <file.jsonl.gz>]
+#
 
 from datetime import timedelta
+import gzip
+import json
+import time
 
 from django.conf import settings
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import Max, Min
 from django.utils import timezone
-from django.db import DEFAULT_DB_ALIAS
 
 from switches.models import Log
+from switches.partitions import (
+    create_log_partitions,
+    drop_log_partitions,
+    get_expired_log_partitions,
+    is_log_partitioned,
+)
+
+# the log fields written to the archive, with the names instead of ids of related objects:
+ARCHIVE_FIELDS = (
+    "id",
+    "timestamp",
+    "user__username",
+    "group__name",
+    "switch__name",
+    "if_index",
+    "if_name",
+    "ip_address",
+    "type",
+    "action",
+    "description",
+)
 
 
 class Command(BaseCommand):
     help = "Remove log entries older then configured number of days."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only show how many log entries would be removed.",
+        )
+        parser.add_argument(
+            "--chunk",
+            type=int,
+            default=10000,
+            help="The range of log ids to delete per transaction. Default is 10000.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.1,
+            help="Seconds to pause between chunks, to leave room for other database work. Default is 0.1",
+        )
+        parser.add_argument(
+            "--archive",
+            default="",
+            help="Append the removed entries to this gzip compressed JSON lines file, before deleting them.",
+        )
+
     def handle(self, *args, **options):
         # Remove log entries older then configured value...
         self.stdout.write("Checking for old log entries to remove:")
@@ -43,20 +100,111 @@ class Command(BaseCommand):
             if options["verbosity"] > 1:
                 self.stdout.write(f"\tRetention period: {settings.LOG_MAX_AGE} days")
                 self.stdout.write(f"\tCut-off time: {cutoff}")
-            expired_records = Log.objects.filter(timestamp__lt=cutoff).count()
-            if expired_records:
-                self.stdout.write(
-                    f"\tDeleting {expired_records} expired log records... ", self.style.WARNING, ending=""
-                )
-                self.stdout.flush()
-                try:
-                    Log.objects.filter(timestamp__lt=cutoff)._raw_delete(using=DEFAULT_DB_ALIAS)
-                except Exception:
-                    self.stderr.write("Error deleting log entries!")
-                self.stdout.write("Done!", self.style.WARNING)
+            partitioned = is_log_partitioned()
+            if options["dry_run"]:
+                self.estimate(cutoff=cutoff, partitioned=partitioned, options=options)
             else:
-                self.stdout.write("\tNo expired log records found.")
+                # without archive, drop the monthly partitions that are completely expired first, this is fast.
+                # With archive, the entries are saved and deleted first, and the empty partitions dropped after.
+                if partitioned and not options["archive"]:
+                    for name in drop_log_partitions(cutoff=cutoff):
+                        self.stdout.write(f"\tDropped expired log partition {name}")
+                self.remove_entries(cutoff=cutoff, options=options)
+                if partitioned:
+                    for name in drop_log_partitions(cutoff=cutoff):
+                        self.stdout.write(f"\tDropped expired log partition {name}")
+                    # and create the coming months:
+                    for name in create_log_partitions():
+                        if options["verbosity"] > 1:
+                            self.stdout.write(f"\tCreated log partition {name}")
         else:
             self.stdout.write(f"\tNo-Op: No log maximum age set! (LOG_MAX_AGE = {settings.LOG_MAX_AGE})")
 
         self.stdout.write("Finished.", self.style.SUCCESS)
+
+    def estimate(self, cutoff, partitioned: bool, options):
+        """Show what would be removed, without changing anything."""
+        if partitioned and not options["archive"]:
+            for name in get_expired_log_partitions(cutoff=cutoff):
+                self.stdout.write(f"\tWould drop expired log partition {name}")
+        expired = Log.objects.filter(timestamp__lt=cutoff)
+        count = expired.count()
+        if not count:
+            self.stdout.write("\tNo expired log records found.")
+            return
+        id_range = expired.aggregate(first=Min("id"), last=Max("id"))
+        chunks = (id_range["last"] - id_range["first"]) // max(options["chunk"], 1) + 1
+        self.stdout.write(
+            f"\tWould delete {count} expired log records, ids {id_range['first']} to {id_range['last']}, "
+            f"in {chunks} chunks of {options['chunk']} ids (at least {chunks * options['pause']:.0f} seconds)."
+        )
+
+    def remove_entries(self, cutoff, options):
+        """Delete the expired entries in chunks of ids, optionally archiving them first."""
+        expired = Log.objects.filter(timestamp__lt=cutoff)
+        id_range = expired.aggregate(first=Min("id"), last=Max("id"))
+        if id_range["first"] is None:
+            self.stdout.write("\tNo expired log records found.")
+            return
+        chunk = max(options["chunk"], 1)
+        total = id_range["last"] - id_range["first"] + 1
+        self.stdout.write(
+            f"\tDeleting expired log records, ids {id_range['first']} to {id_range['last']}:", self.style.WARNING
+        )
+        archive = None
+        last_archived_id = 0
+        if options["archive"]:
+            last_archived_id = self.get_last_archived_id(options["archive"])
+            archive = gzip.open(options["archive"], "at", encoding="utf-8")
+        deleted = 0
+        last_report = time.monotonic()
+        start_id = id_range["first"]
+        try:
+            while start_id <= id_range["last"]:
+                rows = expired.filter(id__gte=start_id, id__lt=start_id + chunk)
+                if archive:
+                    archive_rows = rows.filter(id__gt=last_archived_id).order_by("id")
+                    for row in archive_rows.values(*ARCHIVE_FIELDS).iterator(chunk_size=2000):
+                        archive.write(json.dumps(row, cls=DjangoJSONEncoder) + "\n")
+                    # make sure the entries are on disk before they are deleted:
+                    archive.flush()
+                with transaction.atomic():
+                    deleted += rows._raw_delete(using=DEFAULT_DB_ALIAS)
+                start_id += chunk
+                if options["verbosity"] > 1 or time.monotonic() - last_report > 5:
+                    done = min(start_id - id_range["first"], total)
+                    self.stdout.write(f"\t{deleted} deleted, {done * 100 // total}% of id range done")
+                    last_report = time.monotonic()
+                if options["pause"]:
+                    time.sleep(options["pause"])
+        except KeyboardInterrupt:
+            self.stdout.write(f"\tInterrupted after deleting {deleted} records, run again to continue.")
+            raise
+        except Exception as err:
+            self.stdout.write(f"\tFailed after deleting {deleted} records, run again to continue.")
+            raise CommandError(f"Error deleting log entries: {err}") from err
+        finally:
+            if archive:
+                archive.close()
+        self.stdout.write(f"\t{deleted} expired log records deleted.", self.style.WARNING)
+
+    def get_last_archived_id(self, filename: str) -> int:
+        """
+        Get the highest log id in an existing archive file. Entries are archived in order of id, before they are
+        deleted. If a delete failed, the next run finds those entries again, and only archives the ones after this.
+        """
+        last_id = 0
+        try:
+            with gzip.open(filename, "rt", encoding="utf-8") as archive:
+                for line in archive:
+                    try:
+                        last_id = max(last_id, json.loads(line)["id"])
+                    except (ValueError, KeyError, TypeError):
+                        # e.g. a line that was not written completely
+                        continue
+        except FileNotFoundError:
+            return 0
+        except (OSError, EOFError) as err:
+            # e.g. the end of the file was not written completely:
+            self.stderr.write(f"Warning: cannot read all of archive '{filename}': {err}")
+        return last_id
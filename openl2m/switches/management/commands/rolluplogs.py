@@ -0,0 +1,46 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+
+# Custom command line commands, see also:
+#    https://docs.djangoproject.com/en/2.2/howto/custom-management-commands/
+
+#
+# add the command 'rolluplogs' to store the hourly and daily usage counts of the activity log,
+# so the usage statistics do not have to count all log entries every time. See switches/rollups.py
+# Run this regularly, e.g. every 10 minutes from cron. Any time not rolled up yet is counted from the logs.
+#
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from switches.rollups import ROLLUP_BACKFILL_DAYS, remove_rollups, update_rollups
+
+
+class Command(BaseCommand):
+    help = "Update the hourly and daily usage rollups of the activity log."
+
+    def handle(self, *args, **options):
+        self.stdout.write("Updating log rollups:")
+        count = update_rollups()
+        if options["verbosity"] > 1:
+            self.stdout.write(f"\t{count} rollups updated.")
+        # keep the daily rollups as long as the logs, but at least for the longest usage window:
+        cutoff = timezone.now() - timedelta(days=max(settings.LOG_MAX_AGE or 0, ROLLUP_BACKFILL_DAYS + 1))
+        count = remove_rollups(cutoff=cutoff)
+        if count and options["verbosity"] > 1:
+            self.stdout.write(f"\t{count} old rollups removed.")
+        self.stdout.write("Finished.", self.style.SUCCESS)
@@ -0,0 +1,22 @@
+# Generated by Django 6.0.7 on 2026-10-18 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('switches', '0068_switch_read_hardware_details_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='switch',
+            name='background_poll',
+            field=models.BooleanField(
+                default=False,
+                help_text='If set, the background poller keeps recent device data in the shared cache.',
+                verbose_name='Background Poll',
+            ),
+        ),
+    ]
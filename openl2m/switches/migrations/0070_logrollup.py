@@ -0,0 +1,38 @@
+# Generated by Django 6.0.7 on 2026-10-18 11:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('switches', '0069_switch_background_poll'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.PositiveSmallIntegerField(choices=[[1, 'Hour'], [2, 'Day']], default=1)),
+                ('start', models.DateTimeField()),
+                ('end', models.DateTimeField()),
+                ('views', models.PositiveIntegerField(default=0)),
+                ('changes', models.PositiveIntegerField(default=0)),
+                ('commands', models.PositiveIntegerField(default=0)),
+                ('api_calls', models.PositiveIntegerField(default=0)),
+                (
+                    'viewed_device_ids',
+                    models.JSONField(default=list, help_text='The devices that were viewed or changed.'),
+                ),
+                ('device_ids', models.JSONField(default=list, help_text='The devices with any log entry.')),
+                ('user_ids', models.JSONField(default=list, help_text='The users that logged in.')),
+            ],
+            options={
+                'verbose_name': 'Log Rollup',
+                'verbose_name_plural': 'Log Rollups',
+                'ordering': ['period', 'start'],
+                'unique_together': {('period', 'start')},
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-18 07:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('switches', '0072_alter_log_timestamp'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                (
+                    'timestamp',
+                    models.DateTimeField(blank=True, help_text='The timestamp of the last log entry sent.', null=True),
+                ),
+                ('log_id', models.BigIntegerField(default=0, help_text='The id of the last log entry sent.')),
+            ],
+            options={
+                'verbose_name': 'Log Checkpoint',
+                'verbose_name_plural': 'Log Checkpoints',
+                'ordering': ['name'],
+            },
+        ),
+    ]
@@ -12,11 +12,11 @@
 # License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
 #
 import datetime
-import logging.handlers
 import json
 
 from django.db import models
 from django.conf import settings
+from django.core.cache import cache
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
 from django.contrib.auth.models import User
@@ -28,8 +28,11 @@ from ordered_model.models import OrderedModelManager, OrderedModel
 
 from rangeparser import RangeParser
 
+from counters.constants import COUNTER_PERMISSION_CHANGES
+from counters.models import Counter
 from switches import constants
 from switches.connect.constants import NETMIKO_DEVICE_TYPES, NAPALM_DEVICE_TYPES
+from switches.logwriter import get_log_buffer, get_syslog_forwarder
 from switches.utils import is_valid_hostname_or_ip, is_valid_hostname_or_ip6
 
 
@@ -877,6 +880,11 @@ class Switch(models.Model):
         verbose_name="Read Hardware Details",
         help_text="If set, read hardware details from device.",
     )
+    background_poll = models.BooleanField(
+        default=False,
+        verbose_name="Background Poll",
+        help_text="If set, the background poller keeps recent device data in the shared cache.",
+    )
     status = models.PositiveSmallIntegerField(
         choices=constants.SWITCH_STATUS_CHOICES,
         default=constants.SWITCH_STATUS_ACTIVE,
@@ -1240,6 +1248,34 @@ class SwitchGroup(models.Model):
     def get_switchgroup_users(self):
         return ",".join([str(u) for u in self.users.all()])
 
+    def get_allowed_vlan_ids(self) -> set[int]:
+        """
+        Get the vlan id's that regular users can manage in this group, from the allowed VLAN Groups and VLANs.
+        This ignores 'allow_all_vlans'. The result is cached per permissions version, see switches/signals.py
+
+        Returns:
+            (set): the allowed vlan id's
+        """
+        version = get_permissions_version()
+        cache_key = f"openl2m-group-vlans-{self.id}-{version}"
+        if settings.PERMISSIONS_CACHE_TIMEOUT and version is not None:
+            vlan_ids = cache.get(cache_key)
+            if vlan_ids is not None:
+                return vlan_ids
+        vlan_ids = set(self.vlans.values_list("vid", flat=True))
+        vlan_ids.update(VLAN.objects.filter(vlangroups__vlangroups=self).values_list("vid", flat=True))
+        if settings.PERMISSIONS_CACHE_TIMEOUT and version is not None:
+            cache.set(cache_key, vlan_ids, timeout=settings.PERMISSIONS_CACHE_TIMEOUT)
+        return vlan_ids
+
+
+def get_permissions_version() -> int | None:
+    """Get the current version of the device permissions, i.e. the number of changes to devices, groups,
+    group membership and vlans, see switches/signals.py
+    Returns None if the counter does not exist, and the permissions cannot be cached.
+    """
+    return Counter.objects.filter(name=COUNTER_PERMISSION_CHANGES).values_list("value", flat=True).first()
+
 
 # needed classes for django-ordered-model:
 class SwitchesManager(OrderedModelManager):
@@ -1276,9 +1312,13 @@ class Log(models.Model):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # True while waiting in the log buffer, or being written by it, see save()
+        self._buffered = False
 
     timestamp = models.DateTimeField(
-        auto_now_add=True,  # set on save, do not allow changes in code.
+        # set when created, not when written, as writes can be buffered. Do not allow changes in the admin.
+        default=timezone.now,
+        editable=False,
         blank=True,
         null=True,
     )
@@ -1347,26 +1387,18 @@ class Log(models.Model):
 
         # here is the actual work of saving:
         # see https://docs.djangoproject.com/en/2.2/topics/db/models/#overriding-predefined-model-methods
-        super().save(*args, **kwargs)
+        # new entries are written in batches, see switches/logwriter.py
+        log_buffer = get_log_buffer() if (self.pk is None or self._buffered) and not args and not kwargs else None
+        if not log_buffer or not log_buffer.add(self):
+            super().save(*args, **kwargs)
 
-        # if requested, also sent to Syslog host
+        # if requested, also sent to Syslog host, from a background thread.
         # should this action be sent to syslog? Either all, or partial list
         if settings.SYSLOG_HOST and (not settings.SYSLOG_ACTIONS or self.action in self.syslog_action_list):
-            # we are defining a logger, and then check if it has a handler.
-            # each time you create a named logger, python will add handler to existing,
-            # even if you delete the object. this is a 'globally' defined logger in apps.py :
-            syslogger = logging.getLogger("openl2m_log_to_syslog")
-            if not syslogger.hasHandlers():
-                handler = logging.handlers.SysLogHandler(
-                    address=(settings.SYSLOG_HOST, settings.SYSLOG_PORT), facility=settings.SYSLOG_FACILITY
-                )
-                syslogger.addHandler(handler)
-            syslogger.setLevel(settings.SYSLOG_LEVEL)
-            # syslogger.setLevel(logging.DEBUG)
             if settings.SYSLOG_JSON:
-                syslogger.info(self.as_json())
+                get_syslog_forwarder().send(self.as_json())
             else:
-                syslogger.info(self.as_string())
+                get_syslog_forwarder().send(self.as_string())
 
     def as_string(self):
         """
@@ -1416,3 +1448,85 @@ class Log(models.Model):
     class Meta:
         ordering = ["timestamp"]
         verbose_name_plural = "Activity Logs"
+        # indexes for the common log queries. The timestamp is part of all, so they also work on
+        # the monthly partitions of a partitioned log table (see switches/partitions.py)
+        indexes = [
+            # device "Recent Activity" and device activity pages:
+            models.Index(fields=["switch", "type", "-timestamp"], name="log_switch_type_ts_idx"),
+            # usage statistics and Top Activity:
+            models.Index(fields=["type", "timestamp"], name="log_type_ts_idx"),
+            # activity per user, in the admin logs page:
+            models.Index(fields=["user", "timestamp"], name="log_user_ts_idx"),
+            # the (unfiltered) admin logs page, log removal and rollups:
+            models.Index(fields=["timestamp"], name="log_ts_idx"),
+        ]
+
+
+class LogRollup(models.Model):
+    """
+    The aggregated usage counts of the Log() entries of one hour or one day.
+    These are created by the "rolluplogs" command, and used for the usage statistics.
+    See switches/rollups.py
+    """
+
+    period = models.PositiveSmallIntegerField(
+        choices=constants.ROLLUP_PERIOD_CHOICES,
+        default=constants.ROLLUP_PERIOD_HOUR,
+    )
+    start = models.DateTimeField()
+    end = models.DateTimeField()
+    views = models.PositiveIntegerField(default=0)
+    changes = models.PositiveIntegerField(default=0)
+    commands = models.PositiveIntegerField(default=0)
+    api_calls = models.PositiveIntegerField(default=0)
+    # distinct ids, so counts over multiple periods can be calculated:
+    viewed_device_ids = models.JSONField(
+        default=list,
+        help_text="The devices that were viewed or changed.",
+    )
+    device_ids = models.JSONField(
+        default=list,
+        help_text="The devices with any log entry.",
+    )
+    user_ids = models.JSONField(
+        default=list,
+        help_text="The users that logged in.",
+    )
+
+    def __str__(self):
+        return f"{self.get_period_display()} {self.start}"
+
+    class Meta:
+        ordering = ["period", "start"]
+        unique_together = ["period", "start"]
+        verbose_name = "Log Rollup"
+        verbose_name_plural = "Log Rollups"
+
+
+class LogCheckpoint(models.Model):
+    """
+    The last Log() entry sent by "maillogs --checkpoint <name>", so the next run only sends the entries after it.
+    Entries are compared by (timestamp, id), as the ids of buffered entries are assigned when they are written.
+    """
+
+    name = models.CharField(
+        max_length=64,
+        unique=True,
+    )
+    timestamp = models.DateTimeField(
+        blank=True,
+        null=True,
+        help_text="The timestamp of the last log entry sent.",
+    )
+    log_id = models.BigIntegerField(
+        default=0,
+        help_text="The id of the last log entry sent.",
+    )
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        ordering = ["name"]
+        verbose_name = "Log Checkpoint"
+        verbose_name_plural = "Log Checkpoints"
@@ -0,0 +1,194 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Optional monthly partitioning of the Log() table, on PostgreSQL.
+
+The "partitionlogs --convert" command changes the log table into a table partitioned by range on the timestamp,
+with one partition per month (in UTC), e.g. "switches_log_y2026m10", and a default partition for anything else.
+Django does not need to know about this, all queries work as before.
+Old logs can then be removed by dropping whole partitions, instead of deleting rows (see "removelogs").
+The "removelogs" command also creates the partitions of the coming months, so the default partition stays empty.
+"""
+
+import datetime
+
+from django.db import connection, transaction
+
+from switches.models import Log
+from switches.utils import dprint
+
+LOG_TABLE = Log._meta.db_table
+LOG_DEFAULT_PARTITION = f"{LOG_TABLE}_default"
+# the number of months of partitions to create ahead of time:
+LOG_PARTITION_MONTHS_AHEAD = 3
+
+
+def get_month_start(moment: datetime.datetime, months: int = 0) -> datetime.datetime:
+    """Return the (UTC) start of the month of the given time, optionally a number of months later."""
+    month_index = moment.year * 12 + moment.month - 1 + months
+    return datetime.datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def get_partition_name(month_start: datetime.datetime) -> str:
+    """Return the name of the log partition of the month starting at the given time."""
+    return f"{LOG_TABLE}_y{month_start.year:04d}m{month_start.month:02d}"
+
+
+def parse_partition_name(name: str) -> datetime.datetime | None:
+    """Return the start of the month of a log partition name, or None for the default partition."""
+    try:
+        year, month = name.removeprefix(f"{LOG_TABLE}_y").split("m")
+        return datetime.datetime(int(year), int(month), 1, tzinfo=datetime.timezone.utc)
+    except ValueError:
+        return None
+
+
+def is_log_partitioned() -> bool:
+    """Return True if the log table is a partitioned (PostgreSQL) table."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)", [LOG_TABLE])
+        row = cursor.fetchone()
+    return bool(row) and row[0] == "p"
+
+
+def get_log_partitions() -> list[str]:
+    """Return the names of the partitions of the log table, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = to_regclass(%s) ORDER BY c.relname",
+            [LOG_TABLE],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+def create_log_partitions(
+    first: datetime.datetime | None = None, months_ahead: int = LOG_PARTITION_MONTHS_AHEAD
+) -> list:
+    """Create the missing monthly partitions, from the month of 'first' up to months_ahead after the current month.
+
+    Args:
+        first (datetime): the first month to create, defaults to the current month.
+        months_ahead (int): the number of months after the current month to create.
+
+    Returns:
+        (list): the names of the partitions created.
+    """
+    now = datetime.datetime.now(tz=datetime.timezone.utc)
+    month = get_month_start(first or now)
+    last = get_month_start(now, months=months_ahead)
+    existing = set(get_log_partitions())
+    created = []
+    with connection.cursor() as cursor:
+        while month <= last:
+            name = get_partition_name(month)
+            if name not in existing:
+                dprint(f"create_log_partitions(): creating {name}")
+                cursor.execute(
+                    f'CREATE TABLE "{name}" PARTITION OF "{LOG_TABLE}" FOR VALUES FROM (%s) TO (%s)',
+                    [month, get_month_start(month, months=1)],
+                )
+                created.append(name)
+            month = get_month_start(month, months=1)
+    return created
+
+
+def get_expired_log_partitions(cutoff: datetime.datetime) -> list:
+    """Return the names of the monthly partitions that only hold log entries from before the cutoff time."""
+    expired = []
+    for name in get_log_partitions():
+        month = parse_partition_name(name)
+        if month and get_month_start(month, months=1) <= cutoff:
+            expired.append(name)
+    return expired
+
+
+def drop_log_partitions(cutoff: datetime.datetime) -> list:
+    """Drop the monthly partitions that only hold log entries from before the cutoff time.
+
+    Args:
+        cutoff (datetime): the time before which log entries can be removed.
+
+    Returns:
+        (list): the names of the partitions dropped.
+    """
+    dropped = get_expired_log_partitions(cutoff=cutoff)
+    with connection.cursor() as cursor:
+        for name in dropped:
+            dprint(f"drop_log_partitions(): dropping {name}")
+            cursor.execute(f'DROP TABLE "{name}"')
+    return dropped
+
+
+def convert_log_table(months_ahead: int = LOG_PARTITION_MONTHS_AHEAD) -> int:
+    """Convert the regular log table into a monthly partitioned table, keeping all entries, indexes,
+    foreign keys and the next id. Runs in a single transaction, and locks the log table while copying.
+    Log entries without timestamp get the oldest timestamp, as the partition key cannot be empty.
+
+    Args:
+        months_ahead (int): the number of months after the current month to create partitions for.
+
+    Returns:
+        (int): the number of log entries copied.
+    """
+    old_table = f"{LOG_TABLE}_unpartitioned"
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE "{LOG_TABLE}" IN ACCESS EXCLUSIVE MODE')
+        # the definitions to recreate on the new table:
+        cursor.execute(
+            "SELECT c.relname, i.indisprimary, pg_get_indexdef(i.indexrelid) FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid WHERE i.indrelid = to_regclass(%s)",
+            [LOG_TABLE],
+        )
+        indexes = cursor.fetchall()
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = to_regclass(%s) AND contype = 'f'",
+            [LOG_TABLE],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(f'SELECT MIN(timestamp) FROM "{LOG_TABLE}"')
+        oldest = cursor.fetchone()[0] or datetime.datetime.now(tz=datetime.timezone.utc)
+        cursor.execute(f'UPDATE "{LOG_TABLE}" SET timestamp = %s WHERE timestamp IS NULL', [oldest])
+
+        # the table and index names must be free for the new table:
+        cursor.execute(f'ALTER TABLE "{LOG_TABLE}" RENAME TO "{old_table}"')
+        for index_name, _, _ in indexes:
+            cursor.execute(f'ALTER INDEX "{index_name}" RENAME TO "{index_name}_old"')
+        cursor.execute(
+            f'CREATE TABLE "{LOG_TABLE}" (LIKE "{old_table}" INCLUDING CONSTRAINTS) PARTITION BY RANGE (timestamp)'
+        )
+        cursor.execute(f'CREATE TABLE "{LOG_DEFAULT_PARTITION}" PARTITION OF "{LOG_TABLE}" DEFAULT')
+        create_log_partitions(first=oldest, months_ahead=months_ahead)
+        cursor.execute(f'INSERT INTO "{LOG_TABLE}" SELECT * FROM "{old_table}"')
+        count = cursor.rowcount
+        # adding the keys and indexes after copying is faster. Unique keys must include the partition key:
+        cursor.execute(f'ALTER TABLE "{LOG_TABLE}" ADD PRIMARY KEY (id, timestamp)')
+        # the definitions were read before the rename, so refer to the new table:
+        for _, primary, definition in indexes:
+            if not primary:
+                cursor.execute(definition)
+        for name, definition in foreign_keys:
+            cursor.execute(f'ALTER TABLE "{LOG_TABLE}" ADD CONSTRAINT "{name}" {definition}')
+        cursor.execute(f'DROP TABLE "{old_table}"')
+        # the id sequence (serial or identity) was dropped with the old table, so create a new one:
+        sequence = f"{LOG_TABLE}_id_seq"
+        cursor.execute(f'CREATE SEQUENCE "{sequence}" OWNED BY "{LOG_TABLE}".id')
+        cursor.execute(
+            f"SELECT setval('{sequence}'::regclass, COALESCE((SELECT MAX(id) FROM \"{LOG_TABLE}\"), 0) + 1, false)"
+        )
+        cursor.execute(f"ALTER TABLE \"{LOG_TABLE}\" ALTER COLUMN id SET DEFAULT nextval('{sequence}'::regclass)")
+    return count
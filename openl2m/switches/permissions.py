@@ -15,6 +15,9 @@
 #
 # Functions that perform actions on interfaces, called by both the WEB UI and REST API
 #
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Prefetch
 from django.http.request import HttpRequest
 
 from rest_framework import status as http_status
@@ -36,10 +39,11 @@ from switches.constants import (
     LOG_INTERFACE_NOT_FOUND,
     LOG_INTERFACE_DENIED,
     LOG_DENIED,
+    PERMISSIONS_SWITCH_FIELDS,
     SWITCH_STATUS_ACTIVE,
 )
 from switches.connect.connect import get_connection_object
-from switches.models import Log, Switch, SwitchGroup
+from switches.models import Log, Switch, SwitchGroup, get_permissions_version
 from switches.utils import dprint, get_remote_ip, get_from_http_session
 
 # ###################################################
@@ -61,61 +65,99 @@ def get_my_device_groups(request: HttpRequest) -> dict:
 
     Note: all dict keys are "str" type, needed for caching in Django 5 sessions,
         using the JSON Session Serializer (ie JSONSerializer)
+
+    The result is cached for PERMISSIONS_CACHE_TIMEOUT seconds, per user and permissions version.
     """
     dprint("get_my_device_groups()")
+    version = get_permissions_version()
+    cache_key = get_permissions_cache_key(request=request, version=version)
+    if settings.PERMISSIONS_CACHE_TIMEOUT and version is not None:
+        permissions = cache.get(cache_key)
+        if permissions is not None:
+            dprint("  Cached!")
+            return permissions
+
     if request.user.is_superuser or request.user.is_staff:
         dprint("  Superuser or Staff!")
-        # optimize data queries, get all related field at once!
-        groups = SwitchGroup.objects.all().order_by("name")
+        groups = SwitchGroup.objects.all()
     else:
         # figure out what this user has access to.
         # Note we use the ManyToMany 'related_name' attribute for readability!
         dprint("  Regular user.")
-        groups = request.user.switchgroups.all().order_by("name")
+        groups = request.user.switchgroups.all()
+    # optimize data queries, count and read the switches of all groups at once!
+    groups = (
+        groups.annotate(switch_count=Count("switches", distinct=True))
+        .filter(switch_count__gt=0)
+        .prefetch_related(
+            Prefetch(
+                "switches",
+                queryset=Switch.objects.filter(status=SWITCH_STATUS_ACTIVE).only(*PERMISSIONS_SWITCH_FIELDS),
+                to_attr="active_switches",
+            )
+        )
+        .order_by("name")
+    )
 
     # now find active devices in these groups
     permissions = {}
     for group in groups:
-        if group.switches.count():
-            # set this group, and the switches, in web session to track permissions
-            group_info = {
-                "name": group.name,
-                "description": group.description,
-                "display_name": group.display_name,
-                "read_only": group.read_only,
-                "comments": group.comments,
+        # set this group, and the switches, in web session to track permissions
+        group_info = {
+            "name": group.name,
+            "description": group.description,
+            "display_name": group.display_name,
+            "read_only": group.read_only,
+            "comments": group.comments,
+        }
+        members = {}
+        for switch in group.active_switches:
+            # we save the names as well, so we can search them!
+            members[str(switch.id)] = {
+                "name": switch.name,
+                "hostname": switch.hostname,
+                "description": switch.description,
+                "default_view": switch.default_view,
+                "default_view_name": switch.get_default_view_display(),
+                "url": rest_reverse(
+                    "switches-api:api_switch_view",
+                    request=request,
+                    kwargs={"group_id": group.id, "switch_id": switch.id},
+                ),
+                "connector_type": switch.connector_type,
+                "connector_type_name": switch.get_connector_type_display(),
+                "read_only": switch.read_only,
+                "primary_ipv4": switch.primary_ip4,
+                "comments": switch.comments,
+                "driver_info": switch.driver_info,
             }
-            members = {}
-            for switch in group.switches.all():
-                if switch.status == SWITCH_STATUS_ACTIVE:
-                    # we save the names as well, so we can search them!
-                    members[str(switch.id)] = {
-                        "name": switch.name,
-                        "hostname": switch.hostname,
-                        "description": switch.description,
-                        "default_view": switch.default_view,
-                        "default_view_name": switch.get_default_view_display(),
-                        "url": rest_reverse(
-                            "switches-api:api_switch_view",
-                            request=request,
-                            kwargs={"group_id": group.id, "switch_id": switch.id},
-                        ),
-                        "connector_type": switch.connector_type,
-                        "connector_type_name": switch.get_connector_type_display(),
-                        "read_only": switch.read_only,
-                        "primary_ipv4": switch.primary_ip4,
-                        "comments": switch.comments,
-                        "driver_info": switch.driver_info,
-                    }
-                    if switch.nms_id:
-                        members[str(switch.id)]["nms_id"] = switch.nms_id
-                    else:
-                        members[str(switch.id)]["nms_id"] = ""
-            group_info["members"] = members
-            permissions[str(group.id)] = group_info
+            if switch.nms_id:
+                members[str(switch.id)]["nms_id"] = switch.nms_id
+            else:
+                members[str(switch.id)]["nms_id"] = ""
+        group_info["members"] = members
+        permissions[str(group.id)] = group_info
+
+    if settings.PERMISSIONS_CACHE_TIMEOUT and version is not None:
+        cache.set(cache_key, permissions, timeout=settings.PERMISSIONS_CACHE_TIMEOUT)
     return permissions
 
 
+def get_permissions_cache_key(request: HttpRequest, version: int | None) -> str:
+    """Get the key of the cached device permissions of the user of this request, for the given permissions version.
+
+    Args:
+        request: current HttpRequest() object
+        version (int): the permissions version, see get_permissions_version()
+
+    Returns:
+        (str): the cache key.
+    """
+    is_admin = request.user.is_superuser or request.user.is_staff
+    # the device urls include the scheme and host name of the request:
+    return f"openl2m-permissions-{request.user.id}-{int(is_admin)}-{version}-{request.scheme}-{request.get_host()}"
+
+
 def get_group_and_switch(request: HttpRequest, group_id: int, switch_id: int) -> tuple[SwitchGroup, Switch]:
     """
     Get the Group() and Switch() if the current user has rights.
@@ -0,0 +1,211 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Usage statistics rollups.
+
+The "rolluplogs" command stores the usage counts of the activity log per hour and per day
+in LogRollup() entries. The usage statistics then read these few rollups, and only query the
+log entries for the part of a time window that is not rolled up yet (normally the current hour).
+If the rollups are missing (e.g. the command has not run), the log entries are queried instead,
+so the results are always the same, only slower.
+
+Hours and days follow the local time zone, so "today" starts at local midnight.
+"""
+
+import datetime
+
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from switches.constants import (
+    LOG_TYPE_CHANGE,
+    LOG_TYPE_COMMAND,
+    LOG_TYPE_LOGIN_OUT,
+    LOG_TYPE_VIEW,
+    LOG_LOGIN_REST_API,
+    ROLLUP_PERIOD_DAY,
+    ROLLUP_PERIOD_HOUR,
+)
+from switches.models import Log, LogRollup
+from switches.utils import dprint
+
+# the number of days of daily rollups created the first time, this covers the longest usage window:
+ROLLUP_BACKFILL_DAYS = 31
+# hourly rollups are only used for the current day, so are removed after this many days:
+ROLLUP_HOURLY_KEEP_DAYS = 2
+
+
+def get_hour_start(moment: datetime.datetime) -> datetime.datetime:
+    """Return the start of the (local time) hour of the given time."""
+    return timezone.localtime(moment).replace(minute=0, second=0, microsecond=0)
+
+
+def get_day_start(day: datetime.date) -> datetime.datetime:
+    """Return the (local time) midnight at the start of the given day."""
+    return timezone.make_aware(datetime.datetime.combine(day, datetime.time.min))
+
+
+def get_log_usage(start: datetime.datetime, end: datetime.datetime) -> dict:
+    """Count the usage in the log entries from start up to end, in a single query.
+
+    Args:
+        start (datetime): the start time, inclusive.
+        end (datetime): the end time, exclusive.
+
+    Returns:
+        (dict): the counts, with the same keys as the LogRollup() attributes.
+    """
+    usage = Log.objects.filter(timestamp__gte=start, timestamp__lt=end).aggregate(
+        views=Count("id", filter=Q(type=LOG_TYPE_VIEW)),
+        changes=Count("id", filter=Q(type=LOG_TYPE_CHANGE)),
+        commands=Count("id", filter=Q(type=LOG_TYPE_COMMAND)),
+        api_calls=Count("id", filter=Q(type=LOG_TYPE_LOGIN_OUT, action=LOG_LOGIN_REST_API)),
+        viewed_device_ids=ArrayAgg(
+            "switch_id",
+            distinct=True,
+            filter=Q(type__in=[LOG_TYPE_VIEW, LOG_TYPE_CHANGE], switch_id__isnull=False),
+        ),
+        device_ids=ArrayAgg("switch_id", distinct=True, filter=Q(switch_id__isnull=False)),
+        user_ids=ArrayAgg("user_id", distinct=True, filter=Q(type=LOG_TYPE_LOGIN_OUT, user_id__isnull=False)),
+    )
+    # no matching entries returns None:
+    for name in ("viewed_device_ids", "device_ids", "user_ids"):
+        usage[name] = usage[name] or []
+    return usage
+
+
+class UsageTotals:
+    """The usage counts over a time window, added up from rollups and log entries."""
+
+    def __init__(self):
+        self.views = 0
+        self.changes = 0
+        self.commands = 0
+        self.api_calls = 0
+        self.viewed_device_ids: set[int] = set()
+        self.device_ids: set[int] = set()
+        self.user_ids: set[int] = set()
+
+    def add(self, usage):
+        """Add the counts of a LogRollup() object, or a dict from get_log_usage()"""
+        if isinstance(usage, LogRollup):
+            usage = usage.__dict__
+        self.views += usage["views"]
+        self.changes += usage["changes"]
+        self.commands += usage["commands"]
+        self.api_calls += usage["api_calls"]
+        self.viewed_device_ids.update(usage["viewed_device_ids"])
+        self.device_ids.update(usage["device_ids"])
+        self.user_ids.update(usage["user_ids"])
+
+
+class UsageReader:
+    """
+    Calculate the usage over time windows that end now, from the rollups and the most recent log entries.
+    All rollups that may be needed are read once, when this object is created.
+    """
+
+    def __init__(self, oldest: datetime.datetime, now: datetime.datetime | None = None):
+        """
+        Args:
+            oldest (datetime): the start of the oldest time window that will be requested.
+            now (datetime): the end of all time windows, defaults to the current time.
+        """
+        self.now = now or timezone.now()
+        self.rollups: dict[tuple[int, datetime.datetime], LogRollup] = {
+            (rollup.period, rollup.start): rollup
+            for rollup in LogRollup.objects.filter(start__gte=oldest, end__lte=self.now)
+        }
+        # log entry usage, by start time, so the same tail is only read once:
+        self.tails: dict[datetime.datetime, dict] = {}
+
+    def get_usage(self, start: datetime.datetime) -> UsageTotals:
+        """Get the usage from start to now. Whole days and hours are read from the rollups, as long as
+        they are contiguous, and the remainder from the log entries.
+
+        Args:
+            start (datetime): the start of the time window, should be the start of a (local time) day or hour.
+
+        Returns:
+            (UsageTotals): the usage in the time window.
+        """
+        totals = UsageTotals()
+        cursor = start
+        while cursor < self.now:
+            rollup = self.rollups.get((ROLLUP_PERIOD_DAY, cursor)) or self.rollups.get((ROLLUP_PERIOD_HOUR, cursor))
+            if rollup is None:
+                break
+            totals.add(rollup)
+            cursor = rollup.end
+        if cursor < self.now:
+            if cursor not in self.tails:
+                dprint(f"UsageReader.get_usage(): reading log entries since {cursor}")
+                self.tails[cursor] = get_log_usage(start=cursor, end=self.now)
+            totals.add(self.tails[cursor])
+        return totals
+
+
+def _save_rollup(period: int, start: datetime.datetime, end: datetime.datetime):
+    """Calculate and save the rollup of one hour or day."""
+    usage = get_log_usage(start=start, end=end)
+    usage["end"] = end
+    LogRollup.objects.update_or_create(period=period, start=start, defaults=usage)
+
+
+def update_rollups(now: datetime.datetime | None = None) -> int:
+    """Create the rollups of all completed hours and days since the last run.
+    The most recent existing rollup of each period is calculated again, to include any late log entries.
+
+    Args:
+        now (datetime): the current time, mostly for testing.
+
+    Returns:
+        (int): the number of rollups created or updated.
+    """
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    count = 0
+
+    # the hours of today (and yesterday, on the first run):
+    last = LogRollup.objects.filter(period=ROLLUP_PERIOD_HOUR).order_by("-start").first()
+    cursor = last.start if last else get_day_start(today - datetime.timedelta(days=1))
+    current_hour = get_hour_start(now)
+    while cursor < current_hour:
+        next_hour = get_hour_start(cursor + datetime.timedelta(hours=1))
+        _save_rollup(period=ROLLUP_PERIOD_HOUR, start=cursor, end=next_hour)
+        cursor = next_hour
+        count += 1
+
+    # the days before today:
+    last = LogRollup.objects.filter(period=ROLLUP_PERIOD_DAY).order_by("-start").first()
+    day = timezone.localdate(last.start) if last else today - datetime.timedelta(days=ROLLUP_BACKFILL_DAYS)
+    while day < today:
+        next_day = day + datetime.timedelta(days=1)
+        _save_rollup(period=ROLLUP_PERIOD_DAY, start=get_day_start(day), end=get_day_start(next_day))
+        day = next_day
+        count += 1
+
+    # old hourly rollups are no longer needed:
+    LogRollup.objects.filter(
+        period=ROLLUP_PERIOD_HOUR,
+        start__lt=get_day_start(today - datetime.timedelta(days=ROLLUP_HOURLY_KEEP_DAYS)),
+    ).delete()
+    return count
+
+
+def remove_rollups(cutoff: datetime.datetime) -> int:
+    """Remove the rollups that start before the cutoff time. Returns the number removed."""
+    count, _ = LogRollup.objects.filter(start__lt=cutoff).delete()
+    return count
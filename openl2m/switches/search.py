@@ -0,0 +1,140 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Device search, used by the web ui and REST API.
+
+The devices a user has access to (see get_my_device_groups()) are indexed once per permissions version,
+and the index is kept in the memory of this process. Each device is indexed once, even if it is in several groups.
+A search is a case-insensitive substring match on the name, hostname, description, NMS id and IPv4 address.
+Regular expressions are supported as well, but are slower.
+"""
+
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.http.request import HttpRequest
+
+from switches.models import get_permissions_version
+from switches.permissions import get_my_device_groups, get_permissions_cache_key
+from switches.utils import dprint
+
+# the device fields that are searched:
+SEARCH_FIELDS = ("name", "hostname", "description", "nms_id", "primary_ipv4")
+# the maximum number of indexes kept in the memory of each process, i.e. users searching at the same time:
+SEARCH_INDEX_MAX_ENTRIES = 100
+
+
+class SearchEntry:
+    """A device in the search index, with the groups it is in."""
+
+    def __init__(self, switch_id: str, switch: dict):
+        """
+        Args:
+            switch_id (str): the Switch() pk
+            switch (dict): the device info, as in the permissions returned by get_my_device_groups()
+        """
+        self.switch_id = switch_id
+        self.switch = switch
+        self.fields = [str(switch.get(name) or "") for name in SEARCH_FIELDS]
+        # all fields in lower case, separated by a character that is not in the search text:
+        self.text = "\n".join(self.fields).lower()
+        # list of ((group position, position in group), group id, group name):
+        self.groups: list[tuple[tuple[int, int], str, str]] = []
+
+
+class SwitchSearchIndex:
+    """
+    An index of the devices in the permissions of a user.
+    """
+
+    def __init__(self, permissions: dict):
+        """
+        Args:
+            permissions (dict): the groups and devices, as returned by get_my_device_groups()
+        """
+        self.permissions = permissions
+        self.entries: list[SearchEntry] = []
+        # the entries by lower case name and hostname, for exact matches:
+        self.names: dict[str, list[SearchEntry]] = {}
+        by_switch: dict[str, SearchEntry] = {}
+        for group_position, (group_id, group) in enumerate(permissions.items()):
+            for position, (switch_id, switch) in enumerate(group["members"].items()):
+                entry = by_switch.get(switch_id)
+                if entry is None:
+                    entry = SearchEntry(switch_id=switch_id, switch=switch)
+                    by_switch[switch_id] = entry
+                    self.entries.append(entry)
+                    for name in {switch["name"].lower(), switch["hostname"].lower()}:
+                        self.names.setdefault(name, []).append(entry)
+                entry.groups.append(((group_position, position), group_id, group["name"]))
+
+    def search(self, search: str, regex: bool = False) -> list[SearchEntry]:
+        """Find the devices that contain the search text, or match the regular expression, in any indexed field.
+
+        Args:
+            search (str): the text, or regular expression, to search for.
+            regex (bool): if True, the search text is a regular expression.
+
+        Returns:
+            (list): the matching SearchEntry() objects.
+
+        Raises:
+            re.error: if the regular expression is invalid.
+        """
+        if not regex:
+            search = search.lower()
+            return [entry for entry in self.entries if search in entry.text]
+        pattern = re.compile(search, re.IGNORECASE)
+        return [entry for entry in self.entries if any(pattern.search(field) for field in entry.fields)]
+
+    def find(self, name: str) -> list[SearchEntry]:
+        """Find the devices with this exact (case-insensitive) name or hostname."""
+        return self.names.get(name.lower(), [])
+
+
+_search_indexes: dict[str, tuple[float, SwitchSearchIndex]] = {}
+_search_indexes_lock = threading.Lock()
+
+
+def get_search_index(request: HttpRequest) -> SwitchSearchIndex:
+    """Get the search index of the devices the user of this request has access to.
+    The index is kept per user and permissions version, for at most PERMISSIONS_CACHE_TIMEOUT seconds.
+
+    Args:
+        request: current HttpRequest() object
+
+    Returns:
+        (SwitchSearchIndex): the device search index.
+    """
+    version = get_permissions_version()
+    if not settings.PERMISSIONS_CACHE_TIMEOUT or version is None:
+        return SwitchSearchIndex(permissions=get_my_device_groups(request=request))
+    key = get_permissions_cache_key(request=request, version=version)
+    now = time.monotonic()
+    with _search_indexes_lock:
+        cached = _search_indexes.get(key)
+    if cached and now - cached[0] < settings.PERMISSIONS_CACHE_TIMEOUT:
+        dprint("get_search_index(): cached")
+        return cached[1]
+    dprint("get_search_index(): building index")
+    index = SwitchSearchIndex(permissions=get_my_device_groups(request=request))
+    with _search_indexes_lock:
+        _search_indexes.pop(key, None)
+        _search_indexes[key] = (now, index)
+        while len(_search_indexes) > SEARCH_INDEX_MAX_ENTRIES:
+            # remove the oldest index:
+            del _search_indexes[next(iter(_search_indexes))]
+    return index
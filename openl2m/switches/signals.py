@@ -0,0 +1,76 @@
+#
+# This file is part of Open Layer 2 Management (OpenL2M).
+#
+# OpenL2M is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License version 3 as published by
+# the Free Software Foundation.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU General Public License for
+# more details.  You should have received a copy of the GNU General Public
+# License along with OpenL2M. If not, see <http://www.gnu.org/licenses/>.
+#
+"""
+Invalidate the cached device permissions, see get_my_device_groups() and SwitchGroup.get_allowed_vlan_ids().
+
+Every change to a device, a group, the devices or users in a group, or the allowed vlans,
+increments the "permission_changes" counter in the database. That counter is part of the permissions cache key, so all processes see the change.
+Device saves that only update e.g. the access count or timestamps do not change the permissions, and are ignored.
+"""
+
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from counters.constants import COUNTER_PERMISSION_CHANGES
+from counters.models import update_counter
+from switches.constants import PERMISSIONS_SWITCH_FIELDS
+from switches.models import VLAN, Switch, SwitchGroup, SwitchGroupMembership, VlanGroup
+from switches.utils import dprint
+
+
+def permissions_changed():
+    """Increment the permissions version, so all cached permissions are read again."""
+    dprint("permissions_changed()")
+    update_counter(name=COUNTER_PERMISSION_CHANGES, addition=1)
+
+
+def _get_permission_values(switch: Switch) -> tuple:
+    # read from __dict__, so deferred fields are not loaded:
+    return tuple(switch.__dict__.get(name) for name in PERMISSIONS_SWITCH_FIELDS)
+
+
+@receiver(post_init, sender=Switch)
+def remember_switch_permission_values(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    instance._permission_values = _get_permission_values(instance)
+
+
+@receiver(post_save, sender=Switch)
+def switch_saved(sender, instance, created, **kwargs):  # pylint: disable=unused-argument
+    values = _get_permission_values(instance)
+    if created or values != instance._permission_values:
+        permissions_changed()
+    instance._permission_values = values
+
+
+@receiver(post_save, sender=SwitchGroup)
+@receiver(post_save, sender=SwitchGroupMembership)
+@receiver(post_save, sender=VLAN)
+@receiver(post_save, sender=VlanGroup)
+@receiver(post_delete, sender=Switch)
+@receiver(post_delete, sender=SwitchGroup)
+@receiver(post_delete, sender=SwitchGroupMembership)
+@receiver(post_delete, sender=VLAN)
+@receiver(post_delete, sender=VlanGroup)
+def group_changed(sender, **kwargs):  # pylint: disable=unused-argument
+    permissions_changed()
+
+
+@receiver(m2m_changed, sender=SwitchGroup.users.through)
+@receiver(m2m_changed, sender=SwitchGroup.switches.through)
+@receiver(m2m_changed, sender=SwitchGroup.vlan_groups.through)
+@receiver(m2m_changed, sender=SwitchGroup.vlans.through)
+@receiver(m2m_changed, sender=VlanGroup.vlans.through)
+def group_members_changed(sender, action, **kwargs):  # pylint: disable=unused-argument
+    if action in ("post_add", "post_remove", "post_clear"):
+        permissions_changed()
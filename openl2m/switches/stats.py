@@ -24,7 +24,9 @@ import time
 import distro
 import django
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connection as db_connection, ProgrammingError
+from django.db.models import Count
 from django.utils import timezone
 import git
 
@@ -32,10 +34,7 @@ from counters.models import Counter
 
 from switches.constants import (
     LOG_TYPE_CHANGE,
-    LOG_TYPE_COMMAND,
-    LOG_TYPE_LOGIN_OUT,
     LOG_TYPE_VIEW,
-    LOG_LOGIN_REST_API,
 )
 
 from switches.models import (
@@ -50,6 +49,10 @@ from switches.models import (
     Log,
 )
 
+from switches.connect.connector import get_ssh_connection_pool
+from switches.connect.restconnector import get_rest_session_broker
+from switches.logwriter import get_log_buffer, get_syslog_forwarder
+from switches.rollups import UsageReader, UsageTotals, get_day_start, get_log_usage
 from users.models import Token
 
 
@@ -127,6 +130,20 @@ def get_environment_info() -> dict:
         "value": f"{settings.VERSION} ({settings.VERSION_DATE})",
     }
 
+    # the log writer of this process:
+    log_buffer = get_log_buffer()
+    if log_buffer:
+        environment["log_buffer"] = {
+            "label": "Log Writes",
+            "value": f"{log_buffer.written} written, {log_buffer.failed} failed (this process)",
+        }
+    if settings.SYSLOG_HOST:
+        forwarder = get_syslog_forwarder()
+        environment["syslog"] = {
+            "label": "Syslog",
+            "value": f"{forwarder.sent} sent, {forwarder.dropped} dropped (this process)",
+        }
+
     if os.environ.get("IN_CONTAINER"):
         environment["dockerized"] = {
             "label": "Dockerized",
@@ -162,6 +179,47 @@ def get_environment_info() -> dict:
     return environment
 
 
+def get_connection_pool_info() -> dict:
+    """Get the statistics of the SSH connection pool and REST session broker of this process,
+    in the same format as get_environment_info()."""
+    pools = {}
+    ssh_pool = get_ssh_connection_pool()
+    if ssh_pool:
+        with ssh_pool.condition:
+            idle = sum(len(connections) for connections in ssh_pool.idle.values())
+            in_use = sum(ssh_pool.in_use.values())
+        pools["ssh_connections"] = {
+            "label": "SSH Connections",
+            "value": f"{idle} idle, {in_use} in use",
+        }
+        pools["ssh_pool"] = {
+            "label": "SSH Connection Pool",
+            "value": (
+                f"{ssh_pool.hits} hits, {ssh_pool.misses} misses, {ssh_pool.stale} stale, "
+                f"{ssh_pool.expired} expired, {ssh_pool.busy} busy"
+            ),
+        }
+    else:
+        pools["ssh_pool"] = {
+            "label": "SSH Connection Pool",
+            "value": "Disabled",
+        }
+    broker = get_rest_session_broker()
+    if broker:
+        with broker.lock:
+            idle = sum(len(sessions) for sessions in broker.sessions.values())
+        pools["rest_sessions"] = {
+            "label": "REST Sessions",
+            "value": f"{idle} idle, {broker.logins_saved} logins saved, {broker.logouts} logouts",
+        }
+    else:
+        pools["rest_sessions"] = {
+            "label": "REST Sessions",
+            "value": "Disabled",
+        }
+    return pools
+
+
 def get_database_info() -> dict:
     """Get information about various database items, and return as a dict()."""
     db_items = {}
@@ -224,87 +282,54 @@ def get_database_info() -> dict:
 
 
 def get_usage_info() -> dict:
-    """Get OpenL2M application usage, and return as a dict()."""
+    """Get OpenL2M application usage, and return as a dict().
+    The counts come from the hourly and daily log rollups where available, see switches/rollups.py
+    """
     usage = {}  # usage statistics
 
-    one_hour_ago = timezone.now() - datetime.timedelta(hours=1)
+    now = timezone.now()
+    today = timezone.localdate(now)
+    reader = UsageReader(oldest=get_day_start(today - datetime.timedelta(days=31)), now=now)
+    last_hour = UsageTotals()
+    last_hour.add(get_log_usage(start=now - datetime.timedelta(hours=1), end=now))
+    usage_today = reader.get_usage(start=get_day_start(today))
+    last_7_days = reader.get_usage(start=get_day_start(today - datetime.timedelta(days=7)))
+    last_31_days = reader.get_usage(start=get_day_start(today - datetime.timedelta(days=31)))
 
     # Devices accessed:
-    filter_values = {
-        "type__in": [LOG_TYPE_VIEW, LOG_TYPE_CHANGE],
-        "switch_id__isnull": False,
-        "timestamp__gte": one_hour_ago,
-    }
     usage["devices_last_hour"] = {
         "label": "Devices in last hour",
-        "value": Log.objects.filter(**filter_values).values_list("switch_id", flat=True).distinct().count(),
-    }
-
-    filter_values = {
-        "type__in": [LOG_TYPE_VIEW, LOG_TYPE_CHANGE],
-        "switch_id__isnull": False,
-        # not sure how to fix the ruff warning yet...
-        "timestamp__date": datetime.date.today(),  # noqa: DTZ011 `datetime.date.today()` used
+        "value": len(last_hour.viewed_device_ids),
     }
     usage["devices_today"] = {
         "label": "Devices today",
-        "value": Log.objects.filter(**filter_values).values_list("switch_id", flat=True).distinct().count(),
-    }
-
-    filter_values = {
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=7),
-        "switch_id__isnull": False,
+        "value": len(usage_today.viewed_device_ids),
     }
     usage["devices_last_7_days"] = {
         "label": "Devices last 7 days",
-        "value": Log.objects.filter(**filter_values).values_list("switch_id", flat=True).distinct().count(),
-    }
-
-    filter_values = {
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=31),
-        "switch_id__isnull": False,
+        "value": len(last_7_days.device_ids),
     }
     usage["devices_last_31_days"] = {
         "label": "Devices Last 31 Days",
-        "value": Log.objects.filter(**filter_values).values_list("switch_id", flat=True).distinct().count(),
+        "value": len(last_31_days.device_ids),
     }
 
     # Changes made
-    filter_values = {
-        "type": int(LOG_TYPE_CHANGE),
-        "timestamp__gte": one_hour_ago,
-    }
     usage["changes_last_hour"] = {
         "label": "Changes in last hour",
-        "value": Log.objects.filter(**filter_values).count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_CHANGE),
-        # not sure how to fix the ruff warning yet...
-        "timestamp__date": datetime.date.today(),  # noqa: DTZ011 `datetime.date.today()` used
+        "value": last_hour.changes,
     }
     usage["changes_today"] = {
         "label": "Changes today",
-        "value": Log.objects.filter(**filter_values).count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_CHANGE),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=7),
+        "value": usage_today.changes,
     }
     usage["changes_last_7_days"] = {
         "label": "Changes last 7 days",
-        "value": Log.objects.filter(**filter_values).count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_CHANGE),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=31),
+        "value": last_7_days.changes,
     }
     usage["changes_last_31_days"] = {
         "label": "Changes last 31 days",
-        "value": Log.objects.filter(**filter_values).count(),
+        "value": last_31_days.changes,
     }
 
     # the total change count since install from Counter()'changes') object:
@@ -314,102 +339,49 @@ def get_usage_info() -> dict:
     }
 
     # Unique Logins
-    filter_values = {
-        "type": int(LOG_TYPE_LOGIN_OUT),
-        "timestamp__gte": one_hour_ago,
-    }
     usage["users_last_hour"] = {
         "label": "Users in last hour",
-        "value": Log.objects.filter(**filter_values).values_list("user_id", flat=True).distinct().count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_LOGIN_OUT),
-        # not sure how to fix the ruff warning yet...
-        "timestamp__date": datetime.date.today(),  # noqa: DTZ011 `datetime.date.today()` used
+        "value": len(last_hour.user_ids),
     }
     usage["users_today"] = {
         "label": "Users today",
-        "value": Log.objects.filter(**filter_values).values_list("user_id", flat=True).distinct().count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_LOGIN_OUT),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=7),
+        "value": len(usage_today.user_ids),
     }
     usage["users_last_7_days"] = {
         "label": "Users last 7 days",
-        "value": Log.objects.filter(**filter_values).values_list("user_id", flat=True).distinct().count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_LOGIN_OUT),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=31),
+        "value": len(last_7_days.user_ids),
     }
     usage["users_last_31_days"] = {
         "label": "Users last 31 days",
-        "value": Log.objects.filter(**filter_values).values_list("user_id", flat=True).distinct().count(),
+        "value": len(last_31_days.user_ids),
     }
 
     # API requests:
-    filter_values = {
-        "type": int(LOG_TYPE_LOGIN_OUT),
-        "action": int(LOG_LOGIN_REST_API),
-        # not sure how to fix the ruff warning yet...
-        "timestamp__date": datetime.date.today(),  # noqa: DTZ011 `datetime.date.today()` used
-    }
     usage["api_calls_today"] = {
         "label": "API calls today",
-        "value": Log.objects.filter(**filter_values).count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_LOGIN_OUT),
-        "action": int(LOG_LOGIN_REST_API),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=7),
+        "value": usage_today.api_calls,
     }
     usage["api_calls_last_7_days"] = {
         "label": "API calls last 7 days",
-        "value": Log.objects.filter(**filter_values).count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_LOGIN_OUT),
-        "action": int(LOG_LOGIN_REST_API),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=31),
+        "value": last_7_days.api_calls,
     }
     usage["api_calls_last_31_days"] = {
         "label": "API calls last 31 days",
-        "value": Log.objects.filter(**filter_values).count(),
+        "value": last_31_days.api_calls,
     }
 
     # Commands run:
-    # not sure how to fix the ruff warning yet...
-    filter_values = {
-        "type": int(LOG_TYPE_COMMAND),
-        "timestamp__date": datetime.date.today(),   # noqa: DTZ011 `datetime.date.today()` used
-    }
     usage["commands_today"] = {
         "label": "Commands today",
-        "value": Log.objects.filter(**filter_values).count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_COMMAND),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=7),
+        "value": usage_today.commands,
     }
     usage["commands_last_7_days"] = {
         "label": "Commands last 7 days",
-        "value": Log.objects.filter(**filter_values).count(),
-    }
-
-    filter_values = {
-        "type": int(LOG_TYPE_COMMAND),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=31),
+        "value": last_7_days.commands,
     }
     usage["commands_last_31_days"] = {
         "label": "Commands last 31 days",
-        "value": Log.objects.filter(**filter_values).count(),
+        "value": last_31_days.commands,
     }
 
     # total number of commands run:
@@ -421,92 +393,64 @@ def get_usage_info() -> dict:
     return usage
 
 
-def get_top_n_from_dict_on_count(data: dict) -> dict:
-    """Return the TOP_N from the dcitionary with value, based on the 'count' attribute.
+def get_top_log_counts(group_by: str, name_field: str, log_types: list) -> dict:
+    """Return the TOP_ACTIVITY objects with the most log entries of the given types, over the last TOP_ACTIVITY_DAYS.
+    The counting, sorting and limiting is done by the database, in a single GROUP BY query,
+    that also joins the object name. Results are cached for TOP_ACTIVITY_CACHE_TIMEOUT seconds.
 
     Args:
-    data (dict): a dictionary of dictionaries containing at least the 'count' attrbute.
+        group_by (str): the Log() foreign key field to count by, e.g. "switch_id" or "user_id".
+        name_field (str): the related name field to return, e.g. "switch__name" or "user__username".
+        log_types (list): the log types to count.
 
     Returns:
-        (dict): the TOP-N (ie sorted) entries of the data (input) argument.
-
+        (dict): key is the object id, value is a dict with "name" and "count", in descending count order.
     """
-    # sort by descending order:
-    data_sorted = dict(sorted(data.items(), key=lambda x: x[1]["count"], reverse=True))
-    # # and limit to TOP-N:
-    top_data = {}
-    num = 0
-    for key, val in data_sorted.items():
-        top_data[key] = val
-        num += 1  # noqa: SIM113 Use `enumerate()` for index variable `num` in `for` loop
-        if num == settings.TOP_ACTIVITY:
-            break
-    return top_data
+    cache_key = f"openl2m-top-{group_by}-{'-'.join(str(t) for t in log_types)}"
+    if settings.TOP_ACTIVITY_CACHE_TIMEOUT:
+        top = cache.get(cache_key)
+        if top is not None:
+            return top
+    rows = (
+        Log.objects.filter(
+            type__in=log_types,
+            timestamp__gte=timezone.now().date() - datetime.timedelta(days=settings.TOP_ACTIVITY_DAYS),
+            **{f"{group_by}__isnull": False},
+        )
+        .values(group_by, name_field)
+        .annotate(count=Count("id"))
+        .order_by("-count", name_field)[: settings.TOP_ACTIVITY]
+    )
+    top = {row[group_by]: {"name": row[name_field], "count": row["count"]} for row in rows}
+    if settings.TOP_ACTIVITY_CACHE_TIMEOUT:
+        cache.set(cache_key, top, timeout=settings.TOP_ACTIVITY_CACHE_TIMEOUT)
+    return top
 
 
 def get_top_changed_devices() -> dict:
     """Return a dict with the most active (changed) devices over the last TOP_ACTIVITY_DAYS"""
-    devices = {}
-    filter_values = {
-        "type": int(LOG_TYPE_CHANGE),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=settings.TOP_ACTIVITY_DAYS),
-    }
-    # records = Log.objects.filter(**filter_values).values_list('switch_id', flat=True)
-    logs = Log.objects.filter(**filter_values)
-    # there is probably a better way to do this with a filter above, but this works also:
-    for log in logs:
-        if log.switch is not None:
-            if log.switch.id not in devices:
-                devices[log.switch.id] = {
-                    "name": log.switch.name,
-                    "count": 1,
-                }
-            else:
-                devices[log.switch.id]["count"] += 1
-
-    return get_top_n_from_dict_on_count(devices)
+    return get_top_log_counts(group_by="switch_id", name_field="switch__name", log_types=[LOG_TYPE_CHANGE])
 
 
 def get_top_viewed_devices() -> dict:
     """Return a dict with the most viewed devices over the last TOP_ACTIVITY_DAYS"""
-    devices = {}
-    filter_values = {
-        "type": int(LOG_TYPE_VIEW),
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=settings.TOP_ACTIVITY_DAYS),
-    }
-    # records = Log.objects.filter(**filter_values).values_list('switch_id', flat=True)
-    logs = Log.objects.filter(**filter_values)
-    # there is probably a better way to do this with a filter above, but this works also:
-    for log in logs:
-        if log.switch is not None:
-            if log.switch.id not in devices:
-                devices[log.switch.id] = {
-                    "name": log.switch.name,
-                    "count": 1,
-                }
-            else:
-                devices[log.switch.id]["count"] += 1
-
-    return get_top_n_from_dict_on_count(devices)
+    return get_top_log_counts(group_by="switch_id", name_field="switch__name", log_types=[LOG_TYPE_VIEW])
 
 
 def get_top_active_users() -> dict:
     """Return a dict with the most active users, based on views or changes, over the last TOP_ACTIVITY_DAYS"""
-    users = {}
-    filter_values = {
-        "type__in": [LOG_TYPE_VIEW, LOG_TYPE_CHANGE],
-        "timestamp__gte": timezone.now().date() - datetime.timedelta(days=settings.TOP_ACTIVITY_DAYS),
-    }
-    logs = Log.objects.filter(**filter_values)
-    # there is probably a better way to do this with a filter above, but this works also:
-    for log in logs:
-        if log.user is not None:
-            if log.user.id not in users:
-                users[log.user.id] = {
-                    "name": log.user.username,
-                    "count": 1,
-                }
-            else:
-                users[log.user.id]["count"] += 1
-
-    return get_top_n_from_dict_on_count(users)
+    return get_top_log_counts(
+        group_by="user_id", name_field="user__username", log_types=[LOG_TYPE_VIEW, LOG_TYPE_CHANGE]
+    )
+
+
+def get_top_activity() -> dict:
+    """Return the most changed and viewed devices, and most active users, over the last TOP_ACTIVITY_DAYS.
+    Returns an empty dict if the Top Activity view is disabled (TOP_ACTIVITY = 0)"""
+    if not settings.TOP_ACTIVITY:
+        return {}
+    return {
+        "changed_devices": get_top_changed_devices(),
+        "viewed_devices": get_top_viewed_devices(),
+        "active_users": get_top_active_users(),
+    }
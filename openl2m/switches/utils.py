@@ -15,13 +15,19 @@
 Various utility functions
 """
 
+import atexit
+from collections.abc import Callable
+import concurrent.futures
 import datetime
 import inspect
 import ipaddress
 import logging
+import os
 import pprint
 import re
 import socket
+import threading
+import time
 
 from django.conf import settings
 from django.http import HttpResponse
@@ -37,6 +43,16 @@ import pytz
 
 logger_console = logging.getLogger("openl2m.console")
 
+# process-wide reverse DNS cache, key is the ip address, value is (hostname, expiry time).
+# Failed lookups are cached as "" (negative caching), see get_ip_dns_names()
+_dns_cache: dict[str, tuple[str, float]] = {}
+_dns_cache_lock = threading.Lock()
+
+# the objects shared by all threads of a process, see get_process_object().
+# Key is the name, value is (pid of the process that created it, object):
+_process_objects: dict[str, tuple[int, object]] = {}
+_process_objects_lock = threading.Lock()
+
 
 def success_page(request: HttpRequest, group, switch, description: str) -> HttpResponse:
     """
@@ -398,6 +414,9 @@ def get_ip_dns_name(ip: str) -> str:
     Return:
         (str): either the FQDN for the ip address, or an empty string if not found.
     """
+    hostname = _dns_cache_get(str(ip))
+    if hostname is not None:
+        return hostname
     default_timeout = socket.getdefaulttimeout()
     socket.setdefaulttimeout(settings.DNS_TIMEOUT)  # max wait for DNS answer
     try:
@@ -409,9 +428,95 @@ def get_ip_dns_name(ip: str) -> str:
         hostname = ""
 
     socket.setdefaulttimeout(default_timeout)
+    _dns_cache_set(str(ip), hostname)
+    return hostname
+
+
+def _dns_cache_get(ip: str) -> str | None:
+    """Get a hostname from the reverse DNS cache. Returns None if not cached or expired, "" if cached as not found."""
+    entry = _dns_cache.get(ip)
+    if entry is None or entry[1] < time.time():
+        return None
+    return entry[0]
+
+
+def _dns_cache_set(ip: str, hostname: str):
+    """Store a reverse lookup result in the DNS cache, with the positive or negative time-to-live."""
+    ttl = settings.DNS_CACHE_TTL if hostname else settings.DNS_NEGATIVE_CACHE_TTL
+    if ttl <= 0:
+        return
+    now = time.time()
+    with _dns_cache_lock:
+        if len(_dns_cache) >= settings.DNS_CACHE_MAX_ENTRIES:
+            # first remove expired entries, then the oldest ones:
+            for key in [key for key, entry in _dns_cache.items() if entry[1] < now]:
+                del _dns_cache[key]
+            while len(_dns_cache) >= settings.DNS_CACHE_MAX_ENTRIES:
+                del _dns_cache[next(iter(_dns_cache))]
+        _dns_cache[ip] = (hostname, now + ttl)
+
+
+def _reverse_lookup(ip: str) -> str:
+    """Reverse lookup of a single ip address, used by get_ip_dns_names() in a worker thread."""
+    try:
+        # we use 'name required' to force an exception if reverse lookup not found:
+        hostname, _ = socket.getnameinfo((ip, 0), socket.NI_NAMEREQD)
+    except Exception:
+        hostname = ""
+    _dns_cache_set(ip, hostname)
     return hostname
 
 
+def get_ip_dns_names(ips, timeout: float | None = None) -> dict[str, str]:
+    """Get the DNS PTR (reverse name) for many IP4 or IP6 addresses at once.
+    Cached names are returned right away, the others are resolved concurrently in a pool of
+    settings.DNS_MAX_WORKERS threads, shared by all calls in this process.
+    If the overall deadline passes, the names found so far are returned, and the lookups that did not start
+    are cancelled. Lookups that are still running will store their result in the cache when they finish,
+    so a later call can use them.
+
+    Args:
+        ips(iterable): strings representing the IP addresses, duplicates are resolved once.
+        timeout(float): maximum number of seconds to wait for all lookups, default is settings.DNS_BATCH_TIMEOUT
+
+    Return:
+        (dict): key is the ip address, value is the FQDN, or an empty string if not found.
+                Addresses that were not resolved before the deadline are not in the dictionary.
+    """
+    if timeout is None:
+        timeout = settings.DNS_BATCH_TIMEOUT
+    names = {}
+    lookups = []
+    for ip in dict.fromkeys(str(ip) for ip in ips):
+        hostname = _dns_cache_get(ip)
+        if hostname is None:
+            lookups.append(ip)
+        else:
+            names[ip] = hostname
+    dprint(f"get_ip_dns_names(): {len(names)} cached, {len(lookups)} to resolve")
+    if not lookups:
+        return names
+
+    executor = get_process_object("dns-executor", _new_dns_executor)
+    futures = {executor.submit(_reverse_lookup, ip): ip for ip in lookups}
+    done, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    for future in done:
+        names[futures[future]] = future.result()
+    if not_done:
+        dprint(f"get_ip_dns_names(): deadline reached, {len(not_done)} not resolved")
+        # do not wait for running lookups, and drop the ones not started yet:
+        for future in not_done:
+            future.cancel()
+    return names
+
+
+def _new_dns_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Create the pool of threads for the reverse lookups of get_ip_dns_names()."""
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, settings.DNS_MAX_WORKERS), thread_name_prefix="openl2m-dns"
+    )
+
+
 def get_choice_name(choice_list: list, choice) -> str:
     """Get the name of a choice
 
@@ -440,3 +545,61 @@ def string_is_int(text: str) -> bool:
     except Exception:
         return False
     return True
+
+
+class BackgroundWorker:
+    """
+    Base class of the process-wide objects that do their work in a background thread,
+    e.g. writing buffered data, or closing idle connections.
+    Create them with get_process_object(), which starts the thread once in each process.
+    """
+
+    thread_name = "openl2m-worker"
+
+    def start(self):
+        """Start the background thread."""
+        threading.Thread(target=self._run, name=self.thread_name, daemon=True).start()
+
+    def close(self):
+        """Called when the process exits, e.g. to write pending data, or close connections."""
+
+    def _run(self):
+        """The work of the background thread, implemented by the subclass."""
+        raise NotImplementedError
+
+
+def get_process_object(name: str, factory: Callable | None = None):
+    """
+    Get an object that is shared by all threads of this process, e.g. a connection pool or a write buffer.
+    The object is created by factory() on first use in each process. Threads do not survive a fork(),
+    and a forked process should not use the connections or pending data of its parent, so a forked process
+    creates its own object. A BackgroundWorker() is started when it is created, and closed when the process exits.
+
+    Args:
+        name (str): the unique name of the object.
+        factory (callable): called without arguments to create the object. If None, the object is not created.
+
+    Return:
+        the object, or None if there is no factory and this process did not create it yet.
+    """
+    pid = os.getpid()
+    entry = _process_objects.get(name)
+    if entry is None or entry[0] != pid:
+        if factory is None:
+            return None
+        with _process_objects_lock:
+            entry = _process_objects.get(name)
+            if entry is None or entry[0] != pid:
+                obj = factory()
+                if isinstance(obj, BackgroundWorker):
+                    obj.start()
+                    atexit.register(_close_process_object, pid, obj)
+                entry = (pid, obj)
+                _process_objects[name] = entry
+    return entry[1]
+
+
+def _close_process_object(pid: int, obj: BackgroundWorker):
+    """Close a BackgroundWorker() when the process exits, only in the process that created it."""
+    if pid == os.getpid():
+        obj.close()
@@ -14,6 +14,7 @@
 import time
 import traceback
 import re
+from urllib.parse import urlencode
 
 from django.conf import settings
 from django.shortcuts import get_object_or_404, render
@@ -78,7 +79,7 @@ from switches.constants import (
     INTERFACE_STATUS_DOWN,
     INTERFACE_STATUS_UP,
 )
-from switches.connect.connector import clear_switch_cache
+from switches.connect.connector import clear_switch_cache, clear_switch_snapshot
 from switches.connect.connect import get_connection_object
 from switches.connect.constants import (
     POE_PORT_ADMIN_ENABLED,
@@ -89,8 +90,10 @@ from switches.mixins import SwitchActionMixin, SwitchPermissionMixin
 from switches.device_actions import DeviceActions
 from switches.myview import MyView
 from switches.permissions import get_group_and_switch, get_connection_if_permitted, get_my_device_groups
+from switches.search import get_search_index
 
 from switches.stats import (
+    get_connection_pool_info,
     get_environment_info,
     get_database_info,
     get_usage_info,
@@ -235,7 +238,8 @@ class Switches(LoginRequiredMixin, MyView):
 
 class SwitchSearch(LoginRequiredMixin, MyView):
     """
-    search for a switch by name
+    search for a switch by name, hostname, description, nms id or ip address.
+    The search form is posted, and redirected to the (paginated) results.
     """
 
     def post(
@@ -259,6 +263,25 @@ class SwitchSearch(LoginRequiredMixin, MyView):
         search = search.strip()
         if not search:
             return redirect(reverse("switches:groups"))
+        query = {"switchname": search}
+        if request.POST.get("regex"):
+            query["regex"] = "on"
+        return redirect(f"{reverse('switches:switch_search')}?{urlencode(query)}")
+
+    def get(
+        self,
+        request,
+    ):
+        dprint("SwitchSearch() - GET called")
+
+        if not settings.SWITCH_SEARCH_FORM:
+            # we should not be here!
+            return redirect(reverse("switches:groups"))
+
+        search = str(request.GET.get("switchname", "")).strip()
+        if not search:
+            return redirect(reverse("switches:groups"))
+        regex = bool(request.GET.get("regex"))
 
         template_name = "search_results.html"
 
@@ -275,29 +298,40 @@ class SwitchSearch(LoginRequiredMixin, MyView):
         results = []
         result_groups = {}
         warning = False
-        permissions = get_from_http_session(request, "permissions")
-
-        if permissions and isinstance(permissions, dict):
-            for group_id, group in permissions.items():
-                if isinstance(group, dict):
-                    group_name = group["name"]
-                    for switch_id, switch in group["members"].items():
-                        name = switch["name"]
-                        hostname = switch["hostname"]
-                        description = switch["description"]
-                        default_view = switch["default_view"]
-                        # now check the name, hostname for the search pattern:
-                        try:
-                            if re.search(search, name, re.IGNORECASE) or re.search(search, hostname, re.IGNORECASE):
-                                # regular user, add all occurances of device (likely just one!)
-                                results.append(
-                                    (str(group_id), str(switch_id), name, description, default_view, group_name)
-                                )
-                                result_groups[group_name] = True
-                        except Exception:
-                            # invalid search, just ignore!
-                            warning = f"{search} - This is an invalid search pattern!"
-                            break
+        index = get_search_index(request=request)
+        # the search sees the current permissions, so make sure we can open the devices found:
+        if get_from_http_session(request, "permissions") != index.permissions:
+            save_to_http_session(request, "permissions", index.permissions)
+
+        try:
+            entries = index.search(search=search, regex=regex)
+        except re.error:
+            # invalid search, just ignore!
+            warning = f"{search} - This is an invalid search pattern!"
+            entries = []
+        for entry in entries:
+            for position, group_id, group_name in entry.groups:
+                switch = entry.switch
+                results.append(
+                    (
+                        position,
+                        (
+                            group_id,
+                            entry.switch_id,
+                            switch["name"],
+                            switch["description"],
+                            switch["default_view"],
+                            group_name,
+                        ),
+                    )
+                )
+                result_groups[group_name] = True
+        # in the order of the groups, and devices in the group:
+        results = [result for _, result in sorted(results, key=lambda result: result[0])]
+
+        # setup pagination of the results
+        paginator = Paginator(results, settings.PAGINATE_COUNT)
+        results_page = paginator.get_page(request.GET.get("page", 1))
 
         # render the template
         return render(
@@ -306,7 +340,9 @@ class SwitchSearch(LoginRequiredMixin, MyView):
             {
                 "warning": warning,
                 "search": search,
-                "results": results,
+                "regex": regex,
+                "results": results_page,
+                "paginator": paginator,
                 "results_count": len(results),
                 "group_count": len(result_groups),
             },
@@ -377,6 +413,7 @@ def switch_view(
     command_string="",
     command_template=False,
     save_needed=False,
+    refresh=False,
 ):
     """
     This shows the various data about a switch, either from a new SNMP read,
@@ -384,6 +421,7 @@ def switch_view(
     This is includes enough to enable/disable interfaces and power,
     and change vlans. Depending on view, there may be more data needed,
     such as ethernet, arp & lldp tables.
+    If refresh is True, the cached data is refreshed with what changed on the device, if the driver supports it.
     """
 
     template_name = "switch.html"
@@ -412,6 +450,11 @@ def switch_view(
 
     try:
         conn = get_connection_object(request, group, switch)
+        if refresh and not conn.refresh_basic_info():
+            # no cached data, or the driver cannot refresh it, so read all data again:
+            clear_switch_cache(request)
+            clear_switch_snapshot(switch_id=switch.id)
+            conn = get_connection_object(request, group, switch)
     except Exception:
         log.type = LOG_TYPE_ERROR
         log.action = LOG_CONNECTION_ERROR
@@ -1810,11 +1853,21 @@ class SwitchReload(LoginRequiredMixin, SwitchPermissionMixin, MyView):
         )
         log.save()
 
-        clear_switch_cache(request)
+        if not settings.RELOAD_INCREMENTAL:
+            clear_switch_cache(request)
+            # and make sure we read the device, instead of using the shared data:
+            clear_switch_snapshot(switch_id=switch.id)
         counter_increment(COUNTER_VIEWS)
 
         save_needed = bool(request.POST.get("save_needed", default=""))
-        return switch_view(request=request, group_id=group_id, switch_id=switch_id, view=view, save_needed=save_needed)
+        return switch_view(
+            request=request,
+            group_id=group_id,
+            switch_id=switch_id,
+            view=view,
+            save_needed=save_needed,
+            refresh=settings.RELOAD_INCREMENTAL,
+        )
 
 
 class SwitchActivity(LoginRequiredMixin, SwitchPermissionMixin, MyView):
@@ -2133,6 +2186,7 @@ class SwitchAdminSettings(LoginRequiredMixin, MyView):
             template_name,
             {
                 "all_settings": all_settings,
+                "connection_pools": get_connection_pool_info(),
             },
         )
 